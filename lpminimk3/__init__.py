@@ -62,6 +62,28 @@ Another way to turn off LED:
 Another way to turn off LED:
     >>> del lp.panel.led('mute').color
 
+Set colors of many LEDs with a single write:
+    >>> with lp.batch():
+    ...     for led in lp.grid.led_range():
+    ...         led.color = 'red'
+
+Another way to set colors of many LEDs with a single write:
+    >>> lp.grid.led_range().color = 'red'
+
+Render the same frame on many Launchpads at once:
+    >>> group = LaunchpadGroup(find_launchpads())
+    >>> group.grid.render(frame)
+
+Drive a Launchpad from asyncio code:
+    >>> alp = AsyncLaunchpadMiniMk3(lp)
+    >>> await alp.open()
+    >>> await alp.buttons().next_event()
+    ButtonEvent(button='4x1', type='press', deltatime=4.202155996)
+
+Draw frames held in NumPy arrays (requires NumPy):
+    >>> lp.grid.framebuffer.pixels[:] = frame
+    >>> lp.grid.framebuffer.flush()
+
 Wait for and respond to button presses and releases:
     >>> lp.panel.buttons().poll_for_event()
     ButtonEvent(button='4x1', type='press', deltatime=4.202155996)
@@ -73,12 +95,25 @@ Wait for button releases:
 Wait for "Up", "0x0" or "Stop/Solo/Mute" button to be pressed or released:
     >>> lp.panel.buttons('up', '0x0', 'stop').poll_for_event()
     ButtonEvent(button='4x1', type='release', deltatime=0.040492674)
+
+Light up buttons while they are held down, from the input thread:
+    >>> lp.bindings.bind(lp.grid.buttons(), 'red')
+    >>> lp.bindings.start()
+
+Recognize long presses, double taps, chords and swipes:
+    >>> for gesture in lp.grid.buttons().gestures():
+    ...     print(gesture)
+    LongPress(['4x1'])
 """
 
 from .__version__ import __version__, VERSION  # noqa
-from .components import Grid, Panel, Led, ButtonFace  # noqa
+from .components import Grid, Panel, Led, LedRange, ButtonFace  # noqa
 from .utils import Interface, Mode, Layout, ButtonEvent  # noqa
 from .device import LaunchpadMiniMk3, find_launchpads  # noqa
+from .group import LaunchpadGroup  # noqa
+from .aio import AsyncLaunchpadMiniMk3  # noqa
+from .bindings import Bindings  # noqa
+from .gestures import Gesture, GestureRecognizer  # noqa
 
 if __name__ == "__main__":
     import doctest
@@ -0,0 +1,158 @@
+"""Lookup tables of the matrices of the Launchpad Mini MK3, shared by
+the components and regions of the matrices.
+"""
+
+_STOP_SOLO_MUTE = 'stop_solo_mute'
+
+PANEL_PROG_MODE_MIDI_LAYOUT = [
+    [0x5b, 0x5c, 0x5d, 0x5e, 0x5f, 0x60, 0x61, 0x62, 0x63],
+    [0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59],
+    [0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e, 0x4f],
+    [0x3d, 0x3e, 0x3f, 0x40, 0x41, 0x42, 0x43, 0x44, 0x45],
+    [0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a, 0x3b],
+    [0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f, 0x30, 0x31],
+    [0x1f, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27],
+    [0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c, 0x1d],
+    [0x0b, 0x0c, 0x0d, 0x0e, 0x0f, 0x10, 0x11, 0x12, 0x13]
+]
+PANEL_CUSTOM_MODE_MIDI_LAYOUT = [
+    [0x5b, 0x5c, 0x5d, 0x5e, 0x5f, 0x60, 0x61, 0x62, 0x63],
+    [0x40, 0x41, 0x42, 0x43, 0x60, 0x61, 0x62, 0x63, 0x59],
+    [0x3c, 0x3d, 0x3e, 0x3f, 0x5c, 0x5d, 0x5e, 0x5f, 0x4f],
+    [0x38, 0x39, 0x3a, 0x3b, 0x58, 0x59, 0x5a, 0x5b, 0x45],
+    [0x34, 0x35, 0x36, 0x37, 0x54, 0x55, 0x56, 0x57, 0x3b],
+    [0x30, 0x31, 0x32, 0x33, 0x50, 0x51, 0x52, 0x53, 0x31],
+    [0x2c, 0x2d, 0x2e, 0x2f, 0x4c, 0x4d, 0x4e, 0x4f, 0x27],
+    [0x28, 0x29, 0x2a, 0x2b, 0x48, 0x49, 0x4a, 0x4b, 0x1d],
+    [0x24, 0x25, 0x26, 0x27, 0x44, 0x45, 0x46, 0x47, 0x13]
+]
+
+PANEL_BUTTON_NAMES = [
+    ['up', 'down', 'left', 'right', 'session', 'drums', 'keys', 'user', 'logo'],  # noqa
+    ['0x0', '1x0', '2x0', '3x0', '4x0', '5x0', '6x0', '7x0', 'scene_launch_1'],  # noqa
+    ['0x1', '1x1', '2x1', '3x1', '4x1', '5x1', '6x1', '7x1', 'scene_launch_2'],  # noqa
+    ['0x2', '1x2', '2x2', '3x2', '4x2', '5x2', '6x2', '7x2', 'scene_launch_3'],  # noqa
+    ['0x3', '1x3', '2x3', '3x3', '4x3', '5x3', '6x3', '7x3', 'scene_launch_4'],  # noqa
+    ['0x4', '1x4', '2x4', '3x4', '4x4', '5x4', '6x4', '7x4', 'scene_launch_5'],  # noqa
+    ['0x5', '1x5', '2x5', '3x5', '4x5', '5x5', '6x5', '7x5', 'scene_launch_6'],  # noqa
+    ['0x6', '1x6', '2x6', '3x6', '4x6', '5x6', '6x6', '7x6', 'scene_launch_7'],  # noqa
+    ['0x7', '1x7', '2x7', '3x7', '4x7', '5x7', '6x7', '7x7', 'stop_solo_mute']   # noqa
+]
+
+GRID_PROG_MODE_MIDI_LAYOUT = [
+    [0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58],
+    [0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e],
+    [0x3d, 0x3e, 0x3f, 0x40, 0x41, 0x42, 0x43, 0x44],
+    [0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a],
+    [0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f, 0x30],
+    [0x1f, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26],
+    [0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c],
+    [0x0b, 0x0c, 0x0d, 0x0e, 0x0f, 0x10, 0x11, 0x12]
+]
+GRID_CUSTOM_MODE_MIDI_LAYOUT = [
+    [0x40, 0x41, 0x42, 0x43, 0x60, 0x61, 0x62, 0x63],
+    [0x3c, 0x3d, 0x3e, 0x3f, 0x5c, 0x5d, 0x5e, 0x5f],
+    [0x38, 0x39, 0x3a, 0x3b, 0x58, 0x59, 0x5a, 0x5b],
+    [0x34, 0x35, 0x36, 0x37, 0x54, 0x55, 0x56, 0x57],
+    [0x30, 0x31, 0x32, 0x33, 0x50, 0x51, 0x52, 0x53],
+    [0x2c, 0x2d, 0x2e, 0x2f, 0x4c, 0x4d, 0x4e, 0x4f],
+    [0x28, 0x29, 0x2a, 0x2b, 0x48, 0x49, 0x4a, 0x4b],
+    [0x24, 0x25, 0x26, 0x27, 0x44, 0x45, 0x46, 0x47]
+]
+GRID_BUTTON_NAMES = [
+    ['0x0', '1x0', '2x0', '3x0', '4x0', '5x0', '6x0', '7x0'],
+    ['0x1', '1x1', '2x1', '3x1', '4x1', '5x1', '6x1', '7x1'],
+    ['0x2', '1x2', '2x2', '3x2', '4x2', '5x2', '6x2', '7x2'],
+    ['0x3', '1x3', '2x3', '3x3', '4x3', '5x3', '6x3', '7x3'],
+    ['0x4', '1x4', '2x4', '3x4', '4x4', '5x4', '6x4', '7x4'],
+    ['0x5', '1x5', '2x5', '3x5', '4x5', '5x5', '6x5', '7x5'],
+    ['0x6', '1x6', '2x6', '3x6', '4x6', '5x6', '6x6', '7x6'],
+    ['0x7', '1x7', '2x7', '3x7', '4x7', '5x7', '6x7', '7x7']
+]
+
+
+class _MatrixTable:
+    """Lookup tables of a matrix in one layout, built once and shared
+    by every LED and button of that matrix.
+    """
+
+    _tables = {}
+    # Small integer for every button name, shared by all tables so that
+    # a name keeps its number whatever the matrix or layout.
+    _name_ids = {}
+
+    def __init__(self, button_names, layout):
+        self._button_names = button_names
+        self._layout = layout
+        self.width = len(button_names[0])
+        self.height = len(button_names)
+        self.coordinates_by_name = {}
+        self.coordinates_by_id = []
+        self.midi_values = {}
+        self.names = {}
+        self.names_by_midi_value = {}
+        for y, button_row in enumerate(button_names):
+            for x, button_name in enumerate(button_row):
+                self.coordinates_by_name.setdefault(button_name, (x, y))
+                self.midi_values[(x, y)] = layout[y][x]
+                self.names[(x, y)] = button_name
+                _MatrixTable._name_ids.setdefault(button_name,
+                                                  len(_MatrixTable._name_ids))
+                self.names_by_midi_value.setdefault(layout[y][x],
+                                                    button_name)
+        for alias in _STOP_SOLO_MUTE.split('_'):
+            for button_name, coordinate in list(self.coordinates_by_name.items()):  # noqa
+                if alias in button_name:
+                    self.coordinates_by_name.setdefault(alias, coordinate)
+                    break
+        self.coordinates_by_id = [self._coordinate_from_id(led_id)
+                                  for led_id in range(self.width
+                                                      * self.height)]
+
+    @staticmethod
+    def get(button_names, layout):
+        """Returns the table of `button_names` in layout `layout`.
+        """
+        key = (id(button_names), id(layout))
+        table = _MatrixTable._tables.get(key)
+        if (table is None
+                or table._button_names is not button_names
+                or table._layout is not layout):
+            table = _MatrixTable(button_names, layout)
+            _MatrixTable._tables[key] = table
+        return table
+
+    def coordinate_from_name(self, name):
+        coordinate = self.coordinates_by_name.get(name.lower())
+        if coordinate is None:
+            raise ValueError('Invalid name set.')
+        return coordinate
+
+    def coordinate_from_id(self, led_id):
+        if 0 <= led_id < len(self.coordinates_by_id):
+            return self.coordinates_by_id[led_id]
+        return self._coordinate_from_id(led_id)
+
+    def lookup(self, x, y):
+        name = self.names.get((x, y))
+        if name is None:
+            raise ValueError('Led(x,y) out of range: '
+                             f'value({x},{y}), '
+                             f'range((0,{self.width}),(0,{self.height}))')
+        return name, self.midi_values[(x, y)]
+
+    def _coordinate_from_id(self, led_id):
+        x = int(led_id % self.width)
+        y = int(led_id / self.height)
+        return x, y
+
+
+for _button_names, _layouts in ((PANEL_BUTTON_NAMES,
+                                 (PANEL_PROG_MODE_MIDI_LAYOUT,
+                                  PANEL_CUSTOM_MODE_MIDI_LAYOUT)),
+                                (GRID_BUTTON_NAMES,
+                                 (GRID_PROG_MODE_MIDI_LAYOUT,
+                                  GRID_CUSTOM_MODE_MIDI_LAYOUT))):
+    for _layout in _layouts:
+        _MatrixTable.get(_button_names, _layout)
+del _button_names, _layouts, _layout
@@ -0,0 +1,358 @@
+"""Asyncio interface for the Launchpad Mini MK3.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from .components import Panel
+from .match import (ButtonMatch,
+                    Match)
+from .utils import (ButtonEvent,
+                    Interface)
+
+
+class AsyncLaunchpadMiniMk3:
+    """An asyncio interface to a :class:`LaunchpadMiniMk3`.
+
+    Incoming MIDI events are delivered by the MIDI input thread
+    straight to the event loop, so waiting for an event never blocks
+    the loop. Outgoing messages are written in order by a thread
+    dedicated to the device.
+
+    Examples
+    --------
+    Turn an LED red whenever a button is pressed:
+        >>> lp = AsyncLaunchpadMiniMk3(find_launchpads()[0])
+        >>> await lp.open()
+        >>> async for event in lp.buttons().events(type='press'):
+        ...     await lp.send(Lighting.static(event.button.midi_value, 5))
+    """
+
+    DEFAULT_QUEUE_SIZE = 256
+
+    def __init__(self, launchpad, *, queue_size=DEFAULT_QUEUE_SIZE):
+        """Creates an asyncio interface to Launchpad `launchpad`.
+
+        Parameters
+        ----------
+        launchpad : LaunchpadMiniMk3
+            Launchpad to control.
+        queue_size : int, optional
+            Maximum number of matching events kept for each waiting
+            consumer. The oldest events are dropped first.
+        """
+        self._launchpad = launchpad
+        self._queue_size = queue_size
+        self._loop = None
+        self._executor = None
+        self._subscribers = {Interface.MIDI: [],
+                             Interface.DAW: []}
+        self._listeners = {}
+
+    def __repr__(self):
+        return f'AsyncLaunchpadMiniMk3(id={self._launchpad.id})'
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args, **kwargs):
+        await self.close()
+
+    @property
+    def launchpad(self):
+        """Launchpad reference.
+        """
+        return self._launchpad
+
+    def is_open(self):
+        """Returns `True` if the device is open, otherwise
+        returns `False`.
+
+        Returns
+        -------
+        bool
+            `True` if device is open, otherwise `False`.
+        """
+        return self._launchpad.is_open()
+
+    async def open(self, interface=Interface.MIDI):
+        """Opens interface `interface` of the Launchpad and starts
+        delivering its events to the running event loop.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface to open.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        """
+        self._loop = asyncio.get_running_loop()
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix='lpminimk3-aio')  # noqa
+        await self._run(self._launchpad.open, interface)
+        for name, port in ((Interface.MIDI, self._launchpad.midi_in_port),
+                           (Interface.DAW, self._launchpad.daw_in_port)):
+            if name not in self._listeners:
+                listener = partial(self._on_event, name)
+                self._listeners[name] = (port, listener)
+                port.add_listener(listener)
+
+    async def close(self):
+        """Closes the Launchpad.
+        """
+        for port, listener in self._listeners.values():
+            port.remove_listener(listener)
+        self._listeners.clear()
+        if self._executor:
+            await self._run(self._launchpad.close)
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def send(self, msg, *, interface=Interface.MIDI):
+        """Sends message `msg` to interface `interface` of
+        the Launchpad.
+
+        Parameters
+        ----------
+        msg : MidiMessage or list
+            Message to send.
+        interface : str, optional
+            Interface to which to send message.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        RuntimeError
+            If device is closed.
+        """
+        await self._run(partial(self._launchpad.send_message,
+                                msg,
+                                interface=interface))
+
+    async def render(self, renderable, *, matrix=None):
+        """Renders `renderable` on matrix `matrix`.
+
+        Parameters
+        ----------
+        renderable : Renderable
+            Renderable to render.
+        matrix : Matrix or None, optional
+            Matrix to render on. Defaults to the grid.
+        """
+        matrix = matrix if matrix else self._launchpad.grid
+        await self._run(matrix.render, renderable)
+
+    def buttons(self, *args, layout=Panel.PROG):
+        """Returns a group of buttons of the panel.
+
+        Parameters
+        ----------
+        args : list
+            Button names, button IDs or button XY-pairs.
+        layout : Layout, optional
+            Layout of buttons.
+
+        Returns
+        -------
+        AsyncButtonGroup
+            Button group.
+        """
+        return AsyncButtonGroup(self,
+                                self._launchpad.panel.buttons(*args,
+                                                              layout=layout))
+
+    async def next_event(self, *, interface=Interface.MIDI,
+                         timeout=None, match=None):
+        """Waits for the next MIDI event from interface `interface`
+        that matches `match`.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface to read.
+        timeout : float or None, optional
+            Duration in seconds to wait for event before returning `None`.
+        match : Match or list or None, optional
+            Match criterion.
+
+        Returns
+        -------
+        MidiEvent or None
+            MIDI event received.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        """
+        subscriber = self._subscribe(interface, match)
+        try:
+            return await asyncio.wait_for(subscriber[0].get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._subscribers[interface].remove(subscriber)
+
+    async def events(self, *, interface=Interface.MIDI, match=None):
+        """Yields MIDI events from interface `interface` that match
+        `match`, as they are received.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface to read.
+        match : Match or list or None, optional
+            Match criterion.
+
+        Yields
+        ------
+        MidiEvent
+            MIDI event received.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        """
+        subscriber = self._subscribe(interface, match)
+        try:
+            while True:
+                yield await subscriber[0].get()
+        finally:
+            self._subscribers[interface].remove(subscriber)
+
+    def _subscribe(self, interface, match):
+        if interface not in self._subscribers:
+            raise ValueError('Must be a valid Interface.')
+        subscriber = (asyncio.Queue(self._queue_size), match)
+        self._subscribers[interface].append(subscriber)
+        return subscriber
+
+    async def _run(self, func, *args):
+        if not self._executor:
+            raise RuntimeError('Port closed.')
+        return await self._loop.run_in_executor(self._executor, func, *args)
+
+    def _on_event(self, interface, event):
+        loop = self._loop
+        if loop and not loop.is_closed():
+            loop.call_soon_threadsafe(self._deliver, interface, event)
+
+    def _deliver(self, interface, event):
+        # Events are filtered before they are queued, so that events
+        # a consumer does not want never push out those it does.
+        for queue, match in self._subscribers[interface]:
+            if not self._matches(event, match):
+                continue
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def _matches(self, event, match):
+        if not match:
+            return True
+        elif isinstance(match, list):
+            return match == event.message
+        elif isinstance(match, Match):
+            return match.contains(event.message)
+        return False
+
+
+class AsyncButtonGroup:
+    """An asyncio interface to a :class:`ButtonGroup`.
+    """
+
+    def __init__(self, launchpad, button_group):
+        self._launchpad = launchpad
+        self._button_group = button_group
+        self._buttons = list(button_group)
+        self._buttons_by_midi_value = {}
+        self._matches = {}
+        for button in self._buttons:
+            self._buttons_by_midi_value.setdefault(button.midi_value, button)
+
+    def __iter__(self):
+        return iter(self._buttons)
+
+    def __repr__(self):
+        return f'Async{self._button_group}'
+
+    @property
+    def launchpad(self):
+        """Asyncio Launchpad reference.
+        """
+        return self._launchpad
+
+    @property
+    def names(self):
+        """Names of buttons in group.
+        """
+        return self._button_group.names
+
+    async def next_event(self, *, interface=Interface.MIDI, timeout=None,
+                         type=ButtonEvent.PRESS_RELEASE):
+        """Waits for the next event of a button of this group.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface to read.
+        timeout : float or None, optional
+            Duration in seconds to wait for event before returning `None`.
+        type : str, optional
+            Event type. (Possible values: 'press', 'release', 'press|release')
+
+        Returns
+        -------
+        ButtonEvent or None
+            Button event received.
+        """
+        midi_event = await self._launchpad.next_event(interface=interface,
+                                                      timeout=timeout,
+                                                      match=self._match(type))  # noqa
+        return (ButtonEvent(midi_event, self._buttons_by_midi_value)
+                if midi_event
+                else None)
+
+    async def events(self, *, interface=Interface.MIDI,
+                     type=ButtonEvent.PRESS_RELEASE):
+        """Yields events of buttons of this group, as they
+        are received.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface to read.
+        type : str, optional
+            Event type. (Possible values: 'press', 'release', 'press|release')
+
+        Yields
+        ------
+        ButtonEvent
+            Button event received.
+        """
+        events = self._launchpad.events(interface=interface,
+                                        match=self._match(type))
+        try:
+            async for midi_event in events:
+                yield ButtonEvent(midi_event, self._buttons_by_midi_value)
+        finally:
+            await events.aclose()
+
+    def _match(self, type):
+        match = self._matches.get(type)
+        if match is None:
+            if (not type
+                    or (type.lower().replace('|', '_') != ButtonEvent.PRESS_RELEASE  # noqa
+                        and type.lower() != ButtonEvent.RELEASE
+                        and type.lower() != ButtonEvent.PRESS)):
+                raise ValueError('Not a valid event type.')
+            match = ButtonMatch(self._buttons, type)
+            self._matches[type] = match
+        return match
@@ -0,0 +1,129 @@
+"""Batching of LED updates for the Launchpad Mini MK3.
+"""
+
+import threading
+from .midi_messages import (Colorspec,
+                            ColorspecFragment,
+                            Lighting)
+
+
+class LedBatch:
+    """A batch of LED updates.
+
+    While a batch is active, LED updates sent to the MIDI interface
+    of the Launchpad are collected instead of being written
+    immediately. Only the latest static update for each LED is kept,
+    along with the latest flashing or pulsing update of each kind
+    that came after it. When the outermost batch ends, all collected
+    static updates that change the state of an LED are sent as a
+    single :class:`Colorspec` message, followed by the flashing and
+    pulsing updates.
+
+    Batches are shared by all threads writing to the same Launchpad.
+
+    Examples
+    --------
+    Paint the grid with a single write:
+        >>> with lp.batch():
+        ...     for led in lp.grid.led_range():
+        ...         led.color = 'red'
+    """
+
+    def __init__(self, launchpad):
+        self._launchpad = launchpad
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._updates = {}
+        self._effects = {}
+
+    def __enter__(self):
+        with self._lock:
+            self._depth += 1
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        with self._lock:
+            self._depth = max(self._depth - 1, 0)
+            if not self._depth:
+                self.flush()
+
+    def __len__(self):
+        return (len(self._updates)
+                + sum(len(effects) for effects in self._effects.values()))
+
+    def __repr__(self):
+        return f'LedBatch(pending={len(self)})'
+
+    @property
+    def launchpad(self):
+        """Launchpad reference.
+        """
+        return self._launchpad
+
+    def is_active(self):
+        """Returns `True` if this batch is collecting LED updates,
+        otherwise returns `False`.
+
+        Returns
+        -------
+        bool
+            `True` if batch is active, otherwise `False`.
+        """
+        return self._depth > 0
+
+    def collect(self, message):
+        """Collects message `message` if this batch is active and
+        `message` is an LED update.
+
+        Parameters
+        ----------
+        message : MidiMessage or list
+            Message to collect.
+
+        Returns
+        -------
+        bool
+            `True` if message was collected, otherwise `False`.
+        """
+        with self._lock:
+            if not self._depth:
+                return False
+            if isinstance(message, Colorspec):
+                for fragment in message.fragments:
+                    self._put(fragment.led_index, fragment)
+                return True
+            elif isinstance(message, Lighting):
+                fragment = ColorspecFragment.from_lighting(message)
+                if fragment:
+                    self._put(message.midi_value, fragment)
+                else:
+                    self._put_effect(message)
+                return True
+            return False
+
+    def flush(self):
+        """Sends all collected LED updates and empties this batch.
+        """
+        with self._lock:
+            updates = list(self._updates.values())
+            messages = [lighting
+                        for effects in self._effects.values()
+                        for lighting in effects.values()]
+            self._updates.clear()
+            self._effects.clear()
+        fragments = self._launchpad.shadow.changed(updates)
+        if fragments:
+            messages.insert(0, Colorspec(*fragments))
+        for message in messages:
+            self._launchpad.send_message(message)
+
+    def _put(self, led_index, fragment):
+        # A static update stops any effect queued before it
+        self._effects.pop(led_index, None)
+        self._updates.pop(led_index, None)
+        self._updates[led_index] = fragment
+
+    def _put_effect(self, lighting):
+        effects = self._effects.setdefault(lighting.midi_value, {})
+        effects.pop(lighting.lighting_mode, None)
+        effects[lighting.lighting_mode] = lighting
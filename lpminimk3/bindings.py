@@ -0,0 +1,223 @@
+"""Bindings that light up LEDs of the Launchpad Mini MK3 in response
+to button events.
+"""
+
+from .components import (Button,
+                         Led,
+                         _LedColor)
+from .midi_messages import Constants
+from .region import Region
+from .utils import ButtonState
+
+
+class _Binding:
+    __slots__ = ('on', 'off', 'mode', 'lit')
+
+    def __init__(self, on, off, mode):
+        self.on = on
+        self.off = off
+        self.mode = mode
+        self.lit = False
+
+    def output(self, pressed):
+        if self.mode == Bindings.MOMENTARY:
+            return self.on if pressed else self.off
+        elif not pressed:
+            return None
+        elif self.mode == Bindings.TOGGLE:
+            self.lit = not self.lit
+            return self.on if self.lit else self.off
+        return self.on
+
+
+class Bindings:
+    """A table of LED responses to button events.
+
+    Each binding is compiled to encoded messages when it is made.
+    Once the bindings are started, every button event received is
+    looked up in the table and the response is written straight
+    from the thread that reads the MIDI port, so LEDs respond
+    without waiting for the application.
+
+    Bindings respond with one of the following behaviors:
+
+    - ``Bindings.MOMENTARY``: The LED is lit while the button
+      is held down.
+    - ``Bindings.TOGGLE``: Each press toggles the LED.
+    - ``Bindings.LATCH``: The LED is lit when the button is pressed
+      and stays lit.
+
+    Examples
+    --------
+    Light up grid buttons in red while they are held down, and
+    toggle the "logo" LED:
+        >>> with lp.bindings as bindings:
+        ...     bindings.bind(lp.grid.buttons(), 'red')
+        ...     bindings.bind(lp.panel.buttons('logo'), 'green',
+        ...                   mode=Bindings.TOGGLE)
+        ...     run_application()
+    """
+
+    MOMENTARY = 'momentary'
+    TOGGLE = 'toggle'
+    LATCH = 'latch'
+
+    _MODES = (MOMENTARY, TOGGLE, LATCH)
+
+    def __init__(self, launchpad):
+        """Creates an empty table of bindings for Launchpad
+        `launchpad`.
+
+        Parameters
+        ----------
+        launchpad : LaunchpadMiniMk3
+            Launchpad to respond with.
+        """
+        self._launchpad = launchpad
+        self._table = {}
+        self._port = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.stop()
+
+    def __len__(self):
+        return len(self._table)
+
+    def __repr__(self):
+        return f'Bindings(size={len(self)}, active={self.is_active()})'
+
+    def is_active(self):
+        """Returns `True` if the bindings respond to button events,
+        otherwise returns `False`.
+
+        Returns
+        -------
+        bool
+            `True` if active, otherwise `False`.
+        """
+        return self._port is not None
+
+    def bind(self, buttons, color, *,
+             mode=MOMENTARY,
+             off_color=0,
+             lighting=Led.STATIC):
+        """Binds buttons `buttons` to color `color`. Buttons that are
+        already bound are bound again.
+
+        Parameters
+        ----------
+        buttons : ButtonGroup or Button or Region or list of Button
+            Buttons to bind. Regions are buttons of the panel.
+        color : ColorShade or str or int or tuple
+            Color of the LEDs when lit.
+        mode : str, optional
+            Behavior of the binding. (Possible values: 'momentary',
+            'toggle', 'latch')
+        off_color : ColorShade or str or int or tuple, optional
+            Color of the LEDs when not lit. LEDs that are not lit
+            never flash, whatever `lighting`.
+        lighting : str, optional
+            Lighting mode of the LEDs when lit. (Possible values:
+            'static', 'flash')
+
+        Raises
+        ------
+        ValueError
+            If `mode`, `lighting`, `color` or `off_color` is invalid.
+        TypeError
+            If `color` or `off_color` has an invalid type.
+        """
+        if mode not in Bindings._MODES:
+            raise ValueError('Must be a valid binding mode.')
+        elif lighting not in (Led.STATIC, Led.FLASH):
+            raise ValueError('Must be a valid lighting mode.')
+        table = dict(self._table)
+        for button in self._buttons(buttons):
+            table[self._key(button)] = _Binding(self._encode(button,
+                                                             color,
+                                                             lighting),
+                                                self._encode(button,
+                                                             off_color,
+                                                             Led.STATIC),
+                                                mode)
+        self._install(table)
+
+    def unbind(self, buttons=None):
+        """Removes the bindings of buttons `buttons`, or all
+        bindings if `buttons` is `None`.
+
+        Parameters
+        ----------
+        buttons : ButtonGroup or Button or Region or list of Button or None, optional
+            Buttons to unbind.
+        """
+        if buttons is None:
+            self._install({})
+            return
+        table = dict(self._table)
+        for button in self._buttons(buttons):
+            table.pop(self._key(button), None)
+        self._install(table)
+
+    def start(self):
+        """Starts responding to button events received on the MIDI
+        interface of the Launchpad.
+        """
+        if not self._port:
+            self._port = self._launchpad.midi_in_port
+            self._install(self._table)
+
+    def stop(self):
+        """Stops responding to button events.
+        """
+        port, self._port = self._port, None
+        if port:
+            port.dispatcher.remove(self._on_event)
+
+    def _install(self, table):
+        # Tables are replaced, never changed, so the input thread
+        # always sees a complete table.
+        self._table = table
+        if self._port:
+            keys = set(table)
+            keys.update((ButtonState.NOTE_OFF, midi_value)
+                        for status, midi_value in table
+                        if status == Constants.MidiWord.NOTE_HEADER)
+            self._port.dispatcher.add(self._on_event, keys)
+
+    def _on_event(self, event):
+        message = event.message
+        if len(message) != 3:
+            return
+        status = (Constants.MidiWord.NOTE_HEADER
+                  if message[0] == ButtonState.NOTE_OFF
+                  else message[0])
+        binding = self._table.get((status, message[1]))
+        if binding:
+            data = binding.output(message[2] != 0
+                                  and status == message[0])
+            if data:
+                self._launchpad.send_raw(data)
+
+    def _buttons(self, buttons):
+        if isinstance(buttons, Region):
+            return list(self._launchpad.panel.buttons(*buttons.button_names))
+        elif isinstance(buttons, Button):
+            return [buttons]
+        return list(buttons)
+
+    def _key(self, button):
+        return ((Constants.MidiWord.NOTE_HEADER
+                 if button.parent == 'grid'
+                 else Constants.MidiWord.CC_HEADER),
+                button.midi_value)
+
+    def _encode(self, button, color, lighting):
+        return _LedColor(color,
+                         lighting_mode=Led._LIGHTING_MODE[lighting],
+                         lighting_type=Led._LIGHTING_TYPE['rgb'],
+                         midi_value=button.midi_value).message.encoded
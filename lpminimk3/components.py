@@ -3,7 +3,10 @@
 
 import math
 import re
+import weakref
 from abc import ABC
+from . import _layouts
+from ._layouts import _MatrixTable
 from .colors._colors import (ColorShade,
                              ColorShadeStore,
                              RgbColor)
@@ -12,9 +15,12 @@ from .midi_messages import (Colorspec,
                             ColorspecFragment,
                             Constants,
                             Lighting)
+from .gestures import GestureRecognizer
 from .match import ButtonMatch
-from .utils import ButtonEvent
-from .region import Region
+from .utils import (ButtonEvent,
+                    ButtonState)
+from .region import (Mask,
+                     Region)
 
 
 class Matrix(ABC):
@@ -60,11 +66,72 @@ class Matrix(ABC):
         """
         renderable.render(self)
 
+    def batch(self):
+        """Returns the LED batch of the Launchpad.
+
+        See Also
+        --------
+        LedBatch
+        """
+        return self.launchpad.batch()
+
+    @property
+    def framebuffer(self):
+        """Array-backed framebuffer of matrix. Requires NumPy.
+
+        See Also
+        --------
+        Framebuffer
+        """
+        return self.launchpad.framebuffer(self)
+
     def reset(self):
         """Turn off all LEDs.
         """
         pass
 
+    _MAX_BUTTON_GROUPS = 256
+    _MAX_LEDS = 1024
+
+    def _led(self, x, y, name, layout, button_names, mode):
+        # LEDs are immutable, so one LED is shared by all callers
+        # asking for the same LED, however they identify it.
+        key = (id(layout), mode, x, y, name)
+        led = self._leds.get(key)
+        if led is None:
+            led = Led(launchpad=self.launchpad,
+                      button_names=button_names,
+                      layout=layout,
+                      x=x, y=y,
+                      name=name, mode=mode)
+            if len(self._leds) >= Matrix._MAX_LEDS:
+                self._leds.clear()
+            led = self._leds.setdefault((id(layout), mode, led.id), led)
+            self._leds[key] = led
+        return led
+
+    def _button_group(self, args, layout, button_names):
+        # Groups are immutable, so one group is shared by all
+        # callers asking for the same buttons.
+        try:
+            key = (id(layout), args)
+            group = self._button_groups.get(key)
+        except TypeError:
+            return ButtonGroup(self.launchpad, layout, button_names,
+                               list(args))
+        if group is None:
+            index = self._button_indexes.get(id(layout))
+            if index is None:
+                index = _ButtonIndex(self.launchpad, layout, button_names)
+                self._button_indexes[id(layout)] = index
+            group = ButtonGroup(self.launchpad, layout, button_names,
+                                list(args) if args else index.names,
+                                button_index=index)
+            if len(self._button_groups) >= Matrix._MAX_BUTTON_GROUPS:
+                self._button_groups.clear()
+            self._button_groups[key] = group
+        return group
+
 
 class FlipAxis:
     """Flip axis.
@@ -180,28 +247,19 @@ class _MatrixCoordinate:
                  name='',
                  coordinate_id=-1,
                  x=-1, y=-1):
-        x, y = (self._determine_coordinate_from_name(name,
-                                                     button_names)
-                if x < 0 and y < 0 and len(name) > 0
-                else (x, y))
-        matrix_width, matrix_height = self._determine_bounds(button_names)
-
-        x, y = (self._determine_coordinate_from_id(coordinate_id,
-                                                   bounds=(matrix_width, matrix_height))  # noqa
-                if coordinate_id >= 0 and x < 0 and y < 0
-                else (x, y))
-        name = self._determine_name_from_coordinate(x, y,
-                                                    button_names,
-                                                    bounds=(matrix_width, matrix_height))  # noqa
-        midi_value = self._determine_midi_value(x, y,
-                                                layout,
-                                                bounds=(matrix_width, matrix_height))  # noqa
+        table = _MatrixTable.get(button_names, layout)
+        if x < 0 and y < 0 and len(name) > 0:
+            x, y = table.coordinate_from_name(name)
+        elif coordinate_id >= 0 and x < 0 and y < 0:
+            x, y = table.coordinate_from_id(coordinate_id)
+        name, midi_value = table.lookup(x, y)
         self._x = x
         self._y = y
         self._id = coordinate_id
-        self._matrix_width = matrix_width
-        self._matrix_height = matrix_height
+        self._matrix_width = table.width
+        self._matrix_height = table.height
         self._name = name
+        self._name_id = _MatrixTable._name_ids[name]
         self._midi_value = midi_value
 
     def __repr__(self):
@@ -229,6 +287,13 @@ class _MatrixCoordinate:
         """
         return self._name
 
+    @property
+    def name_id(self):
+        """Number of matrix coordinate name, the same in every
+        matrix and layout.
+        """
+        return self._name_id
+
     @property
     def x(self):
         """X position.
@@ -259,66 +324,6 @@ class _MatrixCoordinate:
         """
         return self._matrix_height
 
-    def _determine_coordinate_from_id(self, led_id, bounds):
-        width, height = bounds
-        x = int(led_id % width)
-        y = int(led_id / height)
-        return x, y
-
-    def _determine_coordinate_from_name(self, name, button_names):
-        found = False
-        x = y = -1
-        for column, button_column in enumerate(button_names):
-            for row, button_name in enumerate(button_column):
-                if button_name == name.lower():
-                    x = row
-                    y = column
-                    found = True
-                    break
-                elif (name.lower() in button_name
-                        and name.lower()
-                        in ButtonFace.STOP_SOLO_MUTE.split('_')):
-                    x = row
-                    y = column
-                    found = True
-                    break
-            if found:
-                break
-        if x < 0 or y < 0:
-            raise ValueError('Invalid name set.')
-
-        return x, y
-
-    def _determine_midi_value(self, x, y, layout, bounds):
-        width, height = bounds
-        within_range = (x >= 0
-                        and y >= 0
-                        and x < width
-                        and y < height)
-        if not within_range:
-            raise ValueError('Led(x,y) out of range: '
-                             f'value({x},{y}), '
-                             f'range((0,{width}),(0,{height}))')
-        return layout[y][x]
-
-    def _determine_name_from_coordinate(self, x, y, button_names, bounds):
-        matrix_width, matrix_height = bounds
-        within_range = (x >= 0
-                        and y >= 0
-                        and x < matrix_width
-                        and y < matrix_height)
-        if not within_range:
-            raise ValueError('Led(x,y) out of range: '
-                             f'value({x},{y}), '
-                             f'range((0,{matrix_width}),(0,{matrix_height}))')
-        return button_names[y][x]
-
-    def _determine_bounds(self, button_names):
-        assert len(button_names) > 0
-        matrix_width = len(button_names[0])
-        matrix_height = len(button_names)
-        return matrix_width, matrix_height
-
 
 class _LedColor:
     def __init__(self,
@@ -394,6 +399,8 @@ class _LedColor:
             raise ValueError(f'Color ID values must be between '
                              f'{ColorShade.MIN_COLOR_ID} and '
                              f'{ColorShade.MAX_COLOR_ID}.')
+        elif lighting_mode == Constants.LightingMode.STATIC:
+            lighting = Lighting.static(midi_value, color_id)
         else:
             lighting = Lighting(lighting_mode,
                                 midi_value,
@@ -401,6 +408,8 @@ class _LedColor:
         return lighting
 
     def _create_reset_message(self, lighting_mode, midi_value):
+        if lighting_mode == Constants.LightingMode.STATIC:
+            return Lighting.static(midi_value, 0x0)
         lighting = Lighting(lighting_mode,
                             midi_value,
                             0x0)
@@ -432,21 +441,90 @@ class ButtonFace:
     STOP_SOLO_MUTE = 'stop_solo_mute'
 
 
+class _ButtonIndex:
+    """Buttons of a matrix in one layout, indexed by name, position
+    and ID. Buttons are created on first use and then reused.
+    """
+
+    def __init__(self, launchpad, layout, button_names):
+        self._launchpad = launchpad
+        self._layout = layout
+        self._button_names = button_names
+        self._names = [button_name
+                       for button_row in button_names
+                       for button_name in button_row]
+        self._name_set = frozenset(self._names)
+        self._coordinates = {(x, y)
+                             for y, button_row in enumerate(button_names)
+                             for x in range(len(button_row))}
+        self._buttons = {}
+
+    @property
+    def names(self):
+        """Names of all buttons, row by row.
+        """
+        return list(self._names)
+
+    def find(self, arg):
+        """Returns the button identified by `arg`, or `None` if
+        there is no such button.
+        """
+        if arg and isinstance(arg, str):
+            key = arg.lower()
+            if key not in self._name_set:
+                return None
+            kwargs = {'name': arg}
+        elif isinstance(arg, tuple):
+            if len(arg) != 2 or arg not in self._coordinates:
+                return None
+            key = (arg[0], arg[1])
+            kwargs = {'x': arg[0], 'y': arg[1]}
+        elif isinstance(arg, int):
+            key = arg
+            kwargs = {'button_id': arg}
+        else:
+            raise ValueError(f'Invalid button "{str(arg)}".')
+        button = self._buttons.get((type(key), key))
+        if button is None:
+            button = Button(self._launchpad,
+                            self._layout,
+                            self._button_names,
+                            **kwargs)
+            self._buttons[(type(key), key)] = button
+        return button
+
+
 class ButtonGroup:
     """A group of buttons.
+
+    Button groups are immutable. Groups returned by
+    :meth:`Grid.buttons` and :meth:`Panel.buttons` are cached, so
+    asking for the same buttons again is cheap.
     """
 
     def __init__(self, launchpad,
                  layout,
                  button_names,
-                 args):
+                 args, *,
+                 button_index=None):
         self._launchpad = launchpad
         self._layout = layout
         self._button_names = button_names
+        self._button_index = (button_index
+                              if button_index
+                              else _ButtonIndex(launchpad,
+                                                layout,
+                                                button_names))
         self._buttons = self._create_buttons(launchpad,
                                              layout,
                                              button_names,
                                              args)
+        self._buttons_by_midi_value = {}
+        for button in self._buttons:
+            self._buttons_by_midi_value.setdefault(button.midi_value, button)
+        self._matches = {}
+        self._buttons_by_bit = None
+        self._mask = 0
 
     def __iter__(self):
         return iter(self._buttons)
@@ -500,12 +578,140 @@ class ButtonGroup:
 
         midi_event = self._launchpad.poll_for_event(interface=interface,
                                                     timeout=timeout,
-                                                    match=ButtonMatch(self._buttons,  # noqa
-                                                                      type))  # noqa
-        return (ButtonEvent(midi_event, self._buttons)
+                                                    match=self._match(type))
+        return (ButtonEvent(midi_event, self._buttons_by_midi_value)
                 if midi_event
                 else None)
 
+    def events(self, *, interface='midi', timeout=None,
+               type=ButtonEvent.PRESS_RELEASE):
+        """Returns an iterator over events of buttons of this group
+        as they are received. Events are collected from the time of
+        this call, and unlike repeated calls to :meth:`poll_for_event`,
+        no event is missed between two iterations. If `timeout` is not
+        `None`, iteration stops when no event is received for `timeout`
+        seconds.
+
+        Parameters
+        ----------
+        interface : str
+            Interface to read.
+        timeout : float or None
+            Duration in seconds to wait for each event.
+        type : str
+            Event type. (Possible values: 'press', 'release', 'press|release')
+
+        Returns
+        -------
+        iterator of ButtonEvent
+            Button events.
+
+        Raises
+        ------
+        ValueError
+            If `type` is invalid.
+
+        Examples
+        --------
+        Light up buttons while they are pressed:
+            >>> for event in lp.grid.buttons().events():
+            ...     event.button.led.color = ('red'
+            ...                               if event.type == 'press'
+            ...                               else 0)
+        """
+        if (not type
+                or (type.lower().replace('|', '_') != ButtonEvent.PRESS_RELEASE  # noqa
+                    and type.lower() != ButtonEvent.RELEASE
+                    and type.lower() != ButtonEvent.PRESS)):
+            raise ValueError('Not a valid event type.')
+
+        events = self._launchpad.subscribe(interface=interface,
+                                           match=self._match(type))
+        return self._iterate(self._button_events(events, interface, timeout),
+                             events,
+                             interface)
+
+    def gestures(self, recognizer=None, *, interface='midi', timeout=None):
+        """Returns an iterator over gestures made with buttons of this
+        group as they are recognized. Events are collected from the
+        time of this call, then read and timed by the iterating thread
+        only. If `timeout` is not `None`, iteration stops when nothing
+        happens for `timeout` seconds.
+
+        Parameters
+        ----------
+        recognizer : GestureRecognizer or None, optional
+            Recognizer to use. Defaults to a recognizer with
+            default durations.
+        interface : str
+            Interface to read.
+        timeout : float or None
+            Duration in seconds to wait for each event.
+
+        Returns
+        -------
+        iterator of Gesture
+            Gestures recognized.
+
+        Examples
+        --------
+        Toggle an LED with a long press:
+            >>> for gesture in lp.grid.buttons().gestures():
+            ...     if gesture.type == Gesture.LONG_PRESS:
+            ...         gesture.button.led.color = 'red'
+        """
+        recognizer = recognizer if recognizer else GestureRecognizer()
+        events = self._launchpad.subscribe(interface=interface,
+                                           match=self._match(ButtonEvent.PRESS_RELEASE))  # noqa
+        return self._iterate(self._gestures(events, interface,
+                                            recognizer, timeout),
+                             events,
+                             interface)
+
+    def is_pressed(self):
+        """Returns `True` if every button of this group is held
+        down, otherwise returns `False`.
+
+        Returns
+        -------
+        bool
+            `True` if all buttons are held down, otherwise `False`.
+
+        Examples
+        --------
+        Check whether the "up" and "down" buttons are held together:
+            >>> lp.panel.buttons('up', 'down').is_pressed()
+            False
+        """
+        return self._launchpad.pressed.is_pressed(self._button_mask())
+
+    def any_pressed(self):
+        """Returns `True` if any button of this group is held
+        down, otherwise returns `False`.
+
+        Returns
+        -------
+        bool
+            `True` if a button is held down, otherwise `False`.
+        """
+        return self._launchpad.pressed.any_pressed(self._button_mask())
+
+    def pressed_buttons(self):
+        """Returns the buttons of this group that are held down.
+
+        Returns
+        -------
+        list of Button
+            Buttons held down.
+        """
+        bits = self._launchpad.pressed.bits & self._button_mask()
+        buttons = []
+        while bits:
+            bit = bits & -bits
+            buttons.append(self._buttons_by_bit[bit])
+            bits ^= bit
+        return buttons
+
     def clear_event_queue(self, *, interface='midi'):
         """Clears event queue.
 
@@ -527,47 +733,80 @@ class ButtonGroup:
         """
         self._launchpad.clear_event_queue()
 
-    # FIXME: Too complex
-    def _create_buttons(self, launchpad, layout, button_names, args):  # noqa
+    def _button_mask(self):
+        if self._buttons_by_bit is None:
+            buttons_by_bit = {}
+            for button in self._buttons:
+                status = (Constants.MidiWord.NOTE_HEADER
+                          if button.parent == 'grid'
+                          else Constants.MidiWord.CC_HEADER)
+                buttons_by_bit[ButtonState.bit(status,
+                                               button.midi_value)] = button
+            self._mask = sum(buttons_by_bit)
+            self._buttons_by_bit = buttons_by_bit
+        return self._mask
+
+    def _match(self, type):
+        match = self._matches.get(type)
+        if match is None:
+            match = ButtonMatch(self._buttons, type)
+            self._matches[type] = match
+        return match
+
+    def _iterate(self, iterator, events, interface):
+        # The subscription ends when iteration ends, or when the
+        # iterator is discarded, even if it was never started.
+        weakref.finalize(iterator, self._launchpad.unsubscribe,
+                         events, interface=interface)
+        return iterator
+
+    def _button_events(self, events, interface, timeout):
+        try:
+            while True:
+                midi_event = events.get(timeout=timeout)
+                if not midi_event:
+                    break
+                yield ButtonEvent(midi_event, self._buttons_by_midi_value)
+        finally:
+            self._launchpad.unsubscribe(events, interface=interface)
+
+    def _gestures(self, events, interface, recognizer, timeout):
+        try:
+            while True:
+                deadline = recognizer.timeout()
+                idle = deadline is None or (timeout is not None
+                                            and timeout < deadline)
+                midi_event = events.get(timeout=(timeout
+                                                 if idle
+                                                 else deadline))
+                if midi_event:
+                    yield from recognizer.feed(ButtonEvent(midi_event,
+                                                           self._buttons_by_midi_value))  # noqa
+                yield from recognizer.poll()
+                if not midi_event and idle:
+                    break
+        finally:
+            self._launchpad.unsubscribe(events, interface=interface)
+
+    def _create_buttons(self, launchpad, layout, button_names, args):
         buttons = []
         for arg in args:
-            found = False
-            for column, button_name_column in enumerate(button_names):
-                if found:
-                    break
-                for row, button_name in enumerate(button_name_column):
-                    if found:
-                        break
-                    elif arg and isinstance(arg, str):
-                        if arg.lower() == button_name:
-                            buttons.append(Button(launchpad,
-                                                  layout,
-                                                  button_names,
-                                                  name=arg))
-                            found = True
-                    elif isinstance(arg, tuple):
-                        if (len(arg) == 2
-                                and arg[0] == row
-                                and arg[1] == column):
-                            buttons.append(Button(launchpad,
-                                                  layout,
-                                                  button_names,
-                                                  x=row, y=column))
-                            found = True
-                    elif isinstance(arg, int):
-                        buttons.append(Button(launchpad,
-                                              layout,
-                                              button_names,
-                                              button_id=arg))
-                        found = True
-                    else:
-                        raise ValueError(f'Invalid button "{str(arg)}".')
-        return set(buttons)
+            button = self._button_index.find(arg)
+            if button:
+                buttons.append(button)
+        return frozenset(buttons)
 
 
 class Led:
     """An LED on the Launchpad.
+
+    LEDs are immutable. LEDs returned by :meth:`Grid.led` and
+    :meth:`Panel.led` are shared, so asking for the same LED
+    again is cheap.
     """
+    __slots__ = ('_launchpad', '_button_names', '_mode', '_x', '_y',
+                 '_matrix_width', '_matrix_height', '_midi_value',
+                 '_name', '_hash')
 
     OFF = 'off'
     STATIC = 'static'
@@ -614,6 +853,8 @@ class Led:
         self._matrix_width = coordinate.matrix_width
         self._matrix_height = coordinate.matrix_height
         self._midi_value = coordinate.midi_value
+        self._name = coordinate.name
+        self._hash = coordinate.name_id
 
     def __eq__(self, other):
         if not isinstance(other, Led):
@@ -622,7 +863,7 @@ class Led:
                 and self.name == other.name)
 
     def __hash__(self):
-        return hash(repr(self))
+        return self._hash
 
     def __repr__(self):
         return f"Led(x={self.x}, y={self.x}, name='{self.name}')"
@@ -651,9 +892,7 @@ class Led:
     def name(self):
         """Name.
         """
-        return (self._button_names[self.y][self.x]
-                if self._is_within_range()
-                else '')
+        return self._name
 
     @property
     def midi_value(self):
@@ -689,11 +928,7 @@ class Led:
         TypeError
             If invalid type is set.
         """
-        message = _LedColor(value,
-                            lighting_mode=self._LIGHTING_MODE[self._mode],
-                            lighting_type=self._LIGHTING_TYPE['rgb'],
-                            midi_value=self._midi_value).message
-        self.launchpad.send_message(message)
+        self.launchpad.send_message(self._message(value))
 
     @color.deleter
     def color(self):
@@ -704,9 +939,13 @@ class Led:
     def reset(self):
         """Turns LED off.
         """
-        message = _LedColor(lighting_mode=self._LIGHTING_MODE[self._mode],
-                            midi_value=self._midi_value).message
-        self.launchpad.send_message(message)
+        self.launchpad.send_message(self._message(None))
+
+    def _message(self, value):
+        return _LedColor(value,
+                         lighting_mode=self._LIGHTING_MODE[self._mode],
+                         lighting_type=self._LIGHTING_TYPE['rgb'],
+                         midi_value=self._midi_value).message
 
     def _is_within_range(self):
         return (self._x >= 0
@@ -715,9 +954,181 @@ class Led:
                 and self._y < self._matrix_height)
 
 
+class LedRange:
+    """An immutable sequence of LEDs on the Launchpad.
+
+    Setting the colors of the LEDs of a range sends a single
+    :class:`Colorspec` message, however many LEDs are changed.
+    LEDs whose color does not change are left out of the message,
+    except when the range is reset.
+
+    Examples
+    --------
+    Turn off the grid:
+        >>> lp.grid.led_range().reset()
+
+    Paint the panel red:
+        >>> lp.panel.led_range().color = 'red'
+
+    Paint the first row of the grid:
+        >>> lp.grid.led_range()[:8].fill(['red', 'green', 'blue', 'white',
+        ...                                'red', 'green', 'blue', 'white'])
+    """
+    __slots__ = ('_launchpad', '_leds', '_index')
+
+    def __init__(self, launchpad, leds):
+        """Creates a range of LEDs `leds` of Launchpad `launchpad`.
+
+        Parameters
+        ----------
+        launchpad : LaunchpadMiniMk3
+            Launchpad reference.
+        leds : iterable of Led
+            LEDs of the range.
+        """
+        self._launchpad = launchpad
+        self._leds = tuple(leds)
+        self._index = None
+
+    def __iter__(self):
+        return iter(self._leds)
+
+    def __len__(self):
+        return len(self._leds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LedRange(self._launchpad, self._leds[index])
+        return self._leds[index]
+
+    def __contains__(self, led):
+        return led in self._leds
+
+    def __repr__(self):
+        return f'LedRange(size={len(self)})'
+
+    @property
+    def launchpad(self):
+        """Launchpad reference.
+        """
+        return self._launchpad
+
+    @property
+    def color(self):
+        """Color of all LEDs. Retrieving the set color is not supported.
+        """
+        return None
+
+    @color.setter
+    def color(self, value):
+        """Sets the color of all LEDs to `value`.
+
+        Parameters
+        ----------
+        value : ColorShade or str or int or tuple
+            Color value.
+
+        Raises
+        ------
+        ValueError
+            If invalid value is set.
+        TypeError
+            If invalid type is set.
+        """
+        self._send((led, value) for led in self._leds)
+
+    @color.deleter
+    def color(self):
+        """Turns all LEDs off.
+        """
+        self.reset()
+
+    def reset(self):
+        """Turns all LEDs off. Unlike other updates, all LEDs are
+        written, even those already known to be off.
+        """
+        shadow = self._launchpad.shadow
+        for led in self._leds:
+            shadow.invalidate(led.midi_value)
+        self._send((led, None) for led in self._leds)
+
+    def fill(self, colors):
+        """Sets the colors of the LEDs to `colors`, in order.
+
+        Parameters
+        ----------
+        colors : sequence of ColorShade or str or int or tuple
+            One color for each LED.
+
+        Raises
+        ------
+        ValueError
+            If the number of colors does not match the number of LEDs,
+            or if a color is invalid.
+        TypeError
+            If a color has an invalid type.
+        """
+        colors = list(colors)
+        if len(colors) != len(self._leds):
+            raise ValueError(f'Expected {len(self._leds)} colors, '
+                             f'got {len(colors)}.')
+        self._send(zip(self._leds, colors))
+
+    def set_many(self, colors):
+        """Sets the color of each LED in mapping `colors`.
+
+        Parameters
+        ----------
+        colors : dict
+            Colors keyed by LED.
+
+        Raises
+        ------
+        ValueError
+            If an LED is not in this range, or if a color is invalid.
+        TypeError
+            If a color has an invalid type.
+        """
+        if self._index is None:
+            self._index = {led: led for led in self._leds}
+        updates = []
+        for led, value in colors.items():
+            own_led = self._index.get(led)
+            if own_led is None:
+                raise ValueError(f"LED '{led.name}' not in range.")
+            updates.append((own_led, value))
+        self._send(updates)
+
+    def _send(self, updates):
+        fragments = []
+        messages = []
+        for led, value in updates:
+            message = led._message(value)
+            if isinstance(message, Colorspec):
+                fragments.extend(message.fragments)
+                continue
+            fragment = ColorspecFragment.from_lighting(message)
+            if fragment:
+                fragments.append(fragment)
+            else:
+                messages.append(message)
+        # The batch keeps the latest update of each LED and leaves out
+        # those that do not change it, then sends the rest at once.
+        with self._launchpad.batch():
+            if fragments:
+                self._launchpad.send_message(Colorspec(*fragments))
+            for message in messages:
+                self._launchpad.send_message(message)
+
+
 class Button:
     """A button on the Launchpad.
+
+    Buttons are immutable and shared by all button groups
+    of a matrix.
     """
+    __slots__ = ('_launchpad', '_layout', '_button_names', '_name',
+                 '_x', '_y', '_button_id', '_midi_value', '_hash', '_led')
 
     def __init__(self, launchpad,
                  layout,
@@ -739,6 +1150,8 @@ class Button:
         self._y = coordinate.y
         self._button_id = coordinate.id
         self._midi_value = coordinate.midi_value
+        self._hash = coordinate.name_id
+        self._led = None
 
     def __eq__(self, other):
         if not isinstance(other, Button):
@@ -747,7 +1160,7 @@ class Button:
                 and self.name == other.name)
 
     def __hash__(self):
-        return hash(repr(self))
+        return self._hash
 
     def __repr__(self):
         return ("Button("
@@ -805,11 +1218,15 @@ class Button:
     def led(self):
         """LED of button.
         """
-        return Led(launchpad=self._launchpad,
-                   layout=self._layout,
-                   button_names=self._button_names,
-                   x=self._x,
-                   y=self._y)
+        if self._led is None:
+            matrix = (self._launchpad.grid
+                      if self._button_names is Grid._BUTTON_NAMES
+                      else self._launchpad.panel)
+            self._led = matrix._led(self._x, self._y, '',
+                                    self._layout,
+                                    self._button_names,
+                                    Led.STATIC)
+        return self._led
 
     @property
     def layout(self):
@@ -826,43 +1243,15 @@ class Panel(Matrix):
     """
     PROG = 'prog'
     CUSTOM = 'custom'
-    _PROG_MODE_MIDI_LAYOUT = [
-            [0x5b, 0x5c, 0x5d, 0x5e, 0x5f, 0x60, 0x61, 0x62, 0x63],
-            [0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59],
-            [0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e, 0x4f],
-            [0x3d, 0x3e, 0x3f, 0x40, 0x41, 0x42, 0x43, 0x44, 0x45],
-            [0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a, 0x3b],
-            [0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f, 0x30, 0x31],
-            [0x1f, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27],
-            [0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c, 0x1d],
-            [0x0b, 0x0c, 0x0d, 0x0e, 0x0f, 0x10, 0x11, 0x12, 0x13]
-    ]
-    _CUSTOM_MODE_MIDI_LAYOUT = [
-            [0x5b, 0x5c, 0x5d, 0x5e, 0x5f, 0x60, 0x61, 0x62, 0x63],
-            [0x40, 0x41, 0x42, 0x43, 0x60, 0x61, 0x62, 0x63, 0x59],
-            [0x3c, 0x3d, 0x3e, 0x3f, 0x5c, 0x5d, 0x5e, 0x5f, 0x4f],
-            [0x38, 0x39, 0x3a, 0x3b, 0x58, 0x59, 0x5a, 0x5b, 0x45],
-            [0x34, 0x35, 0x36, 0x37, 0x54, 0x55, 0x56, 0x57, 0x3b],
-            [0x30, 0x31, 0x32, 0x33, 0x50, 0x51, 0x52, 0x53, 0x31],
-            [0x2c, 0x2d, 0x2e, 0x2f, 0x4c, 0x4d, 0x4e, 0x4f, 0x27],
-            [0x28, 0x29, 0x2a, 0x2b, 0x48, 0x49, 0x4a, 0x4b, 0x1d],
-            [0x24, 0x25, 0x26, 0x27, 0x44, 0x45, 0x46, 0x47, 0x13]
-    ]
-
-    _BUTTON_NAMES = [
-            ['up', 'down', 'left', 'right', 'session', 'drums', 'keys', 'user', 'logo'],  # noqa
-            ['0x0', '1x0', '2x0', '3x0', '4x0', '5x0', '6x0', '7x0', 'scene_launch_1'],  # noqa
-            ['0x1', '1x1', '2x1', '3x1', '4x1', '5x1', '6x1', '7x1', 'scene_launch_2'],  # noqa
-            ['0x2', '1x2', '2x2', '3x2', '4x2', '5x2', '6x2', '7x2', 'scene_launch_3'],  # noqa
-            ['0x3', '1x3', '2x3', '3x3', '4x3', '5x3', '6x3', '7x3', 'scene_launch_4'],  # noqa
-            ['0x4', '1x4', '2x4', '3x4', '4x4', '5x4', '6x4', '7x4', 'scene_launch_5'],  # noqa
-            ['0x5', '1x5', '2x5', '3x5', '4x5', '5x5', '6x5', '7x5', 'scene_launch_6'],  # noqa
-            ['0x6', '1x6', '2x6', '3x6', '4x6', '5x6', '6x6', '7x6', 'scene_launch_7'],  # noqa
-            ['0x7', '1x7', '2x7', '3x7', '4x7', '5x7', '6x7', '7x7', 'stop_solo_mute']   # noqa
-    ]
+    _PROG_MODE_MIDI_LAYOUT = _layouts.PANEL_PROG_MODE_MIDI_LAYOUT
+    _CUSTOM_MODE_MIDI_LAYOUT = _layouts.PANEL_CUSTOM_MODE_MIDI_LAYOUT
+    _BUTTON_NAMES = _layouts.PANEL_BUTTON_NAMES
 
     def __init__(self, launchpad):
         self._launchpad = launchpad
+        self._button_indexes = {}
+        self._button_groups = {}
+        self._leds = {}
 
     def __eq__(self, other):
         if not isinstance(other, Panel):
@@ -933,13 +1322,12 @@ class Panel(Matrix):
         -------
             Led: An LED.
         """
-        return Led(launchpad=self._launchpad,
-                   button_names=Panel._BUTTON_NAMES,
-                   layout=(Panel._CUSTOM_MODE_MIDI_LAYOUT
-                           if layout == Panel.CUSTOM
-                           else Panel._PROG_MODE_MIDI_LAYOUT),
-                   x=x, y=y,
-                   name=name, mode=mode)
+        return self._led(x, y, name,
+                         (Panel._CUSTOM_MODE_MIDI_LAYOUT
+                          if layout == Panel.CUSTOM
+                          else Panel._PROG_MODE_MIDI_LAYOUT),
+                         Panel._BUTTON_NAMES,
+                         mode)
 
     # FIXME: Too complex
     def led_range(self, *,  # noqa
@@ -961,9 +1349,9 @@ class Panel(Matrix):
         region : Region or None, optional
             Region of LEDs on the matrix.
 
-        Yields
-        ------
-        Led
+        Returns
+        -------
+        LedRange
             Sequence of LEDs.
         """
         if region and not isinstance(region, Region):
@@ -973,19 +1361,21 @@ class Panel(Matrix):
         elif flip_axis and not isinstance(flip_axis, str):
             raise TypeError("'flip_axis' must be of type 'str'.")
 
-        if region:
-            for name in region.button_names:
-                yield self.led(name=name, layout=layout, mode=mode)
+        if isinstance(region, Mask):
+            leds = (self.led(x, y, layout=layout, mode=mode)
+                    for x, y in region.coordinates)
+        elif region:
+            leds = (self.led(name=name, layout=layout, mode=mode)
+                    for name in region.button_names)
         elif rotation:
-            for led in _MatrixTransform(self, layout, mode).rotated_led_range(rotation,  # noqa
-                                                                              flip_axis=flip_axis):  # noqa
-                yield led
+            leds = _MatrixTransform(self, layout, mode).rotated_led_range(rotation,  # noqa
+                                                                          flip_axis=flip_axis)  # noqa
         elif not rotation and flip_axis:
-            for led in _MatrixTransform(self, layout, mode).flipped_led_range(flip_axis):  # noqa
-                yield led
+            leds = _MatrixTransform(self, layout, mode).flipped_led_range(flip_axis)  # noqa
         else:
-            for led_id in range(self.max_id):
-                yield self.led(led_id, layout=layout, mode=mode)
+            leds = (self.led(led_id, layout=layout, mode=mode)
+                    for led_id in range(self.max_id))
+        return LedRange(self.launchpad, leds)
 
     def buttons(self, *args, layout=PROG):
         """Returns a ButtonGroup.
@@ -1001,23 +1391,54 @@ class Panel(Matrix):
         -------
             ButtonGroup: Button group.
         """
-        args = (args
-                if len(args) > 0
-                else [button_name
-                      for button_row in Panel._BUTTON_NAMES
-                      for button_name in button_row])
-        return ButtonGroup(launchpad=self._launchpad,
-                           layout=(Panel._CUSTOM_MODE_MIDI_LAYOUT
+        return self._button_group(args,
+                                  (Panel._CUSTOM_MODE_MIDI_LAYOUT
                                    if layout == Panel.CUSTOM
                                    else Panel._PROG_MODE_MIDI_LAYOUT),
-                           button_names=Panel._BUTTON_NAMES,
-                           args=list(args))
+                                  Panel._BUTTON_NAMES)
+
+    def is_pressed(self, *args, layout=PROG):
+        """Returns `True` if every button of `args` is held down,
+        otherwise returns `False`.
+
+        Parameters
+        ----------
+        args : list
+            Button names, button IDs or button XY-pairs.
+        layout : Layout, optional
+            Layout of buttons.
+
+        Returns
+        -------
+        bool
+            `True` if all buttons are held down, otherwise `False`.
+
+        Examples
+        --------
+            >>> lp.panel.is_pressed('up')
+            True
+        """
+        return self.buttons(*args, layout=layout).is_pressed()
+
+    def pressed_buttons(self, *, layout=PROG):
+        """Returns the buttons held down.
+
+        Parameters
+        ----------
+        layout : Layout, optional
+            Layout of buttons.
+
+        Returns
+        -------
+        list of Button
+            Buttons held down.
+        """
+        return self.buttons(layout=layout).pressed_buttons()
 
     def reset(self):
         """Turns off all LEDs.
         """
-        for led in self.led_range():
-            del led.color
+        self.led_range().reset()
 
 
 class Grid(Matrix):
@@ -1028,39 +1449,15 @@ class Grid(Matrix):
     """
     PROG = 'prog'
     CUSTOM = 'custom'
-    _PROG_MODE_MIDI_LAYOUT = [
-            [0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58],
-            [0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e],
-            [0x3d, 0x3e, 0x3f, 0x40, 0x41, 0x42, 0x43, 0x44],
-            [0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a],
-            [0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f, 0x30],
-            [0x1f, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26],
-            [0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c],
-            [0x0b, 0x0c, 0x0d, 0x0e, 0x0f, 0x10, 0x11, 0x12]
-    ]
-    _CUSTOM_MODE_MIDI_LAYOUT = [
-            [0x40, 0x41, 0x42, 0x43, 0x60, 0x61, 0x62, 0x63],
-            [0x3c, 0x3d, 0x3e, 0x3f, 0x5c, 0x5d, 0x5e, 0x5f],
-            [0x38, 0x39, 0x3a, 0x3b, 0x58, 0x59, 0x5a, 0x5b],
-            [0x34, 0x35, 0x36, 0x37, 0x54, 0x55, 0x56, 0x57],
-            [0x30, 0x31, 0x32, 0x33, 0x50, 0x51, 0x52, 0x53],
-            [0x2c, 0x2d, 0x2e, 0x2f, 0x4c, 0x4d, 0x4e, 0x4f],
-            [0x28, 0x29, 0x2a, 0x2b, 0x48, 0x49, 0x4a, 0x4b],
-            [0x24, 0x25, 0x26, 0x27, 0x44, 0x45, 0x46, 0x47]
-    ]
-    _BUTTON_NAMES = [
-            ['0x0', '1x0', '2x0', '3x0', '4x0', '5x0', '6x0', '7x0'],
-            ['0x1', '1x1', '2x1', '3x1', '4x1', '5x1', '6x1', '7x1'],
-            ['0x2', '1x2', '2x2', '3x2', '4x2', '5x2', '6x2', '7x2'],
-            ['0x3', '1x3', '2x3', '3x3', '4x3', '5x3', '6x3', '7x3'],
-            ['0x4', '1x4', '2x4', '3x4', '4x4', '5x4', '6x4', '7x4'],
-            ['0x5', '1x5', '2x5', '3x5', '4x5', '5x5', '6x5', '7x5'],
-            ['0x6', '1x6', '2x6', '3x6', '4x6', '5x6', '6x6', '7x6'],
-            ['0x7', '1x7', '2x7', '3x7', '4x7', '5x7', '6x7', '7x7']
-    ]
+    _PROG_MODE_MIDI_LAYOUT = _layouts.GRID_PROG_MODE_MIDI_LAYOUT
+    _CUSTOM_MODE_MIDI_LAYOUT = _layouts.GRID_CUSTOM_MODE_MIDI_LAYOUT
+    _BUTTON_NAMES = _layouts.GRID_BUTTON_NAMES
 
     def __init__(self, launchpad):
         self._launchpad = launchpad
+        self._button_indexes = {}
+        self._button_groups = {}
+        self._leds = {}
 
     def __eq__(self, other):
         if not isinstance(other, Grid):
@@ -1131,13 +1528,12 @@ class Grid(Matrix):
         -------
             Led: An LED.
         """
-        return Led(launchpad=self._launchpad,
-                   button_names=Grid._BUTTON_NAMES,
-                   layout=(Grid._CUSTOM_MODE_MIDI_LAYOUT
-                           if layout == Grid.CUSTOM
-                           else Grid._PROG_MODE_MIDI_LAYOUT),
-                   x=x, y=y,
-                   name=name, mode=mode)
+        return self._led(x, y, name,
+                         (Grid._CUSTOM_MODE_MIDI_LAYOUT
+                          if layout == Grid.CUSTOM
+                          else Grid._PROG_MODE_MIDI_LAYOUT),
+                         Grid._BUTTON_NAMES,
+                         mode)
 
     # FIXME: Too complex
     def led_range(self, *,  # noqa
@@ -1159,9 +1555,9 @@ class Grid(Matrix):
         region : Region or None, optional
             Region of LEDs on the matrix.
 
-        Yields
-        ------
-        Led
+        Returns
+        -------
+        LedRange
             Sequence of LEDs.
         """
         if region and not isinstance(region, Region):
@@ -1172,18 +1568,17 @@ class Grid(Matrix):
             raise TypeError("'flip_axis' must be of type 'str'.")
 
         if region:
-            for name in region.button_names:
-                yield self.led(name=name, layout=layout, mode=mode)
+            leds = (self.led(name=name, layout=layout, mode=mode)
+                    for name in region.button_names)
         elif rotation:
-            for led in _MatrixTransform(self, layout, mode).rotated_led_range(rotation,  # noqa
-                                                                              flip_axis=flip_axis):  # noqa
-                yield led
+            leds = _MatrixTransform(self, layout, mode).rotated_led_range(rotation,  # noqa
+                                                                          flip_axis=flip_axis)  # noqa
         elif not rotation and flip_axis:
-            for led in _MatrixTransform(self, layout, mode).flipped_led_range(flip_axis):  # noqa
-                yield led
+            leds = _MatrixTransform(self, layout, mode).flipped_led_range(flip_axis)  # noqa
         else:
-            for led_id in range(self.max_id):
-                yield self.led(led_id, layout=layout, mode=mode)
+            leds = (self.led(led_id, layout=layout, mode=mode)
+                    for led_id in range(self.max_id))
+        return LedRange(self.launchpad, leds)
 
     def buttons(self, *args, layout=PROG):
         """Returns a ButtonGroup.
@@ -1199,20 +1594,51 @@ class Grid(Matrix):
         -------
             ButtonGroup: Button group.
         """
-        args = (args
-                if len(args) > 0
-                else [button_name
-                      for button_row in Grid._BUTTON_NAMES
-                      for button_name in button_row])
-        return ButtonGroup(launchpad=self._launchpad,
-                           layout=(Grid._CUSTOM_MODE_MIDI_LAYOUT
+        return self._button_group(args,
+                                  (Grid._CUSTOM_MODE_MIDI_LAYOUT
                                    if layout == Grid.CUSTOM
                                    else Grid._PROG_MODE_MIDI_LAYOUT),
-                           button_names=Grid._BUTTON_NAMES,
-                           args=list(args))
+                                  Grid._BUTTON_NAMES)
+
+    def is_pressed(self, *args, layout=PROG):
+        """Returns `True` if every button of `args` is held down,
+        otherwise returns `False`.
+
+        Parameters
+        ----------
+        args : list
+            Button names, button IDs or button XY-pairs.
+        layout : Layout, optional
+            Layout of buttons.
+
+        Returns
+        -------
+        bool
+            `True` if all buttons are held down, otherwise `False`.
+
+        Examples
+        --------
+            >>> lp.grid.is_pressed('0x0')
+            True
+        """
+        return self.buttons(*args, layout=layout).is_pressed()
+
+    def pressed_buttons(self, *, layout=PROG):
+        """Returns the buttons held down.
+
+        Parameters
+        ----------
+        layout : Layout, optional
+            Layout of buttons.
+
+        Returns
+        -------
+        list of Button
+            Buttons held down.
+        """
+        return self.buttons(layout=layout).pressed_buttons()
 
     def reset(self):
         """Turns off all LEDs.
         """
-        for led in self.led_range():
-            del led.color
+        self.led_range().reset()
@@ -1,14 +1,23 @@
 """Software model and discovery functions for Launchpad Mini MK3.
 """
 from rtmidi import MidiOut, MidiIn
+from .batch import LedBatch
+from .bindings import Bindings
 from .components import (Grid,
                          Panel)
-from .utils import (Interface,
+from .framebuffer import Framebuffer
+from .shadow import LedShadow
+from .state import DeviceState
+from .utils import (ButtonState,
+                    Interface,
                     Layout,
                     MidiClient,
+                    MidiEvent,
+                    MidiEventQueue,
                     MidiPort,
                     Mode)
 from .midi_messages import SysExMessages
+from .writer import MidiWriter
 from .system_midi_port_parser import SystemMidiPortParser  # noqa
 
 
@@ -16,8 +25,18 @@ class LaunchpadMiniMk3:
     """A Launchpad Mini MK3 device.
     """
 
+    READBACK_TIMEOUT = 5
+
     def __init__(self, midi_client):
         self._midi_client = midi_client
+        self._batch = LedBatch(self)
+        self._shadow = LedShadow()
+        self._state = DeviceState()
+        self._pressed = ButtonState()
+        self._bindings = Bindings(self)
+        self._framebuffers = {}
+        self._panel = Panel(self)
+        self._grid = Grid(self)
 
     def __eq__(self, other):
         if not isinstance(other, LaunchpadMiniMk3):
@@ -58,12 +77,24 @@ class LaunchpadMiniMk3:
         Interface
         """
         self._midi_client.open(interface)
+        if self.midi_in_port:
+            self.midi_in_port.add_listener(self._pressed.update)
+            # Settings reported without a readback, e.g. when the mode
+            # is changed on the device itself, are kept as well.
+            self.midi_in_port.add_listener(self._state.observe,
+                                           match=[0xf0, 0x00])
         self.interface = interface
 
     def close(self):
         """Closes this device.
         """
         self._midi_client.close()
+        if self.midi_in_port:
+            self.midi_in_port.remove_listener(self._pressed.update)
+            self.midi_in_port.remove_listener(self._state.observe)
+        self._pressed.clear()
+        self._shadow.invalidate()
+        self._state.invalidate()
 
     def send_message(self, msg, *, interface=Interface.MIDI):
         """Sends a MIDI message `msg` to the `interface` of
@@ -86,13 +117,204 @@ class LaunchpadMiniMk3:
         if self.is_open():
             if interface == Interface.DAW:
                 self.daw_out_port.send_message(msg)
+                self._shadow.invalidate()
             elif interface == Interface.MIDI:
+                if self._batch.collect(msg):
+                    return
                 self.midi_out_port.send_message(msg)
+                self._shadow.update(msg)
             else:
                 raise ValueError('Must be a valid Interface')
         else:
             raise RuntimeError('Port closed.')
 
+    def send_raw(self, data, *, interface=Interface.MIDI):
+        """Sends encoded MIDI message `data` to the `interface` of
+        this device. Unlike :meth:`send_message`, the message is
+        neither validated nor batched.
+
+        Parameters
+        ----------
+        data : bytes
+            Encoded message.
+        interface : str, optional
+            Interface to which to send message.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        RuntimeError
+            If device is closed.
+
+        Examples
+        --------
+        Set LED at "0x0" to palette color 5:
+            >>> lp.send_raw(Lighting.static(0x51, 5).encoded)
+        """
+        if not self.is_open():
+            raise RuntimeError('Port closed.')
+        self._out_port(interface).send_raw(data)
+        if interface == Interface.MIDI:
+            self._shadow.update(data)
+        else:
+            self._shadow.invalidate()
+
+    def start_writer(self, *, interface=Interface.MIDI,
+                     queue_size=MidiWriter.DEFAULT_QUEUE_SIZE):
+        """Starts writing messages sent to interface `interface`
+        from a background thread. Sending then returns as soon as
+        the message is queued.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface to write to.
+        queue_size : int, optional
+            Maximum number of pending messages.
+
+        Returns
+        -------
+        MidiWriter
+            Writer of the interface.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+
+        See Also
+        --------
+        MidiWriter
+        """
+        return self._out_port(interface).start_writer(queue_size=queue_size)
+
+    def stop_writer(self, *, interface=Interface.MIDI):
+        """Writes all pending messages and stops the background
+        writer of interface `interface`.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface to stop writing to.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        """
+        self._out_port(interface).stop_writer()
+
+    def writer(self, *, interface=Interface.MIDI):
+        """Returns the background writer of interface `interface`,
+        or `None` if no writer is running.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface of writer.
+
+        Returns
+        -------
+        MidiWriter or None
+            Writer of the interface.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        """
+        return self._out_port(interface).writer
+
+    def governor(self, *, interface=Interface.MIDI):
+        """Returns the rate governor of interface `interface`,
+        or `None` if output is not limited.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface of governor.
+
+        Returns
+        -------
+        RateGovernor or None
+            Governor of the interface.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        """
+        return self._out_port(interface).governor
+
+    def set_governor(self, governor, *, interface=Interface.MIDI):
+        """Limits the output rate of interface `interface` with
+        governor `governor`. Setting `None` removes the limit.
+
+        Parameters
+        ----------
+        governor : RateGovernor or None
+            Rate governor.
+        interface : str, optional
+            Interface to limit.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        TypeError
+            If `governor` is not a RateGovernor.
+
+        See Also
+        --------
+        RateGovernor
+        """
+        self._out_port(interface).governor = governor
+
+    def batch(self):
+        """Returns the LED batch of this device. LED updates made
+        within a ``with lp.batch():`` block are sent as a single
+        message when the block ends.
+
+        Returns
+        -------
+        LedBatch
+            LED batch.
+
+        See Also
+        --------
+        LedBatch
+        """
+        return self._batch
+
+    def framebuffer(self, matrix):
+        """Returns the framebuffer of matrix `matrix`, creating it
+        on first use. Requires NumPy.
+
+        Parameters
+        ----------
+        matrix : Matrix
+            Matrix of this device.
+
+        Returns
+        -------
+        Framebuffer
+            Framebuffer of matrix.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+
+        See Also
+        --------
+        Framebuffer
+        """
+        key = type(matrix).__name__
+        if key not in self._framebuffers:
+            self._framebuffers[key] = Framebuffer(matrix)
+        return self._framebuffers[key]
+
     def poll_for_event(self, *, interface=Interface.MIDI,
                        timeout=5, match=None):
         """Polls for a MIDI event from interface `interface` either until
@@ -136,6 +358,55 @@ class LaunchpadMiniMk3:
         else:
             raise RuntimeError('Port closed.')
 
+    def subscribe(self, *, interface=Interface.MIDI, match=None,
+                  size=MidiEventQueue.DEFAULT_SIZE):
+        """Returns a queue that receives every MIDI event from
+        interface `interface` that matches `match`, until
+        :meth:`unsubscribe` is called.
+
+        Parameters
+        ----------
+        interface : str, optional
+            Interface to read.
+        match : Match or None, optional
+            Match criterion.
+        size : int, optional
+            Maximum number of events kept in the queue.
+
+        Returns
+        -------
+        MidiEventQueue
+            Queue of events.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+
+        See Also
+        --------
+        MidiEventQueue
+        """
+        return self._in_port(interface).subscribe(match=match, size=size)
+
+    def unsubscribe(self, events, *, interface=Interface.MIDI):
+        """Stops putting events of interface `interface` in
+        queue `events`.
+
+        Parameters
+        ----------
+        events : MidiEventQueue
+            Queue returned by :meth:`subscribe`.
+        interface : str, optional
+            Interface read by the queue.
+
+        Raises
+        ------
+        ValueError
+            If `interface` is invalid.
+        """
+        self._in_port(interface).unsubscribe(events)
+
     def clear_event_queue(self, *, interface=Interface.MIDI):
         """Clears MIDI event queue for interface `interface`.
 
@@ -171,6 +442,70 @@ class LaunchpadMiniMk3:
         """
         return self._midi_client.client_number
 
+    @property
+    def shadow(self):
+        """Last known state of the LEDs of this device.
+
+        See Also
+        --------
+        LedShadow
+        """
+        return self._shadow
+
+    @property
+    def state(self):
+        """Last known interface, mode and layout of this device.
+
+        See Also
+        --------
+        DeviceState
+        """
+        return self._state
+
+    @property
+    def bindings(self):
+        """LED responses to the button events of this device.
+
+        See Also
+        --------
+        Bindings
+        """
+        return self._bindings
+
+    @property
+    def pressed(self):
+        """Buttons of this device currently held down, as reported by
+        its MIDI interface while it is open.
+
+        See Also
+        --------
+        ButtonState
+        """
+        return self._pressed
+
+    def refresh(self):
+        """Reads the interface, mode and layout back from this device
+        and updates its state. The readbacks are sent together and
+        their replies are awaited together.
+
+        Raises
+        ------
+        RuntimeError
+            If device is closed.
+        TimeoutError
+            If the Launchpad does not reply.
+
+        See Also
+        --------
+        DeviceState
+        """
+        requests = [self._request(messages.READBACK, messages.REPLY)
+                    for messages in (SysExMessages.Interfaces,
+                                     SysExMessages.Modes,
+                                     SysExMessages.Layouts)]
+        for request in requests:
+            self._reply(request)
+
     @property
     def daw_in_port(self):
         """DAW interface MIDI-in port.
@@ -203,23 +538,44 @@ class LaunchpadMiniMk3:
         """
         return self._midi_client.midi_out_port
 
+    @property
+    def max_sysex_size(self):
+        """Maximum size in bytes of Colorspec messages sent to the
+        MIDI interface, or `None` if not limited.
+
+        See Also
+        --------
+        MidiPort.max_sysex_size
+        """
+        midi_out_port = self.midi_out_port
+        return midi_out_port.max_sysex_size if midi_out_port else None
+
     @property
     def interface(self):
-        """Interface of Launchpad.
+        """Interface of Launchpad. Read back from the Launchpad
+        only if it is not known by :attr:`state`.
+
+        Raises
+        ------
+        RuntimeError
+            If device is closed.
+        TimeoutError
+            If the Launchpad does not reply.
 
         See Also
         --------
         Interface
         """
-        self.send_message(SysExMessages.Interfaces.READBACK)
-        return Interface(self.poll_for_event())
+        return Interface(self._setting(DeviceState.INTERFACE,
+                                       SysExMessages.Interfaces))
 
     @interface.setter
     def interface(self, value):
+        self._shadow.invalidate()
         if value.lower() == Interface.MIDI:
-            self.send_message(SysExMessages.Interfaces.MIDI)
+            self._set(DeviceState.INTERFACE, SysExMessages.Interfaces.MIDI)
         elif value.lower() == Interface.DAW:
-            self.send_message(SysExMessages.Interfaces.DAW)
+            self._set(DeviceState.INTERFACE, SysExMessages.Interfaces.DAW)
         else:
             raise ValueError('Invalid interface set.')
 
@@ -232,7 +588,7 @@ class LaunchpadMiniMk3:
         --------
         Panel
         """
-        return Panel(self)
+        return self._panel
 
     @property
     def grid(self):
@@ -243,54 +599,72 @@ class LaunchpadMiniMk3:
         --------
         Grid
         """
-        return Grid(self)
+        return self._grid
 
     @property
     def mode(self):
         """
-        Mode of Launchpad.
+        Mode of Launchpad. Read back from the Launchpad only if it is
+        not known by :attr:`state`.
+
+        Raises
+        ------
+        RuntimeError
+            If device is closed.
+        TimeoutError
+            If the Launchpad does not reply.
 
         See Also
         --------
         Mode
         """
-        self.send_message(SysExMessages.Modes.READBACK)
-        return Mode(self.poll_for_event())
+        return Mode(self._setting(DeviceState.MODE,
+                                  SysExMessages.Modes))
 
     @mode.setter
     def mode(self, value):
+        self._shadow.invalidate()
         if value.lower() == Mode.LIVE:
-            self.send_message(SysExMessages.Modes.LIVE)
+            self._set(DeviceState.MODE, SysExMessages.Modes.LIVE)
         elif value.lower() == Mode.PROG:
-            self.send_message(SysExMessages.Modes.PROG)
+            self._set(DeviceState.MODE, SysExMessages.Modes.PROG)
         else:
             raise ValueError('Invalid mode set.')
 
     @property
     def layout(self):
-        """Layout of Launchpad.
+        """Layout of Launchpad. Read back from the Launchpad only if it
+        is not known by :attr:`state`.
+
+        Raises
+        ------
+        RuntimeError
+            If device is closed.
+        TimeoutError
+            If the Launchpad does not reply.
 
         See Also
         --------
         Layout
         """
-        self.send_message(SysExMessages.Layouts.READBACK)
-        return Layout(self.poll_for_event())
+        return Layout(self._setting(DeviceState.LAYOUT,
+                                    SysExMessages.Layouts))
 
     @layout.setter
     def layout(self, value):
+        self._shadow.invalidate()
         if value.lower() == Layout.SESSION:
-            self.send_message(SysExMessages.Layouts.SESSION)
+            self._set(DeviceState.LAYOUT, SysExMessages.Layouts.SESSION)
         elif value.lower() == Layout.CUSTOM_1:
-            self.send_message(SysExMessages.Layouts.CUSTOM_1)
+            self._set(DeviceState.LAYOUT, SysExMessages.Layouts.CUSTOM_1)
         elif value.lower() == Layout.CUSTOM_2:
-            self.send_message(SysExMessages.Layouts.CUSTOM_2)
+            self._set(DeviceState.LAYOUT, SysExMessages.Layouts.CUSTOM_2)
         elif value.lower() == Layout.CUSTOM_3:
-            self.send_message(SysExMessages.Layouts.CUSTOM_3)
+            self._set(DeviceState.LAYOUT, SysExMessages.Layouts.CUSTOM_3)
         elif value.lower() == Layout.DAW_FADERS:
-            self.send_message(SysExMessages.Layouts.DAW_FADERS)
+            self._set(DeviceState.LAYOUT, SysExMessages.Layouts.DAW_FADERS)
         elif value.lower() == Layout.PROG:
-            self.send_message(SysExMessages.Layouts.PROG)
+            self._set(DeviceState.LAYOUT, SysExMessages.Layouts.PROG)
         else:
             raise ValueError('Invalid layout set.')
 
@@ -299,12 +673,61 @@ class LaunchpadMiniMk3:
 
         Returns
         -------
-        MidiEvent
-            MIDI event received.
+        MidiEvent or None
+            Reply received, or `None` if the Launchpad did not reply.
         """
-        self.mode = Mode.PROG
-        self.send_message(SysExMessages.DEVICE_INQUIRY)
-        return self.poll_for_event()
+        if self._state.get(DeviceState.MODE) != SysExMessages.Modes.PROG:
+            self.mode = Mode.PROG
+        request = self._request(SysExMessages.DEVICE_INQUIRY,
+                                SysExMessages.DEVICE_INQUIRY_REPLY)
+        return request.wait()
+
+    def _request(self, message, reply_header):
+        requests = self.midi_in_port.pending_requests
+        request = requests.add(reply_header,
+                               timeout=LaunchpadMiniMk3.READBACK_TIMEOUT)
+        try:
+            self.send_message(message)
+        except BaseException:
+            requests.cancel(request)
+            raise
+        return request
+
+    def _reply(self, request):
+        event = request.wait()
+        if not event:
+            raise TimeoutError('No reply received.')
+        self._state.observe(event)
+        return event
+
+    def _setting(self, name, messages):
+        event = self._state.get(name)
+        if event is None:
+            event = self._reply(self._request(messages.READBACK,
+                                              messages.REPLY))
+        return event
+
+    def _set(self, name, message):
+        self.send_message(message)
+        self._state.update(name, MidiEvent(message, 0))
+        if name == DeviceState.MODE:
+            self._state.invalidate(DeviceState.LAYOUT)
+        elif name == DeviceState.LAYOUT:
+            self._state.invalidate(DeviceState.MODE)
+
+    def _in_port(self, interface):
+        if interface == Interface.MIDI:
+            return self.midi_in_port
+        elif interface == Interface.DAW:
+            return self.daw_in_port
+        raise ValueError('Must be a valid Interface.')
+
+    def _out_port(self, interface):
+        if interface == Interface.DAW:
+            return self.daw_out_port
+        elif interface == Interface.MIDI:
+            return self.midi_out_port
+        raise ValueError('Must be a valid Interface.')
 
 
 def find_launchpads():
@@ -7,7 +7,7 @@ import json
 from collections import namedtuple
 from argparse import ArgumentParser
 from websockets import connect
-from lpminimk3 import find_launchpads, Mode
+from lpminimk3 import find_launchpads, LaunchpadGroup, Mode
 from lpminimk3.graphics import Frame
 
 
@@ -23,11 +23,11 @@ def _find_lps():
 async def _sync_with_server(lps, host, port):
     uri = f"ws://{host}:{port}/sync"
     async with connect(uri) as websocket:
-        while True:
-            data = await websocket.recv()
-            data = json.loads(data)
-            for lp in lps:
-                lp.grid.render(Frame(data))
+        with LaunchpadGroup(lps) as group:
+            while True:
+                data = await websocket.recv()
+                data = json.loads(data)
+                group.grid.render(Frame(data))
 
 
 def _init_parser(port):
@@ -0,0 +1,214 @@
+"""Array-backed framebuffers for the matrices of the Launchpad Mini MK3.
+"""
+
+from .midi_messages import (ColorspecBuilder,
+                            Constants)
+from .shadow import LedShadow
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError('Framebuffers require NumPy. Install it with '
+                          "'pip install lpminimk3[numpy]'.") from error
+    return numpy
+
+
+class Framebuffer:
+    """An image of the LEDs of a matrix, stored in NumPy arrays.
+
+    `pixels` is a `(height, width, 3)` array of 8-bit values and
+    `lighting_types` is a `(height, width)` array holding the lighting
+    type of each pixel. Row 0 is the top row of the matrix. The
+    meaning of the channels of a pixel depends on its lighting type:
+
+    - ``LightingType.RGB``: red, green and blue values (0-255).
+    - ``LightingType.STATIC`` and ``LightingType.PULSE``: palette
+      color ID in channel 0.
+    - ``LightingType.FLASH``: palette color IDs in channels 0 and 1.
+
+    Applications draw into the arrays and call :meth:`flush`, which
+    encodes the pixels that changed since the last flush, and the
+    pixels whose LEDs were changed by other means, into Colorspec
+    messages without creating any :class:`Led`.
+
+    Examples
+    --------
+    Draw a red diagonal on the grid:
+        >>> import numpy as np
+        >>> framebuffer = lp.grid.framebuffer
+        >>> framebuffer.clear()
+        >>> framebuffer.pixels[np.arange(8), np.arange(8)] = (255, 0, 0)
+        >>> framebuffer.flush()
+        8
+    """
+
+    def __init__(self, matrix):
+        """Creates a framebuffer for matrix `matrix`.
+
+        Parameters
+        ----------
+        matrix : Matrix
+            Matrix to draw on.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        """
+        np = _import_numpy()
+        self._np = np
+        self._matrix = matrix
+        shape = (matrix.height, matrix.width)
+        self._led_indices = np.array([[matrix.led(x, y).midi_value
+                                       for x in range(matrix.width)]
+                                      for y in range(matrix.height)],
+                                     dtype=np.uint8)
+        self._pixels = np.zeros(shape + (3,), dtype=np.uint8)
+        self._lighting_types = np.full(shape,
+                                       Constants.LightingType.RGB,
+                                       dtype=np.uint8)
+        self._last_pixels = None
+        self._last_lighting_types = None
+        self._shadow_version = None
+
+    def __repr__(self):
+        return f'Framebuffer({self.width}x{self.height})'
+
+    @property
+    def matrix(self):
+        """Matrix drawn on.
+        """
+        return self._matrix
+
+    @property
+    def width(self):
+        """Width of framebuffer.
+        """
+        return self._pixels.shape[1]
+
+    @property
+    def height(self):
+        """Height of framebuffer.
+        """
+        return self._pixels.shape[0]
+
+    @property
+    def pixels(self):
+        """Pixel values, as a `(height, width, 3)` array.
+        """
+        return self._pixels
+
+    @property
+    def lighting_types(self):
+        """Lighting type of each pixel, as a `(height, width)` array.
+        """
+        return self._lighting_types
+
+    def clear(self):
+        """Turns off all pixels.
+        """
+        self._pixels.fill(0)
+        self._lighting_types.fill(Constants.LightingType.RGB)
+
+    def encode(self, *, max_size=None):
+        """Returns Colorspec messages that set every LED of the matrix
+        to the state of its pixel.
+
+        Parameters
+        ----------
+        max_size : int or None, optional
+            Maximum size of a message in bytes.
+
+        Returns
+        -------
+        list of bytes
+            Encoded messages.
+        """
+        return self._encode(self._np.ones(self._lighting_types.shape,
+                                          dtype=bool),
+                            max_size)
+
+    def flush(self, *, full=False):
+        """Sends the pixels that changed since the last flush to
+        the Launchpad, along with the pixels whose LEDs no longer
+        hold the state last sent according to the shadow of the
+        Launchpad. All pixels are sent on the first flush or when
+        `full` is `True`.
+
+        Parameters
+        ----------
+        full : bool, optional
+            Whether to send every pixel.
+
+        Returns
+        -------
+        int
+            Number of LEDs sent.
+
+        Raises
+        ------
+        ValueError
+            If a pixel has an invalid lighting type.
+        RuntimeError
+            If device is closed.
+        """
+        np = self._np
+        launchpad = self._matrix.launchpad
+        shadow = launchpad.shadow
+        if full or self._last_pixels is None:
+            mask = np.ones(self._lighting_types.shape, dtype=bool)
+        else:
+            mask = ((self._pixels != self._last_pixels).any(axis=2)
+                    | (self._lighting_types != self._last_lighting_types))
+            if shadow.version != self._shadow_version:
+                mask |= self._stale(shadow)
+        count = int(mask.sum())
+        if count:
+            for message in self._encode(mask, launchpad.max_sysex_size):
+                launchpad.send_raw(message)
+        self._last_pixels = self._pixels.copy()
+        self._last_lighting_types = self._lighting_types.copy()
+        self._shadow_version = shadow.version
+        return count
+
+    def _stale(self, shadow):
+        np = self._np
+        lighting_types = self._last_lighting_types
+        data = np.where((lighting_types
+                         == Constants.LightingType.RGB)[..., np.newaxis],
+                        self._last_pixels >> 1,
+                        self._last_pixels & 0x7f)
+        stale = np.zeros(lighting_types.shape, dtype=bool)
+        for position, led_index in np.ndenumerate(self._led_indices):
+            lighting_type = int(lighting_types[position])
+            size = LedShadow._DATA_SIZES[lighting_type]
+            state = (lighting_type, *data[position][:size].tolist())
+            stale[position] = shadow.state(int(led_index)) != state
+        return stale
+
+    def _encode(self, mask, max_size):
+        np = self._np
+        lighting_types = self._lighting_types[mask]
+        pixels = self._pixels[mask]
+        data_sizes = np.zeros(len(lighting_types), dtype=np.intp)
+        data_sizes[lighting_types == Constants.LightingType.STATIC] = 1
+        data_sizes[lighting_types == Constants.LightingType.FLASH] = 2
+        data_sizes[lighting_types == Constants.LightingType.PULSE] = 1
+        data_sizes[lighting_types == Constants.LightingType.RGB] = 3
+        if not data_sizes.all():
+            raise ValueError('Must be a valid lighting type.')
+
+        rgb = lighting_types == Constants.LightingType.RGB
+        fragments = np.empty((len(lighting_types), 5), dtype=np.uint8)
+        fragments[:, 0] = lighting_types
+        fragments[:, 1] = self._led_indices[mask]
+        fragments[:, 2:] = pixels & 0x7f
+        fragments[rgb, 2:] = pixels[rgb] >> 1
+
+        sizes = data_sizes + 2
+        payload = fragments[np.arange(5) < sizes[:, np.newaxis]]
+        builder = ColorspecBuilder(len(lighting_types), max_size=max_size)
+        builder.extend(payload.tobytes(), np.cumsum(sizes).tolist())
+        return builder.build()
@@ -0,0 +1,322 @@
+"""Recognition of gestures made with the buttons of the Launchpad Mini MK3.
+"""
+
+import heapq
+import itertools
+import time
+from .utils import ButtonEvent
+
+
+class Gesture:
+    """A gesture made with one or more buttons.
+    """
+    __slots__ = ('_buttons', '_timestamp')
+
+    LONG_PRESS = 'long_press'
+    DOUBLE_TAP = 'double_tap'
+    CHORD = 'chord'
+    SWIPE = 'swipe'
+
+    type = ''
+
+    def __init__(self, buttons, timestamp):
+        self._buttons = tuple(buttons)
+        self._timestamp = timestamp
+
+    def __eq__(self, other):
+        if not isinstance(other, Gesture):
+            return False
+        return (self.type == other.type
+                and self.names == other.names)
+
+    def __hash__(self):
+        return hash((self.type, self.names))
+
+    def __repr__(self):
+        names = list(map(lambda name: f"'{name}'", sorted(self.names)))
+        return f'{type(self).__name__}({names})'
+
+    @property
+    def buttons(self):
+        """Buttons of the gesture, in the order they were pressed.
+        """
+        return self._buttons
+
+    @property
+    def names(self):
+        """Names of the buttons of the gesture.
+        """
+        return frozenset(button.name for button in self._buttons)
+
+    @property
+    def button(self):
+        """First button of the gesture.
+        """
+        return self._buttons[0]
+
+    @property
+    def timestamp(self):
+        """Time at which the gesture was recognized.
+        """
+        return self._timestamp
+
+
+class LongPress(Gesture):
+    """A button held down for a while.
+    """
+    __slots__ = ()
+    type = Gesture.LONG_PRESS
+
+
+class DoubleTap(Gesture):
+    """A button pressed twice in quick succession.
+    """
+    __slots__ = ()
+    type = Gesture.DOUBLE_TAP
+
+
+class Chord(Gesture):
+    """Buttons pressed together.
+    """
+    __slots__ = ()
+    type = Gesture.CHORD
+
+
+class Swipe(Gesture):
+    """Adjacent buttons pressed one after the other
+    in a straight line.
+    """
+    __slots__ = ('_direction',)
+    type = Gesture.SWIPE
+
+    UP = 'up'
+    DOWN = 'down'
+    LEFT = 'left'
+    RIGHT = 'right'
+
+    def __init__(self, direction, buttons, timestamp):
+        super().__init__(buttons, timestamp)
+        self._direction = direction
+
+    def __eq__(self, other):
+        return (super().__eq__(other)
+                and self.direction == other.direction)
+
+    def __hash__(self):
+        return hash((self.type, self.names, self.direction))
+
+    def __repr__(self):
+        return f"Swipe('{self.direction}')"
+
+    @property
+    def direction(self):
+        """Direction of the swipe.
+        """
+        return self._direction
+
+
+class GestureRecognizer:
+    """Recognizes gestures in a stream of button events.
+
+    The recognizer does not wait on its own. Events are passed to
+    :meth:`feed` as they are received, and :meth:`poll` must be called
+    once the time returned by :meth:`timeout` has elapsed. Gestures
+    that depend on time, such as long presses, are kept in a single
+    heap of deadlines, so any number of buttons can be tracked at once
+    by the thread that reads events.
+
+    Examples
+    --------
+    Recognize gestures made on the grid:
+        >>> for gesture in lp.grid.buttons().gestures():
+        ...     print(gesture)
+        DoubleTap(['0x0'])
+        Swipe('right')
+        Chord(['0x0', '7x7'])
+    """
+
+    _DIRECTIONS = {
+        (0, -1): Swipe.UP,
+        (0, 1): Swipe.DOWN,
+        (-1, 0): Swipe.LEFT,
+        (1, 0): Swipe.RIGHT
+    }
+    _LONG_PRESS = 0
+    _CHORD = 1
+
+    def __init__(self, *,
+                 long_press=.5,
+                 double_tap=.3,
+                 chord=.05,
+                 swipe=.15,
+                 swipe_length=3,
+                 clock=time.monotonic):
+        """Creates a gesture recognizer.
+
+        Parameters
+        ----------
+        long_press : float, optional
+            Duration in seconds a button must be held to make a
+            long press.
+        double_tap : float, optional
+            Maximum duration in seconds between the two presses of
+            a double tap.
+        chord : float, optional
+            Maximum duration in seconds between the first and the
+            last press of a chord.
+        swipe : float, optional
+            Maximum duration in seconds between two presses of
+            a swipe.
+        swipe_length : int, optional
+            Number of buttons of a swipe.
+        clock : callable, optional
+            Monotonic clock returning seconds.
+        """
+        if min(long_press, double_tap, chord, swipe) <= 0:
+            raise ValueError('Durations must be positive.')
+        if swipe_length < 2:
+            raise ValueError("'swipe_length' must be at least 2.")
+        self._long_press = long_press
+        self._double_tap = double_tap
+        self._chord = chord
+        self._swipe = swipe
+        self._swipe_length = swipe_length
+        self._clock = clock
+        self._sequence = itertools.count()
+        self._deadlines = []
+        self._held = {}
+        self._last_presses = {}
+        self._chord_names = None
+        self._chord_deadline = 0
+        self._swipe_presses = []
+
+    def __repr__(self):
+        return f'GestureRecognizer(held={len(self._held)})'
+
+    def timeout(self):
+        """Returns the duration in seconds until the next call to
+        :meth:`poll` is due.
+
+        Returns
+        -------
+        float or None
+            Duration in seconds, or `None` if no gesture depends
+            on time.
+        """
+        if not self._deadlines:
+            return None
+        return max(self._deadlines[0][0] - self._clock(), 0)
+
+    def feed(self, event):
+        """Updates the recognizer with button event `event`.
+
+        Parameters
+        ----------
+        event : ButtonEvent
+            Button event received.
+
+        Returns
+        -------
+        list of Gesture
+            Gestures completed by the event.
+        """
+        button = event.button
+        if not button:
+            return []
+        now = self._clock()
+        if event.type == ButtonEvent.RELEASE:
+            self._held.pop(button.name, None)
+            return []
+        return self._press(button, now)
+
+    def poll(self):
+        """Returns the gestures whose deadline has passed.
+
+        Returns
+        -------
+        list of Gesture
+            Gestures completed since the last call.
+        """
+        now = self._clock()
+        gestures = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, sequence, kind, key = heapq.heappop(self._deadlines)
+            if kind == GestureRecognizer._CHORD:
+                gesture = self._end_chord(key, deadline)
+            else:
+                held = self._held.get(key)
+                gesture = (LongPress([held[0]], deadline)
+                           if held and held[1] == sequence
+                           else None)
+            if gesture:
+                gestures.append(gesture)
+        return gestures
+
+    def reset(self):
+        """Forgets all buttons and pending gestures.
+        """
+        self._deadlines.clear()
+        self._held.clear()
+        self._last_presses.clear()
+        self._chord_names = None
+        self._swipe_presses.clear()
+
+    def _press(self, button, now):
+        gestures = []
+        sequence = next(self._sequence)
+        self._held[button.name] = (button, sequence)
+        self._schedule(now + self._long_press, sequence,
+                       GestureRecognizer._LONG_PRESS, button.name)
+
+        last_press = self._last_presses.pop(button.name, None)
+        if last_press is not None and now - last_press <= self._double_tap:
+            gestures.append(DoubleTap([button], now))
+        else:
+            self._last_presses[button.name] = now
+
+        if self._chord_names is None or now > self._chord_deadline:
+            self._chord_names = [button.name]
+            self._chord_deadline = now + self._chord
+            self._schedule(self._chord_deadline, sequence,
+                           GestureRecognizer._CHORD, self._chord_names)
+        else:
+            self._chord_names.append(button.name)
+
+        swipe = self._extend_swipe(button, now)
+        if swipe:
+            gestures.append(swipe)
+        return gestures
+
+    def _schedule(self, deadline, sequence, kind, key):
+        heapq.heappush(self._deadlines, (deadline, sequence, kind, key))
+
+    def _end_chord(self, names, deadline):
+        if names is self._chord_names:
+            self._chord_names = None
+        buttons = [self._held[name][0]
+                   for name in dict.fromkeys(names)
+                   if name in self._held]
+        return (Chord(buttons, deadline)
+                if len(buttons) >= 2
+                else None)
+
+    def _extend_swipe(self, button, now):
+        presses = self._swipe_presses
+        if presses:
+            last_button, last_time = presses[-1]
+            step = (button.x - last_button.x, button.y - last_button.y)
+            if (now - last_time > self._swipe
+                    or step not in GestureRecognizer._DIRECTIONS
+                    or (len(presses) >= 2
+                        and step != (last_button.x - presses[-2][0].x,
+                                     last_button.y - presses[-2][0].y))):
+                presses.clear()
+        presses.append((button, now))
+        if len(presses) < self._swipe_length:
+            return None
+        step = (button.x - presses[-2][0].x, button.y - presses[-2][0].y)
+        swipe = Swipe(GestureRecognizer._DIRECTIONS[step],
+                      [pressed for pressed, _ in presses],
+                      now)
+        presses.clear()
+        return swipe
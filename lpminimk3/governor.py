@@ -0,0 +1,220 @@
+"""Output rate control for the Launchpad Mini MK3.
+"""
+
+import threading
+import time
+
+
+class RateGovernor:
+    """A governor that limits the rate at which MIDI messages are
+    written to a port.
+
+    Limits can be set in bytes per second, messages per second or
+    both. In token-bucket mode, writes are delayed whenever the
+    configured rates would be exceeded, allowing short bursts of up
+    to `burst` seconds worth of output. In adaptive mode, the
+    configured rates are also scaled down whenever writing takes longer
+    than `latency_target`, and slowly scaled back up as the device
+    keeps up again.
+
+    Examples
+    --------
+    Limit output of the MIDI interface to 20 kB/s:
+        >>> lp.set_governor(RateGovernor(bytes_per_second=20000))
+
+    Back off whenever the device takes longer than 2 ms to
+    accept a message:
+        >>> lp.set_governor(RateGovernor(bytes_per_second=20000,
+        ...                               mode=RateGovernor.ADAPTIVE,
+        ...                               latency_target=.002))
+    """
+
+    TOKEN_BUCKET = 'token_bucket'
+    ADAPTIVE = 'adaptive'
+
+    MIN_SCALE = .05
+    BACKOFF_FACTOR = .5
+    RECOVERY_STEP = .05
+    _MIN_DELAY = 1e-6
+
+    def __init__(self, *,
+                 bytes_per_second=None,
+                 messages_per_second=None,
+                 mode=TOKEN_BUCKET,
+                 burst=.05,
+                 latency_target=.002,
+                 clock=time.monotonic,
+                 sleep=time.sleep):
+        """Creates a rate governor.
+
+        Parameters
+        ----------
+        bytes_per_second : float or None, optional
+            Maximum number of bytes written per second.
+        messages_per_second : float or None, optional
+            Maximum number of messages written per second.
+        mode : str, optional
+            Governor mode. (Possible values: 'token_bucket', 'adaptive')
+        burst : float, optional
+            Duration in seconds of output that may be written at once.
+        latency_target : float, optional
+            Write duration in seconds above which an adaptive
+            governor backs off.
+        clock : callable, optional
+            Monotonic clock returning seconds.
+        sleep : callable, optional
+            Function called to wait a number of seconds.
+
+        Raises
+        ------
+        ValueError
+            If no rate is set, a rate is not positive or `mode`
+            is invalid.
+        """
+        if not bytes_per_second and not messages_per_second:
+            raise ValueError('Must set at least one rate.')
+        elif ((bytes_per_second is not None and bytes_per_second <= 0)
+                or (messages_per_second is not None
+                    and messages_per_second <= 0)):
+            raise ValueError('Rates must be positive.')
+        elif mode not in (RateGovernor.TOKEN_BUCKET, RateGovernor.ADAPTIVE):
+            raise ValueError('Must be a valid governor mode.')
+        self._bytes_per_second = bytes_per_second
+        self._messages_per_second = messages_per_second
+        self._mode = mode
+        self._burst = burst
+        self._latency_target = latency_target
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._scale = 1.0
+        self._byte_tokens = self._capacity(bytes_per_second)
+        self._message_tokens = self._capacity(messages_per_second)
+        self._last_refill = clock()
+        self._latency = 0.0
+
+    def __repr__(self):
+        return ('RateGovernor('
+                f'bytes_per_second={self.bytes_per_second}, '
+                f'messages_per_second={self.messages_per_second}, '
+                f"mode='{self.mode}')")
+
+    @property
+    def mode(self):
+        """Governor mode.
+        """
+        return self._mode
+
+    @property
+    def bytes_per_second(self):
+        """Current byte rate, or `None` if not limited.
+        """
+        return (self._bytes_per_second * self._scale
+                if self._bytes_per_second
+                else None)
+
+    @property
+    def messages_per_second(self):
+        """Current message rate, or `None` if not limited.
+        """
+        return (self._messages_per_second * self._scale
+                if self._messages_per_second
+                else None)
+
+    @property
+    def scale(self):
+        """Fraction of the configured rates currently allowed.
+        """
+        return self._scale
+
+    @property
+    def latency(self):
+        """Duration in seconds of the last recorded write.
+        """
+        return self._latency
+
+    def delay(self, size):
+        """Returns the duration in seconds a write of `size` bytes
+        would currently have to wait.
+
+        Parameters
+        ----------
+        size : int
+            Message size in bytes.
+
+        Returns
+        -------
+        float
+            Delay in seconds.
+        """
+        with self._lock:
+            self._refill()
+            return self._delay()
+
+    def acquire(self, size):
+        """Waits until a message of `size` bytes may be written,
+        then accounts for it.
+
+        Parameters
+        ----------
+        size : int
+            Message size in bytes.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                delay = self._delay()
+                if delay < RateGovernor._MIN_DELAY:
+                    if self._bytes_per_second:
+                        self._byte_tokens -= size
+                    if self._messages_per_second:
+                        self._message_tokens -= 1
+                    return
+            # Sleep without the lock, so that other threads can
+            # record latencies or read the current rates meanwhile.
+            self._sleep(delay)
+
+    def record_latency(self, latency):
+        """Records the duration of a write. Adaptive governors back
+        off when `latency` exceeds the latency target.
+
+        Parameters
+        ----------
+        latency : float
+            Write duration in seconds.
+        """
+        with self._lock:
+            self._latency = latency
+            if self._mode != RateGovernor.ADAPTIVE:
+                return
+            if latency > self._latency_target:
+                self._scale = max(self._scale * RateGovernor.BACKOFF_FACTOR,
+                                  RateGovernor.MIN_SCALE)
+            else:
+                self._scale = min(self._scale + RateGovernor.RECOVERY_STEP,
+                                  1.0)
+
+    def _capacity(self, rate):
+        return rate * self._burst if rate else 0
+
+    def _refill(self):
+        now = self._clock()
+        elapsed = max(now - self._last_refill, 0)
+        self._last_refill = now
+        if self._bytes_per_second:
+            self._byte_tokens = min(self._byte_tokens
+                                    + elapsed * self.bytes_per_second,
+                                    self._capacity(self.bytes_per_second))
+        if self._messages_per_second:
+            self._message_tokens = min(self._message_tokens
+                                       + elapsed * self.messages_per_second,
+                                       self._capacity(self.messages_per_second))  # noqa
+
+    def _delay(self):
+        delay = 0.0
+        if self._bytes_per_second and self._byte_tokens < 0:
+            delay = -self._byte_tokens / self.bytes_per_second
+        if self._messages_per_second and self._message_tokens < 0:
+            delay = max(delay,
+                        -self._message_tokens / self.messages_per_second)
+        return delay
@@ -4,6 +4,57 @@ from ..midi_messages import (Colorspec,
                              Constants)
 
 
+class _FrameClock:
+    """Schedules frames every `period` seconds from the first frame,
+    so that rendering time does not add up. Frames whose time slot has
+    already passed are late and should be dropped rather than sent.
+    """
+    def __init__(self, period):
+        self._period = period
+        self._start = time.monotonic()
+        self._frame = 0
+
+    def is_late(self):
+        next_frame_time = self._start + (self._frame + 1) * self._period
+        return time.monotonic() >= next_frame_time
+
+    def wait(self):
+        self._frame += 1
+        delay = self._start + self._frame * self._period - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _RenderPlan:
+    """LEDs lit by each bit of a bitmap rendered on a matrix with
+    a given rotation and flip, built once and shared by every frame.
+    """
+
+    _plans = {}
+
+    def __init__(self, matrix, angle, flip_axis):
+        leds = list(matrix.led_range(rotation=angle,
+                                     flip_axis=flip_axis))
+        self.names = tuple(led.name for led in leds)
+        self.midi_values = tuple(led.midi_value for led in leds)
+
+    @staticmethod
+    def get(matrix, angle, flip_axis):
+        """Returns the plan of `matrix` rotated by `angle` and
+        flipped along `flip_axis`.
+        """
+        # LEDs of a matrix are laid out the same on every Launchpad,
+        # so plans are shared by all matrices of the same type.
+        key = (type(matrix), angle, flip_axis)
+        plan = _RenderPlan._plans.get(key)
+        if plan is None:
+            plan = _RenderPlan._plans.setdefault(key,
+                                                 _RenderPlan(matrix,
+                                                             angle,
+                                                             flip_axis))
+        return plan
+
+
 class RawBitmapRenderer:
     def __init__(self,
                  raw_bitmap,
@@ -21,12 +72,12 @@ class RawBitmapRenderer:
 
     def render(self):
         colorspec_fragments = []
-        for led, bit in zip(self._matrix.led_range(rotation=self._angle,
-                                                   flip_axis=self._flip_axis),
-                            self._raw_bitmap):
-            bit_config = self._raw_bitmap.config[led.name]
+        plan = _RenderPlan.get(self._matrix, self._angle, self._flip_axis)
+        for name, led_index, bit in zip(plan.names,
+                                        plan.midi_values,
+                                        self._raw_bitmap):
+            bit_config = self._raw_bitmap.config[name]
             lighting_type = bit_config.lighting_type
-            led_index = led.midi_value
             lighting_data = self._determine_lighting_data(bit_config,
                                                           bit,
                                                           self._fg_color,
@@ -36,7 +87,8 @@ class RawBitmapRenderer:
                                          *lighting_data)
             colorspec_fragments.append(fragment)
         payload = Colorspec(*colorspec_fragments)
-        self._matrix.launchpad.send_message(payload)
+        with self._matrix.launchpad.batch():
+            self._matrix.launchpad.send_message(payload)
 
     def _determine_lighting_data(self, config, bit, fg_color, bg_color):
         lighting_data = []
@@ -90,19 +142,21 @@ class TextRenderer:
         time_left = self._timeout
         rotations_left = self._count
         text_width = len(self._text) * self._matrix.width
+        clock = _FrameClock(self._period)
         while time_left and rotations_left:
             for _ in range(text_width):
                 if self._direction == 'right':
                     self._string.shift_right()
                 else:
                     self._string.shift_left()
-                CharacterRenderer(self._string.character_to_render,
-                                  self._matrix,
-                                  angle=self._string.angle,
-                                  flip_axis=self._string.flip_axis).render()
+                if not clock.is_late() or _ == text_width - 1:
+                    CharacterRenderer(self._string.character_to_render,
+                                      self._matrix,
+                                      angle=self._string.angle,
+                                      flip_axis=self._string.flip_axis).render()  # noqa
                 if self._cycle_func:
                     self._cycle_func(_/text_width, self._matrix.launchpad)
-                time.sleep(self._period)
+                clock.wait()
                 time_left = (max(time_left - self._period, 0)
                              if time_left != -1
                              else time_left)
@@ -168,14 +222,16 @@ class MovieRenderer:
         self._count = -1 if not count else count
 
     def render(self):
-        period = 1 / self._framerate
+        clock = _FrameClock(1 / self._framerate)
         rotations_left = self._count
         while rotations_left:
-            for bitmap in self._raw_bitmaps:
-                renderer = RawBitmapRenderer(bitmap,
-                                             self._matrix)
-                renderer.render()
-                time.sleep(period)
+            last_index = len(self._raw_bitmaps) - 1
+            for index, bitmap in enumerate(self._raw_bitmaps):
+                if not clock.is_late() or index == last_index:
+                    renderer = RawBitmapRenderer(bitmap,
+                                                 self._matrix)
+                    renderer.render()
+                clock.wait()
             rotations_left = (max(rotations_left - 1, 0)
                               if rotations_left != -1
                               else rotations_left)
@@ -14,30 +14,30 @@ from collections import namedtuple
 from argparse import (ArgumentParser,
                       RawDescriptionHelpFormatter)
 from functools import partial
-from lpminimk3 import find_launchpads, Mode
+from lpminimk3 import find_launchpads, LaunchpadGroup, Mode
 from lpminimk3.graphics import Frame
 
 
 _connected_clients = []
 
 
-async def handler(lps, websocket, path):
+async def handler(group, websocket, path):
     if path == "/sync":
         _connected_clients.append(websocket)
         try:
             while True:
                 data = await websocket.recv()
                 json_data = json.loads(data)
-                for lp in lps:
-                    lp.grid.render(Frame(json_data))
+                group.grid.render(Frame(json_data))
                 websockets.broadcast(_connected_clients, data)
         finally:
             _connected_clients.remove(websocket)
 
 
 async def sync_with_sketch(lps, host, port):
-    async with websockets.serve(partial(handler, lps), host, port):
-        await asyncio.Future()
+    with LaunchpadGroup(lps) as group:
+        async with websockets.serve(partial(handler, group), host, port):
+            await asyncio.Future()
 
 
 def find_lps():
@@ -0,0 +1,367 @@
+"""Synchronized output to many Launchpad Mini MK3 devices.
+"""
+
+import threading
+import time
+from concurrent.futures import (ThreadPoolExecutor,
+                                wait)
+from . import _logging
+from .batch import LedBatch
+from .components import (Grid,
+                         Panel)
+from .framebuffer import Framebuffer
+from .midi_messages import (Colorspec,
+                            MidiMessage)
+from .shadow import LedShadow
+
+logger = _logging.getLogger(__name__)
+
+
+class GroupMember:
+    """A Launchpad of a :class:`LaunchpadGroup`, along with
+    statistics about the writes made to it.
+    """
+
+    def __init__(self, launchpad):
+        self._launchpad = launchpad
+        self._lock = threading.Lock()
+        self._future = None
+        self._latency = 0.0
+        self._max_latency = 0.0
+        self._write_count = 0
+        self._skipped_count = 0
+        self._error_count = 0
+        self._last_error = None
+
+    def __repr__(self):
+        return (f'GroupMember(launchpad={self.launchpad}, '
+                f'latency={self.latency}, '
+                f'error_count={self.error_count})')
+
+    @property
+    def launchpad(self):
+        """Launchpad reference.
+        """
+        return self._launchpad
+
+    @property
+    def latency(self):
+        """Duration in seconds of the last write.
+        """
+        return self._latency
+
+    @property
+    def max_latency(self):
+        """Longest write duration in seconds.
+        """
+        return self._max_latency
+
+    @property
+    def write_count(self):
+        """Number of messages written.
+        """
+        return self._write_count
+
+    @property
+    def skipped_count(self):
+        """Number of messages skipped because the Launchpad was
+        still busy writing a previous message.
+        """
+        return self._skipped_count
+
+    @property
+    def error_count(self):
+        """Number of messages that failed to be written.
+        """
+        return self._error_count
+
+    @property
+    def last_error(self):
+        """Last error raised while writing, or `None`.
+        """
+        return self._last_error
+
+    def is_busy(self):
+        """Returns `True` if a write to the Launchpad is still
+        in progress, otherwise returns `False`.
+
+        Returns
+        -------
+        bool
+            `True` if busy, otherwise `False`.
+        """
+        return self._future is not None and not self._future.done()
+
+    def _write(self, messages):
+        start = time.monotonic()
+        try:
+            for message in messages:
+                self._launchpad.send_raw(message)
+        except Exception as error:
+            with self._lock:
+                self._error_count += 1
+                self._last_error = error
+            logger.exception('Failed to write to %s.', self._launchpad)
+            return False
+        latency = time.monotonic() - start
+        with self._lock:
+            self._latency = latency
+            self._max_latency = max(self._max_latency, latency)
+            self._write_count += 1
+        return True
+
+
+class LaunchpadGroup:
+    """A group of Launchpads that display the same content.
+
+    Messages sent to the group are encoded once, then written to
+    all members at the same time from a pool of threads. The grid and
+    panel of the group can be used like those of a single Launchpad, so
+    renderables are rendered once for the whole group.
+
+    A member that fails to accept a message does not affect the
+    others. A member that is still busy writing a previous message
+    skips the new one. In both cases, the next LED update is sent in
+    full so that the member catches up. A group without Launchpads
+    accepts every message and writes nothing.
+
+    Examples
+    --------
+    Render a frame on all connected Launchpads:
+        >>> lps = find_launchpads()
+        >>> for lp in lps:
+        ...     lp.open()
+        ...     lp.mode = Mode.PROG
+        >>> group = LaunchpadGroup(lps)
+        >>> group.grid.render(Frame(data))
+
+    Find members that are slow to respond:
+        >>> [member.launchpad for member in group.members
+        ...  if member.latency > .005]
+    """
+
+    DEFAULT_TIMEOUT = 1
+
+    def __init__(self, launchpads, *,
+                 max_workers=None,
+                 timeout=DEFAULT_TIMEOUT,
+                 max_sysex_size=None):
+        """Creates a group of Launchpads.
+
+        Parameters
+        ----------
+        launchpads : list of LaunchpadMiniMk3
+            Launchpads of the group.
+        max_workers : int or None, optional
+            Number of writer threads. Defaults to one per Launchpad.
+        timeout : float or None, optional
+            Duration in seconds to wait for all members to
+            accept a message. Members still writing after that
+            are busy and skip the following messages. If `None`,
+            waits indefinitely.
+        max_sysex_size : int or None, optional
+            Maximum size in bytes of Colorspec messages. Larger
+            messages are split.
+        """
+        self._members = [GroupMember(launchpad) for launchpad in launchpads]
+        self._timeout = timeout
+        self._max_sysex_size = max_sysex_size
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._executor = ThreadPoolExecutor(max_workers=(max_workers
+                                                         or len(self._members)  # noqa
+                                                         or 1),
+                                            thread_name_prefix='lpminimk3-group')  # noqa
+        self._batch = LedBatch(self)
+        self._shadow = LedShadow()
+        self._framebuffers = {}
+        self._panel = Panel(self)
+        self._grid = Grid(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def __iter__(self):
+        return iter(self.launchpads)
+
+    def __len__(self):
+        return len(self._members)
+
+    def __repr__(self):
+        return f'LaunchpadGroup(size={len(self)})'
+
+    @property
+    def launchpads(self):
+        """Launchpads of the group.
+        """
+        return [member.launchpad for member in self._members]
+
+    @property
+    def members(self):
+        """Members of the group.
+
+        See Also
+        --------
+        GroupMember
+        """
+        return list(self._members)
+
+    @property
+    def max_sysex_size(self):
+        """Maximum size in bytes of Colorspec messages, or `None`
+        if not limited.
+        """
+        return self._max_sysex_size
+
+    @property
+    def shadow(self):
+        """Last known state of the LEDs of the group.
+
+        See Also
+        --------
+        LedShadow
+        """
+        return self._shadow
+
+    @property
+    def panel(self):
+        """Panel of the group.
+
+        See Also
+        --------
+        Panel
+        """
+        return self._panel
+
+    @property
+    def grid(self):
+        """Grid of the group.
+
+        See Also
+        --------
+        Grid
+        """
+        return self._grid
+
+    def batch(self):
+        """Returns the LED batch of the group.
+
+        See Also
+        --------
+        LedBatch
+        """
+        return self._batch
+
+    def framebuffer(self, matrix):
+        """Returns the framebuffer of matrix `matrix`, creating it
+        on first use. Requires NumPy.
+
+        Parameters
+        ----------
+        matrix : Matrix
+            Matrix of the group.
+
+        Returns
+        -------
+        Framebuffer
+            Framebuffer of matrix.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+
+        See Also
+        --------
+        Framebuffer
+        """
+        key = type(matrix).__name__
+        if key not in self._framebuffers:
+            self._framebuffers[key] = Framebuffer(matrix)
+        return self._framebuffers[key]
+
+    def send_message(self, msg):
+        """Sends message `msg` to the MIDI interface of every member.
+
+        Parameters
+        ----------
+        msg : MidiMessage or list
+            Message to send.
+
+        Returns
+        -------
+        bool
+            `True` if every member accepted the message, otherwise
+            `False`.
+
+        Raises
+        ------
+        TypeError
+            If `msg` is not a valid message.
+        """
+        if self._batch.collect(msg):
+            return True
+        if isinstance(msg, Colorspec) and self._max_sysex_size:
+            messages = msg.chunks(self._max_sysex_size)
+        elif isinstance(msg, MidiMessage):
+            messages = [msg.encoded]
+        elif isinstance(msg, (list, bytes, bytearray)) and len(msg):
+            messages = [bytes(msg)]
+        elif hasattr(msg, 'data'):
+            messages = [bytes(msg.data)]
+        else:
+            raise TypeError('Must be a valid MIDI message.')
+        return self._send(msg, messages)
+
+    def send_raw(self, data):
+        """Sends encoded MIDI message `data` to the MIDI interface of
+        every member without validating it.
+
+        Parameters
+        ----------
+        data : bytes
+            Encoded message.
+
+        Returns
+        -------
+        bool
+            `True` if every member accepted the message, otherwise
+            `False`.
+        """
+        return self._send(data, [data])
+
+    def close(self):
+        """Waits for pending writes and stops the writer threads.
+        The Launchpads are left open.
+        """
+        self._executor.shutdown(wait=True)
+
+    def _send(self, msg, messages):
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            futures = []
+            ok = True
+            for member in self._members:
+                if member.is_busy():
+                    member._skipped_count += 1
+                    ok = False
+                    continue
+                member._future = self._executor.submit(member._write,
+                                                       messages)
+                futures.append(member._future)
+        # Wait without holding the lock, so that a member that hangs
+        # only makes later messages skip that member.
+        done, not_done = wait(futures, timeout=self._timeout)
+        ok = (ok
+              and not not_done
+              and all(future.result() for future in done))
+        with self._lock:
+            if ok and sequence == self._sequence:
+                self._shadow.update(msg)
+            else:
+                self._shadow.invalidate()
+        return ok
@@ -2,7 +2,7 @@
 """
 
 from abc import ABC
-from .midi_messages import Lighting, Constants
+from .midi_messages import Constants
 
 
 class Match(ABC):
@@ -12,14 +12,29 @@ class Match(ABC):
     def contains(self, message):
         return False
 
+    def keys(self):
+        """Returns the (status, data) pairs that start the messages
+        this match may contain, or `None` if it may contain any message.
+
+        Returns
+        -------
+        frozenset or None
+            Message keys.
+        """
+        return None
+
 
 class ButtonMatch(Match):
     """A set of rules for filtering button events.
+
+    The messages that match are computed once, when the match
+    is created, so matching a message is a single set lookup.
     """
 
     def __init__(self, buttons, type):
         self._buttons = buttons
         self._type = type.lower().replace('|', '_')
+        self._messages = frozenset(self._determine_messages())
 
     def contains(self, message):
         """Returns `True` if message `message` is a valid button
@@ -31,23 +46,32 @@ class ButtonMatch(Match):
             `True` if provided message is a valid
             button message, otherwise `False`.
         """
-        button_messages = self._determine_messages()
-        for button_message in button_messages:
-            if message == button_message:
-                return True
-        return False
+        return (len(message) == 3
+                and (message[0], message[1], message[2]) in self._messages)
+
+    def keys(self):
+        """Returns the (status, MIDI value) pairs of the buttons
+        of this match.
+
+        Returns
+        -------
+        frozenset
+            Message keys.
+        """
+        return frozenset((message[0], message[1])
+                         for message in self._messages)
 
     def _determine_messages(self):
+        velocities = []
+        if self._type in ('press', 'press_release'):
+            velocities.append(Constants.MIDI_MAX_VALUE)
+        if self._type in ('release', 'press_release'):
+            velocities.append(Constants.MIDI_MIN_VALUE)
         messages = []
         for button in self._buttons:
             header = (Constants.MidiWord.NOTE_HEADER
                       if button.parent == 'grid'
                       else Constants.MidiWord.CC_HEADER)
-            if self._type == 'press':
-                messages.append(Lighting(header, button.midi_value, Constants.MIDI_MAX_VALUE).data)  # noqa
-            elif self._type == 'release':
-                messages.append(Lighting(header, button.midi_value, Constants.MIDI_MIN_VALUE).data)  # noqa
-            elif self._type == 'press_release':
-                messages.append(Lighting(header, button.midi_value, Constants.MIDI_MAX_VALUE).data)  # noqa
-                messages.append(Lighting(header, button.midi_value, Constants.MIDI_MIN_VALUE).data)  # noqa
+            for velocity in velocities:
+                messages.append((header, button.midi_value, velocity))
         return messages
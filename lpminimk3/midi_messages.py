@@ -2,13 +2,13 @@
 """
 
 from abc import ABC
-from functools import reduce
 
 
 class SysExMessages:
     """SysEx messages.
     """
     DEVICE_INQUIRY = [0xf0, 0x7e, 0xe7, 0xf0, 0x06, 0x01, 0xf7]
+    DEVICE_INQUIRY_REPLY = [0xf0, 0x7e]
 
     class Interfaces:
         """SysEx Interface messages.
@@ -16,6 +16,7 @@ class SysExMessages:
         DAW = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x10, 0x00, 0xf7]
         MIDI = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x10, 0x01, 0xf7]
         READBACK = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x10, 0xf7]
+        REPLY = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x10]
 
     class Layouts:
         """SysEx Layout messages.
@@ -27,6 +28,7 @@ class SysExMessages:
         DAW_FADERS = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x00, 0x0d, 0xf7]
         PROG = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x00, 0x7f, 0xf7]
         READBACK = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x00, 0xf7]
+        REPLY = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x00]
 
     class Modes:
         """SysEx Mode messages.
@@ -34,17 +36,26 @@ class SysExMessages:
         LIVE = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x0e, 0x00, 0xf7]
         PROG = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x0e, 0x01, 0xf7]
         READBACK = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x0e, 0xf7]
+        REPLY = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x0e]
 
 
 class MidiMessage(ABC):
     """MIDI message.
     """
+    __slots__ = ()
+
     @property
     def data(self):
         """Data.
         """
         return []
 
+    @property
+    def encoded(self):
+        """Data encoded as bytes, ready to be sent.
+        """
+        return bytes(self.data)
+
 
 class Constants:
     """Constants.
@@ -78,10 +89,61 @@ class Constants:
 class ColorspecFragment:
     """Colorspec fragment.
     """
+    __slots__ = ('_lighting_type', '_led_index', '_lighting_data',
+                 '_version')
+
+    _STATIC_LIGHTING_MODES = (Constants.LightingMode.STATIC,
+                              Constants.MidiWord.CC_HEADER)
+
     def __init__(self, lighting_type, led_index, *lighting_data):
         self._lighting_type = lighting_type
         self._led_index = led_index
         self._lighting_data = list(lighting_data)
+        self._version = 0
+
+    @classmethod
+    def from_lighting(cls, lighting):
+        """Creates a fragment with the same effect as the
+        lighting message `lighting`.
+
+        Parameters
+        ----------
+        lighting : Lighting
+            Lighting message.
+
+        Returns
+        -------
+        ColorspecFragment or None
+            Equivalent fragment, or `None` if `lighting`
+            cannot be expressed as a fragment.
+        """
+        if lighting.lighting_mode == Constants.LightingMode.OFF:
+            return cls(Constants.LightingType.STATIC,
+                       lighting.midi_value,
+                       0x0)
+        elif lighting.lighting_mode in cls._STATIC_LIGHTING_MODES:
+            return cls(Constants.LightingType.STATIC,
+                       lighting.midi_value,
+                       lighting.color_id)
+        return None
+
+    @property
+    def lighting_type(self):
+        """Lighting type.
+        """
+        return self._lighting_type
+
+    @property
+    def led_index(self):
+        """LED index.
+        """
+        return self._led_index
+
+    @property
+    def lighting_data(self):
+        """Lighting data.
+        """
+        return list(self._lighting_data)
 
     @property
     def data(self):
@@ -100,6 +162,7 @@ class ColorspecFragment:
             Lighting data.
         """
         self._lighting_data.extend(lighting_data)
+        self._version += 1
 
     def __repr__(self):
         return ('ColorspecFragment('
@@ -116,20 +179,80 @@ class ColorspecFragment:
 class Colorspec(MidiMessage):
     """Colorspec MIDI message.
     """
+    __slots__ = ('_start_clause', '_fragments', '_end_clause', '_encoded',
+                 '_version')
+
+    HEADER = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x03]
+
     def __init__(self, *fragments):
-        self._start_clause = [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x03]
+        self._start_clause = list(Colorspec.HEADER)
         self._fragments = list(fragments)
         self._end_clause = [0xf7]
+        self._encoded = None
+        self._version = None
 
     @MidiMessage.data.getter
     def data(self):
         """Data.
         """
-        payload = list(reduce(lambda data, fragment: data + fragment.data,
-                              self._fragments, []))  # noqa
-        return (self._start_clause
-                + payload
-                + self._end_clause)
+        return list(self.encoded)
+
+    @MidiMessage.encoded.getter
+    def encoded(self):
+        """Data encoded as bytes, ready to be sent. Encoded
+        once until a fragment is appended or changed.
+        """
+        # Fragment versions only grow, so their sum changes
+        # whenever one of the fragments changes.
+        version = sum(fragment._version for fragment in self._fragments)
+        if self._encoded is None or self._version != version:
+            self._version = version
+            self._encoded = self._build().pop()
+        return self._encoded
+
+    def chunks(self, max_size=None):
+        """Encodes this colorspec as one or more SysEx messages of
+        at most `max_size` bytes each. Fragments are never split
+        across messages.
+
+        Parameters
+        ----------
+        max_size : int or None, optional
+            Maximum size of a message in bytes. If `None`, a
+            single message is returned.
+
+        Returns
+        -------
+        list of bytes
+            Encoded messages.
+
+        Raises
+        ------
+        ValueError
+            If `max_size` cannot hold the SysEx header and trailer
+            around the largest fragment.
+        """
+        if (max_size is not None
+                and max_size < ColorspecBuilder.MIN_MESSAGE_SIZE):
+            raise ValueError(f"'max_size' must be at least "
+                             f"{ColorspecBuilder.MIN_MESSAGE_SIZE}.")
+        if max_size is None or len(self.encoded) <= max_size:
+            return [self.encoded]
+        return self._build(max_size)
+
+    def _build(self, max_size=None):
+        builder = ColorspecBuilder(len(self._fragments), max_size=max_size)
+        for fragment in self._fragments:
+            builder.add(fragment.lighting_type,
+                        fragment.led_index,
+                        *fragment.lighting_data)
+        return builder.build()
+
+    @property
+    def fragments(self):
+        """Fragments.
+        """
+        return list(self._fragments)
 
     def append(self, fragment):
         """Append fragment to colorspec.
@@ -146,18 +269,150 @@ class Colorspec(MidiMessage):
         if not isinstance(fragment, ColorspecFragment):
             raise ValueError('Must be a ColorspecFragment.')
         self._fragments.append(fragment)
+        self._encoded = None
 
     def __repr__(self):
         return f'Colorspec({self.data})'
 
 
+class ColorspecBuilder:
+    """Builder of encoded Colorspec messages.
+
+    Fragments are written one after the other into a preallocated
+    buffer, so building a message takes time proportional to its
+    size. If `max_size` is set, the fragments are split into as many
+    SysEx messages as needed to keep each message within `max_size`
+    bytes.
+
+    Examples
+    --------
+    Build a Colorspec message that turns two LEDs red:
+        >>> builder = ColorspecBuilder()
+        >>> builder.add(Constants.LightingType.STATIC, 0x51, 5)
+        >>> builder.add(Constants.LightingType.RGB, 0x52, 0x7f, 0x00, 0x00)
+        >>> messages = builder.build()
+    """
+
+    MAX_FRAGMENT_SIZE = 5
+    MIN_MESSAGE_SIZE = len(Colorspec.HEADER) + 1 + MAX_FRAGMENT_SIZE
+    _END_CLAUSE = 0xf7
+
+    def __init__(self, fragment_count=81, *, max_size=None):
+        """Creates a builder.
+
+        Parameters
+        ----------
+        fragment_count : int, optional
+            Expected number of fragments, used to size the buffer.
+        max_size : int or None, optional
+            Maximum size of a message in bytes.
+
+        Raises
+        ------
+        ValueError
+            If `max_size` cannot hold a single fragment.
+        """
+        if (max_size is not None
+                and max_size < ColorspecBuilder.MIN_MESSAGE_SIZE):
+            raise ValueError(f"'max_size' must be at least "
+                             f"{ColorspecBuilder.MIN_MESSAGE_SIZE}.")
+        self._max_size = max_size
+        self._buffer = bytearray(max(fragment_count, 1)
+                                 * ColorspecBuilder.MAX_FRAGMENT_SIZE)
+        self._size = 0
+        self._boundaries = []
+
+    def __len__(self):
+        return len(self._boundaries)
+
+    def add(self, lighting_type, led_index, *lighting_data):
+        """Adds a fragment.
+
+        Parameters
+        ----------
+        lighting_type : int
+            Lighting type.
+        led_index : int
+            LED index.
+        lighting_data : int
+            Lighting data.
+        """
+        end = self._size + 2 + len(lighting_data)
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(max(len(self._buffer), end)))
+        buffer = self._buffer
+        buffer[self._size] = lighting_type
+        buffer[self._size + 1] = led_index
+        buffer[self._size + 2:end] = bytes(lighting_data)
+        self._size = end
+        self._boundaries.append(end)
+
+    def extend(self, payload, boundaries):
+        """Adds fragments that are already encoded.
+
+        Parameters
+        ----------
+        payload : bytes
+            Encoded fragments, back to back.
+        boundaries : list of int
+            Offset in `payload` at which each fragment ends.
+        """
+        end = self._size + len(payload)
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(max(len(self._buffer), end)))
+        self._buffer[self._size:end] = payload
+        self._boundaries.extend(self._size + boundary
+                                for boundary in boundaries)
+        self._size = end
+
+    def build(self):
+        """Returns the encoded messages.
+
+        Returns
+        -------
+        list of bytes
+            Encoded messages.
+        """
+        payload = memoryview(self._buffer)
+        overhead = len(Colorspec.HEADER) + 1
+        max_payload = (self._max_size - overhead
+                       if self._max_size is not None
+                       else self._size)
+        messages = []
+        start = 0
+        chunk_end = 0
+        for boundary in self._boundaries:
+            if boundary - start > max_payload:
+                messages.append(self._message(payload[start:chunk_end]))
+                start = chunk_end
+            chunk_end = boundary
+        if chunk_end > start or not messages:
+            messages.append(self._message(payload[start:chunk_end]))
+        return messages
+
+    def _message(self, payload):
+        message = bytearray(len(Colorspec.HEADER) + len(payload) + 1)
+        message[:len(Colorspec.HEADER)] = bytes(Colorspec.HEADER)
+        message[len(Colorspec.HEADER):-1] = payload
+        message[-1] = ColorspecBuilder._END_CLAUSE
+        return bytes(message)
+
+
 class Lighting(MidiMessage):
     """Lighting MIDI message.
+
+    Lighting messages are immutable and encoded once,
+    when created.
     """
+    __slots__ = ('_lighting_mode', '_midi_value', '_color_id', '_encoded')
+
+    _static_table = None
+
     def __init__(self, lighting_mode, midi_value, color_id):
         self._lighting_mode = lighting_mode
         self._midi_value = midi_value
         self._color_id = color_id
+        self._encoded = bytes((lighting_mode, midi_value, color_id))
 
     def __repr__(self):
         return ('Lighting('
@@ -165,13 +420,53 @@ class Lighting(MidiMessage):
                 f'midi_value={self._midi_value}, '
                 f'color_id={self.color_id})')
 
+    @classmethod
+    def static(cls, midi_value, color_id):
+        """Returns the static lighting message that sets the LED at
+        `midi_value` to palette color `color_id`. Messages are taken
+        from a table built once, on first use.
+
+        Parameters
+        ----------
+        midi_value : int
+            MIDI value of LED.
+        color_id : int
+            Palette color ID.
+
+        Returns
+        -------
+        Lighting
+            Lighting message.
+
+        Raises
+        ------
+        ValueError
+            If `midi_value` or `color_id` is not a valid MIDI value.
+        """
+        if not 0 <= midi_value <= Constants.MIDI_MAX_VALUE:
+            raise ValueError(f"'midi_value' must be between 0 and "
+                             f"{Constants.MIDI_MAX_VALUE}.")
+        elif not 0 <= color_id <= Constants.MIDI_MAX_VALUE:
+            raise ValueError(f"'color_id' must be between 0 and "
+                             f"{Constants.MIDI_MAX_VALUE}.")
+        if cls._static_table is None:
+            cls._static_table = tuple(
+                    cls(Constants.LightingMode.STATIC, value, color)
+                    for value in range(Constants.MIDI_MAX_VALUE + 1)
+                    for color in range(Constants.MIDI_MAX_VALUE + 1))
+        return cls._static_table[(midi_value << 7) | color_id]
+
     @MidiMessage.data.getter
     def data(self):
         """Data.
         """
-        return [self._lighting_mode,
-                self._midi_value,
-                self._color_id]
+        return list(self._encoded)
+
+    @MidiMessage.encoded.getter
+    def encoded(self):
+        """Data encoded as bytes, ready to be sent.
+        """
+        return self._encoded
 
     @property
     def lighting_mode(self):
@@ -2,11 +2,15 @@
 """
 
 from abc import ABC
+from ._layouts import (PANEL_BUTTON_NAMES,
+                       PANEL_PROG_MODE_MIDI_LAYOUT,
+                       _MatrixTable)
 
 
 class Region(ABC):
     """A collection of LEDs on a matrix.
     """
+    __slots__ = ()
 
     def __len__(self):
         return len(self.button_names)
@@ -21,6 +25,7 @@ class Region(ABC):
 class Labeled(Region):
     """All labeled buttons on a panel.
     """
+    __slots__ = ()
 
     @Region.button_names.getter
     def button_names(self):
@@ -48,6 +53,7 @@ class Labeled(Region):
 class Custom(Region):
     """Custom region.
     """
+    __slots__ = ('_button_names',)
 
     def __init__(self, button_names):
         """Constructs a region whose buttons
@@ -66,3 +72,327 @@ class Custom(Region):
         """Button names for custom region.
         """
         return self._button_names
+
+
+class Mask(Region):
+    """A region of the panel stored as a bitmask.
+
+    Each of the 81 LEDs of the panel is a bit of an integer, so
+    regions are combined with the bitwise operators and testing
+    whether an LED is in a region takes constant time. Masks are
+    immutable. Their positions are those of the panel, with "up"
+    at (0, 0) and "stop_solo_mute" at (8, 8).
+
+    Examples
+    --------
+    Light up the border of the grid:
+        >>> border = Mask.rect(0, 1, 8, 8) - Mask.rect(1, 2, 6, 6)
+        >>> lp.panel.led_range(region=border).color = 'red'
+
+    Combine a mask with the labeled buttons:
+        >>> region = Mask.row(1) | Labeled()
+
+    Test whether a pressed button is in a mask:
+        >>> event = lp.panel.buttons().poll_for_event()
+        >>> event.button in region
+        True
+    """
+    __slots__ = ('_bits', '_names', '_coordinates', '_midi_values')
+
+    WIDTH = 9
+    HEIGHT = 9
+
+    _FULL = (1 << (WIDTH * HEIGHT)) - 1
+    _NAMES = ()
+    _INDEXES = {}
+    _COORDINATES = ()
+    _MIDI_VALUES = ()
+    _COLUMNS = ()
+    _ROTATIONS = {}
+
+    def __init__(self, bits=0):
+        """Creates a mask from integer `bits`, where bit ``y * 9 + x``
+        is set if the LED at (`x`, `y`) is in the region.
+
+        Parameters
+        ----------
+        bits : int, optional
+            Bitmask.
+
+        Raises
+        ------
+        ValueError
+            If `bits` has bits set beyond the 81 LEDs of the panel.
+        """
+        if bits < 0 or bits & ~Mask._FULL:
+            raise ValueError('Bits must be within the panel.')
+        self._bits = bits
+        self._names = None
+        self._coordinates = None
+        self._midi_values = None
+
+    @classmethod
+    def from_names(cls, button_names):
+        """Creates a mask of the buttons `button_names`.
+
+        Parameters
+        ----------
+        button_names : iterable of str
+            Button names.
+
+        Returns
+        -------
+        Mask
+            Mask of the buttons.
+
+        Raises
+        ------
+        ValueError
+            If a name is not a button of the panel.
+        """
+        bits = 0
+        for name in button_names:
+            index = cls._INDEXES.get(name)
+            if index is None:
+                raise ValueError(f"Invalid button name '{name}'.")
+            bits |= 1 << index
+        return cls(bits)
+
+    @classmethod
+    def from_region(cls, region):
+        """Creates a mask of the buttons of region `region`.
+
+        Parameters
+        ----------
+        region : Region
+            Region.
+
+        Returns
+        -------
+        Mask
+            Mask of the region.
+        """
+        if isinstance(region, Mask):
+            return region
+        return cls.from_names(region.button_names)
+
+    @classmethod
+    def rect(cls, x, y, width, height):
+        """Creates a mask of the rectangle of `width` by `height` LEDs
+        whose top left LED is at (`x`, `y`). Parts of the rectangle
+        outside the panel are left out.
+
+        Parameters
+        ----------
+        x : int
+            X position.
+        y : int
+            Y position.
+        width : int
+            Width of the rectangle.
+        height : int
+            Height of the rectangle.
+
+        Returns
+        -------
+        Mask
+            Mask of the rectangle.
+        """
+        left = max(x, 0)
+        right = min(x + width, cls.WIDTH)
+        top = max(y, 0)
+        bottom = min(y + height, cls.HEIGHT)
+        if right <= left or bottom <= top:
+            return cls()
+        row = ((1 << (right - left)) - 1) << left
+        return cls(row * cls._COLUMNS[bottom - top] << (top * cls.WIDTH))
+
+    @classmethod
+    def row(cls, y):
+        """Creates a mask of the row `y`.
+        """
+        return cls.rect(0, y, cls.WIDTH, 1)
+
+    @classmethod
+    def column(cls, x):
+        """Creates a mask of the column `x`.
+        """
+        return cls.rect(x, 0, 1, cls.HEIGHT)
+
+    @classmethod
+    def full(cls):
+        """Creates a mask of the whole panel.
+        """
+        return cls(cls._FULL)
+
+    def __len__(self):
+        return bin(self._bits).count('1')
+
+    def __bool__(self):
+        return self._bits != 0
+
+    def __iter__(self):
+        return iter(self.button_names)
+
+    def __contains__(self, item):
+        """Returns `True` if `item` is in the mask. `item` is a
+        button name, an (x, y) position or an object with a name,
+        such as a button or an LED.
+        """
+        if isinstance(item, tuple):
+            if len(item) != 2:
+                return False
+            x, y = item
+            if not (0 <= x < Mask.WIDTH and 0 <= y < Mask.HEIGHT):
+                return False
+            index = y * Mask.WIDTH + x
+        else:
+            index = Mask._INDEXES.get(getattr(item, 'name', item))
+            if index is None:
+                return False
+        return bool(self._bits >> index & 1)
+
+    def __eq__(self, other):
+        if not isinstance(other, Mask):
+            return False
+        return self._bits == other._bits
+
+    def __hash__(self):
+        return hash(self._bits)
+
+    def __repr__(self):
+        return f'Mask({hex(self._bits)})'
+
+    def __or__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Mask(self._bits | other._bits)
+
+    def __and__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Mask(self._bits & other._bits)
+
+    def __sub__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Mask(self._bits & ~other._bits)
+
+    def __xor__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Mask(self._bits ^ other._bits)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __invert__(self):
+        return Mask(Mask._FULL & ~self._bits)
+
+    @property
+    def bits(self):
+        """Bitmask.
+        """
+        return self._bits
+
+    @Region.button_names.getter
+    def button_names(self):
+        """Button names for mask, from left to right and
+        top to bottom.
+        """
+        if self._names is None:
+            self._names = [Mask._NAMES[index] for index in self._indexes()]
+        return self._names
+
+    @property
+    def coordinates(self):
+        """(x, y) positions of the LEDs of the mask, from left to right
+        and top to bottom.
+        """
+        if self._coordinates is None:
+            self._coordinates = tuple(Mask._COORDINATES[index]
+                                      for index in self._indexes())
+        return self._coordinates
+
+    @property
+    def midi_values(self):
+        """MIDI values of the LEDs of the mask in the programmer layout,
+        from left to right and top to bottom.
+        """
+        if self._midi_values is None:
+            self._midi_values = tuple(Mask._MIDI_VALUES[index]
+                                      for index in self._indexes())
+        return self._midi_values
+
+    def rotated(self, angle):
+        """Returns this mask rotated clockwise by `angle` degrees
+        around the center of the panel.
+
+        Parameters
+        ----------
+        angle : int
+            Angle of rotation. Must be a multiple of 90.
+
+        Returns
+        -------
+        Mask
+            Rotated mask.
+
+        Raises
+        ------
+        ValueError
+            If `angle` is not a multiple of 90.
+        """
+        if angle % 90:
+            raise ValueError('Angle must be a multiple of 90.')
+        targets = Mask._ROTATIONS[angle % 360]
+        bits = 0
+        for index in self._indexes():
+            bits |= targets[index]
+        return Mask(bits)
+
+    def _indexes(self):
+        bits = self._bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def _coerce(self, other):
+        if isinstance(other, Mask):
+            return other
+        elif isinstance(other, Region):
+            return Mask.from_region(other)
+        return None
+
+
+def _build_mask_tables():
+    table = _MatrixTable.get(PANEL_BUTTON_NAMES, PANEL_PROG_MODE_MIDI_LAYOUT)
+    Mask._COORDINATES = tuple((x, y)
+                              for y in range(Mask.HEIGHT)
+                              for x in range(Mask.WIDTH))
+    Mask._NAMES = tuple(table.names[coordinate]
+                        for coordinate in Mask._COORDINATES)
+    Mask._MIDI_VALUES = tuple(table.midi_values[coordinate]
+                              for coordinate in Mask._COORDINATES)
+    Mask._COLUMNS = tuple(sum(1 << (row * Mask.WIDTH) for row in range(height))
+                          for height in range(Mask.HEIGHT + 1))
+    Mask._INDEXES = {name: y * Mask.WIDTH + x
+                     for name, (x, y) in table.coordinates_by_name.items()}
+    size = Mask.WIDTH
+    for angle in (0, 90, 180, 270):
+        targets = []
+        for index in range(size * size):
+            y, x = divmod(index, size)
+            for _ in range(angle // 90):
+                x, y = size - 1 - y, x
+            targets.append(1 << (y * size + x))
+        Mask._ROTATIONS[angle] = tuple(targets)
+
+
+_build_mask_tables()
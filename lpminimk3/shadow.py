@@ -0,0 +1,153 @@
+"""Host-side shadow of the LED states of the Launchpad Mini MK3.
+"""
+
+import threading
+from .midi_messages import (Colorspec,
+                            ColorspecFragment,
+                            Constants,
+                            Lighting)
+
+
+class LedShadow:
+    """Last known state of every LED of a Launchpad.
+
+    The shadow is updated with every LED update written to the
+    MIDI interface of the Launchpad. It is used to skip updates
+    that would not change the state of an LED. States are keyed
+    by LED index (i.e. the MIDI value of the LED).
+
+    The shadow can only reflect updates sent by this library. If
+    the LEDs of the Launchpad are changed by any other means, the
+    shadow must be invalidated.
+
+    Examples
+    --------
+    Forget all known LED states so that the next render
+    is sent in full:
+        >>> lp.shadow.invalidate()
+    """
+
+    _DATA_SIZES = {
+            Constants.LightingType.STATIC: 1,
+            Constants.LightingType.FLASH: 2,
+            Constants.LightingType.PULSE: 1,
+            Constants.LightingType.RGB: 3
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states = {}
+        self._version = 0
+
+    def __len__(self):
+        return len(self._states)
+
+    def __repr__(self):
+        return f'LedShadow(known={len(self)})'
+
+    @property
+    def version(self):
+        """Number of times the shadow was updated or invalidated.
+        """
+        return self._version
+
+    def state(self, led_index):
+        """Returns the last known state of LED at `led_index`.
+
+        Parameters
+        ----------
+        led_index : int
+            LED index.
+
+        Returns
+        -------
+        tuple or None
+            Lighting type followed by lighting data, or `None`
+            if the state of the LED is unknown.
+        """
+        return self._states.get(led_index)
+
+    def update(self, message):
+        """Updates LED states with message `message`.
+
+        Parameters
+        ----------
+        message : MidiMessage or list or bytes
+            Message sent to the Launchpad.
+        """
+        with self._lock:
+            self._version += 1
+            if isinstance(message, Colorspec):
+                for fragment in message.fragments:
+                    self._states[fragment.led_index] = self._state(fragment)
+            elif isinstance(message, Lighting):
+                self._update_lighting(message)
+            elif isinstance(message, (list, bytes, bytearray)):
+                self._update_raw(message)
+
+    def changed(self, fragments):
+        """Returns fragments of `fragments` that would change
+        the state of an LED.
+
+        Parameters
+        ----------
+        fragments : list of ColorspecFragment
+            Fragments to compare.
+
+        Returns
+        -------
+        list of ColorspecFragment
+            Changed fragments.
+        """
+        with self._lock:
+            return [fragment for fragment in fragments
+                    if (self._states.get(fragment.led_index)
+                        != self._state(fragment))]
+
+    def invalidate(self, led_index=None):
+        """Forgets the state of LED at `led_index`, or of all
+        LEDs if `led_index` is `None`.
+
+        Parameters
+        ----------
+        led_index : int or None, optional
+            LED index.
+        """
+        with self._lock:
+            self._version += 1
+            if led_index is None:
+                self._states.clear()
+            else:
+                self._states.pop(led_index, None)
+
+    def _state(self, fragment):
+        return (fragment.lighting_type, *fragment.lighting_data)
+
+    def _update_lighting(self, lighting):
+        fragment = ColorspecFragment.from_lighting(lighting)
+        if fragment:
+            self._states[fragment.led_index] = self._state(fragment)
+        else:
+            self._states.pop(lighting.midi_value, None)
+
+    def _update_raw(self, message):
+        if (len(message) == 3
+                and (Constants.LightingMode.OFF
+                     <= message[0]
+                     <= Constants.MidiWord.CC_HEADER + 0x0f)):
+            self._update_lighting(Lighting(*message))
+        elif list(message[:len(Colorspec.HEADER)]) == Colorspec.HEADER:
+            self._update_colorspec(message)
+
+    def _update_colorspec(self, message):
+        position = len(Colorspec.HEADER)
+        end = len(message) - 1
+        while position < end:
+            size = LedShadow._DATA_SIZES.get(message[position])
+            if size is None or position + 2 + size > end:
+                self._states.clear()
+                return
+            self._states[message[position + 1]] = (message[position],
+                                                   *message[position + 2:
+                                                            position + 2 + size])  # noqa
+            position += 2 + size
@@ -0,0 +1,143 @@
+"""Host-side cache of the settings of the Launchpad Mini MK3.
+"""
+
+import threading
+import time
+from .midi_messages import SysExMessages
+
+
+class DeviceState:
+    """Last known interface, mode and layout of a Launchpad.
+
+    The state is updated with every setting written to the Launchpad
+    and with every readback reply received from it, so reading a
+    setting does not require a round trip to the device. Each setting
+    is stored as the SysEx message that reports it.
+
+    Settings expire `ttl` seconds after they were last updated. An
+    expired or unknown setting is read back from the Launchpad the
+    next time it is read.
+
+    Examples
+    --------
+    Read settings back from the Launchpad at most every 10 seconds:
+        >>> lp.state.ttl = 10
+
+    Forget all known settings:
+        >>> lp.state.invalidate()
+    """
+
+    INTERFACE = 'interface'
+    MODE = 'mode'
+    LAYOUT = 'layout'
+
+    _HEADERS = {
+        tuple(SysExMessages.Interfaces.REPLY): INTERFACE,
+        tuple(SysExMessages.Modes.REPLY): MODE,
+        tuple(SysExMessages.Layouts.REPLY): LAYOUT
+    }
+    _HEADER_SIZE = len(SysExMessages.Modes.REPLY)
+
+    def __init__(self, *, ttl=None, clock=time.monotonic):
+        """Creates an empty state.
+
+        Parameters
+        ----------
+        ttl : float or None, optional
+            Duration in seconds during which a setting is valid. If
+            `None`, settings are valid until invalidated.
+        clock : callable, optional
+            Monotonic clock returning seconds.
+        """
+        self._lock = threading.Lock()
+        self._settings = {}
+        self._ttl = ttl
+        self._clock = clock
+
+    def __len__(self):
+        return len(self._settings)
+
+    def __repr__(self):
+        return f'DeviceState(known={len(self)}, ttl={self._ttl})'
+
+    @property
+    def ttl(self):
+        """Duration in seconds during which a setting is valid,
+        or `None`.
+        """
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, ttl):
+        if ttl is not None and ttl < 0:
+            raise ValueError("'ttl' must not be negative.")
+        self._ttl = ttl
+
+    def get(self, name):
+        """Returns the last known value of setting `name`.
+
+        Parameters
+        ----------
+        name : str
+            Setting name. (Possible values: 'interface', 'mode', 'layout')
+
+        Returns
+        -------
+        MidiEvent or None
+            Message reporting the setting, or `None` if the setting
+            is unknown or expired.
+        """
+        setting = self._settings.get(name)
+        if setting is None:
+            return None
+        event, timestamp = setting
+        if self._ttl is not None and self._clock() - timestamp >= self._ttl:
+            return None
+        return event
+
+    def update(self, name, event):
+        """Sets the last known value of setting `name`.
+
+        Parameters
+        ----------
+        name : str
+            Setting name.
+        event : MidiEvent
+            Message reporting the setting.
+        """
+        with self._lock:
+            self._settings[name] = (event, self._clock())
+
+    def observe(self, event):
+        """Updates the setting reported by event `event`, if any.
+
+        Parameters
+        ----------
+        event : MidiEvent
+            Event received from the Launchpad.
+
+        Returns
+        -------
+        bool
+            `True` if a setting was updated, otherwise `False`.
+        """
+        name = self._HEADERS.get(tuple(event.message[:self._HEADER_SIZE]))
+        if name is None:
+            return False
+        self.update(name, event)
+        return True
+
+    def invalidate(self, name=None):
+        """Forgets the value of setting `name`, or of all settings if
+        `name` is `None`.
+
+        Parameters
+        ----------
+        name : str or None, optional
+            Setting name.
+        """
+        with self._lock:
+            if name is None:
+                self._settings.clear()
+            else:
+                self._settings.pop(name, None)
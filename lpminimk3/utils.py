@@ -6,11 +6,20 @@ representation (like components).
 """
 
 import enum
+import logging
+from collections import deque
+import threading
 import time
 import re
 import platform
 from . import _logging
 from .match import Match
+from .midi_messages import (Colorspec,
+                            ColorspecBuilder,
+                            Constants,
+                            MidiMessage)
+from .governor import RateGovernor
+from .writer import MidiWriter
 
 logger = _logging.getLogger(__name__)
 
@@ -23,6 +32,7 @@ class MidiEvent:
     A MIDI event is received every time the Launchpad's MIDI port
     is read.
     """
+    __slots__ = ('_message', '_deltatime')
 
     def __init__(self, message, deltatime=0):
         self._message = message
@@ -53,20 +63,416 @@ class MidiEvent:
                 f'deltatime={self.deltatime})')
 
 
+class MidiEventQueue:
+    """A bounded queue of MIDI events.
+
+    Events are put by the thread that reads a MIDI port and taken by
+    the threads waiting for them. When the queue is full, the oldest
+    event is dropped to make room for the newest one. Waiting threads
+    sleep until an event arrives or their deadline passes.
+    """
+
+    DEFAULT_SIZE = 1024
+
+    def __init__(self, size=DEFAULT_SIZE, *,
+                 match=None,
+                 clock=time.monotonic):
+        """Creates a queue.
+
+        Parameters
+        ----------
+        size : int, optional
+            Maximum number of events.
+        match : Match or list or None, optional
+            Criterion events must match to be put in the queue.
+        clock : callable, optional
+            Monotonic clock returning seconds.
+        """
+        if size < 1:
+            raise ValueError("'size' must be positive.")
+        self._events = deque(maxlen=size)
+        self._match = match
+        self._condition = threading.Condition()
+        self._clock = clock
+        self._dropped_count = 0
+
+    def __len__(self):
+        return len(self._events)
+
+    def __repr__(self):
+        return f'MidiEventQueue(pending={len(self)}, size={self.size})'
+
+    @property
+    def size(self):
+        """Maximum number of events.
+        """
+        return self._events.maxlen
+
+    @property
+    def dropped_count(self):
+        """Number of events dropped because the queue was full.
+        """
+        return self._dropped_count
+
+    def put(self, event):
+        """Puts event `event` in the queue.
+
+        Parameters
+        ----------
+        event : MidiEvent
+            Event to put.
+        """
+        if self._match and not self._matches(event, self._match):
+            return
+        with self._condition:
+            if len(self._events) == self._events.maxlen:
+                self._dropped_count += 1
+            self._events.append(event)
+            self._condition.notify_all()
+
+    def get(self, *, timeout=None, match=None):
+        """Takes the oldest event that matches `match` from the queue.
+        Events that do not match are left in the queue.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Duration in seconds to wait for an event. If `None`, waits
+            indefinitely.
+        match : Match or list or None, optional
+            Match criterion.
+
+        Returns
+        -------
+        MidiEvent or None
+            Event taken, or `None` if no event matched in time.
+        """
+        deadline = (self._clock() + timeout
+                    if timeout is not None
+                    else None)
+        with self._condition:
+            while True:
+                for index, event in enumerate(self._events):
+                    if self._matches(event, match):
+                        del self._events[index]
+                        return event
+                remaining = (deadline - self._clock()
+                             if deadline is not None
+                             else None)
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+    def clear(self):
+        """Discards all events.
+        """
+        with self._condition:
+            self._events.clear()
+
+    def _matches(self, event, match):
+        if not match:
+            return True
+        elif isinstance(match, list):
+            return match == event.message
+        elif isinstance(match, Match):
+            return match.contains(event.message)
+        return False
+
+
+class EventDispatcher:
+    """Delivers each MIDI event received on a port to every handler
+    interested in it.
+
+    Handlers are indexed by the status and data bytes of the messages
+    they accept, so dispatching an event only visits the handlers that
+    may want it. Handlers without keys receive every event.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handlers = {}
+        self._routes = {}
+        self._wildcards = ()
+
+    def __len__(self):
+        return len(self._handlers)
+
+    def __repr__(self):
+        return f'EventDispatcher(handlers={len(self)})'
+
+    def add(self, handler, keys=None):
+        """Adds handler `handler`.
+
+        Parameters
+        ----------
+        handler : callable
+            Function called with each event.
+        keys : iterable of tuple or None, optional
+            (status, data) pairs of the messages to deliver, or `None`
+            to deliver every message.
+        """
+        with self._lock:
+            self._handlers[handler] = (frozenset(keys)
+                                       if keys is not None
+                                       else None)
+            self._rebuild()
+
+    def remove(self, handler):
+        """Removes handler `handler`.
+
+        Parameters
+        ----------
+        handler : callable
+            Function added with :meth:`add`.
+        """
+        with self._lock:
+            if self._handlers.pop(handler, False) is not False:
+                self._rebuild()
+
+    def dispatch(self, event):
+        """Calls the handlers interested in event `event`.
+
+        Parameters
+        ----------
+        event : MidiEvent
+            Event received.
+        """
+        message = event.message
+        handlers = (self._routes.get((message[0], message[1]), ())
+                    if len(message) >= 2
+                    else ())
+        for handler in handlers + self._wildcards:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception('MIDI event handler failed.')
+
+    def _rebuild(self):
+        routes = {}
+        wildcards = []
+        for handler, keys in self._handlers.items():
+            if keys is None:
+                wildcards.append(handler)
+                continue
+            for key in keys:
+                routes[key] = routes.get(key, ()) + (handler,)
+        self._routes = routes
+        self._wildcards = tuple(wildcards)
+
+
+class PendingRequest:
+    """A request waiting for its reply.
+    """
+
+    __slots__ = ('_header', '_deadline', '_table', '_done', '_event')
+
+    def __init__(self, header, deadline, table):
+        self._header = header
+        self._deadline = deadline
+        self._table = table
+        self._done = threading.Event()
+        self._event = None
+
+    def __repr__(self):
+        return (f'PendingRequest(header={list(self._header)}, '
+                f'done={self.done()})')
+
+    @property
+    def header(self):
+        """Header of the expected reply.
+        """
+        return list(self._header)
+
+    @property
+    def deadline(self):
+        """Time after which the reply is no longer expected, or `None`.
+        """
+        return self._deadline
+
+    def done(self):
+        """Returns `True` if the reply was received, otherwise
+        returns `False`.
+
+        Returns
+        -------
+        bool
+            `True` if the reply was received, otherwise `False`.
+        """
+        return self._done.is_set()
+
+    def wait(self):
+        """Waits for the reply until the deadline of the request.
+        The request is withdrawn if the deadline is reached.
+
+        Returns
+        -------
+        MidiEvent or None
+            Reply received, or `None` if the deadline was reached.
+        """
+        remaining = (self._deadline - self._table._clock()
+                     if self._deadline is not None
+                     else None)
+        if remaining is None or remaining > 0:
+            self._done.wait(remaining)
+        self._table.cancel(self)
+        return self._event
+
+    def _resolve(self, event):
+        self._event = event
+        self._done.set()
+
+
+class PendingRequests:
+    """Requests sent to a device that are waiting for their replies.
+
+    Replies are matched with requests by their SysEx header. Requests
+    expecting the same header are answered in the order they were
+    made, and requests past their deadline are skipped. Replies
+    that no request is waiting for are left to other readers.
+
+    Examples
+    --------
+    Wait for the reply to a mode readback:
+        >>> request = port.pending_requests.add([0xf0, 0x00, 0x20, 0x29,
+        ...                                      0x02, 0x0d, 0x0e],
+        ...                                     timeout=1)
+        >>> lp.send_message(SysExMessages.Modes.READBACK)
+        >>> request.wait()
+    """
+
+    def __init__(self, *, clock=time.monotonic):
+        """Creates an empty table.
+
+        Parameters
+        ----------
+        clock : callable, optional
+            Function returning the current time in seconds.
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._header_sizes = ()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(requests) for requests in self._requests.values())
+
+    def __repr__(self):
+        return f'PendingRequests(size={len(self)})'
+
+    def add(self, header, *, timeout=None):
+        """Adds a request expecting a reply that starts with `header`.
+        The request must be added before it is sent, so that
+        the reply cannot be missed.
+
+        Parameters
+        ----------
+        header : list or bytes
+            Header of the expected reply.
+        timeout : float or None, optional
+            Duration in seconds to wait for the reply. If `None`,
+            waits indefinitely.
+
+        Returns
+        -------
+        PendingRequest
+            Request.
+        """
+        header = tuple(header)
+        if not header:
+            raise ValueError('Must have a header.')
+        deadline = (self._clock() + timeout
+                    if timeout is not None
+                    else None)
+        request = PendingRequest(header, deadline, self)
+        with self._lock:
+            self._requests.setdefault(header, deque()).append(request)
+            self._header_sizes = tuple(sorted({len(header)
+                                               for header in self._requests},
+                                              reverse=True))
+        return request
+
+    def cancel(self, request):
+        """Withdraws request `request`.
+
+        Parameters
+        ----------
+        request : PendingRequest
+            Request returned by :meth:`add`.
+        """
+        with self._lock:
+            requests = self._requests.get(request._header)
+            if requests and request in requests:
+                requests.remove(request)
+                if not requests:
+                    self._remove(request._header)
+
+    def resolve(self, event):
+        """Answers the oldest pending request that expects event
+        `event` as its reply.
+
+        Parameters
+        ----------
+        event : MidiEvent
+            Event received.
+
+        Returns
+        -------
+        bool
+            `True` if a request was answered, otherwise `False`.
+        """
+        message = event.message
+        if not self._header_sizes:
+            return False
+        now = self._clock()
+        with self._lock:
+            for size in self._header_sizes:
+                header = tuple(message[:size])
+                requests = self._requests.get(header)
+                while requests:
+                    request = requests.popleft()
+                    if request._deadline is None or request._deadline > now:
+                        if not requests:
+                            self._remove(header)
+                        request._resolve(event)
+                        return True
+                if requests is not None:
+                    self._remove(header)
+        return False
+
+    def _remove(self, header):
+        del self._requests[header]
+        self._header_sizes = tuple(sorted({len(header)
+                                           for header in self._requests},
+                                          reverse=True))
+
+
 class ButtonEvent:
     """A button event.
 
     A button event is received every time a button on the Launchpad
     is pushed.
     """
+    __slots__ = ('_midi_event', '_button', '_type')
 
     PRESS = 'press'
     RELEASE = 'release'
     PRESS_RELEASE = 'press_release'
 
     def __init__(self, midi_event, buttons):
+        """Creates a button event.
+
+        Parameters
+        ----------
+        midi_event : MidiEvent
+            MIDI event received.
+        buttons : dict or list of Button
+            Buttons that may have sent the event, or a dict mapping
+            MIDI values to those buttons.
+        """
         self._midi_event = midi_event
         self._button = self._determine_button(midi_event, buttons)
+        self._type = self._determine_type(midi_event)
 
     def __eq__(self, other):
         if not isinstance(other, ButtonEvent):
@@ -79,6 +485,12 @@ class ButtonEvent:
                 f"type='{self.type}', "
                 f"deltatime={self.deltatime})")
 
+    @property
+    def midi_event(self):
+        """MIDI event.
+        """
+        return self._midi_event
+
     @property
     def message(self):
         """Message.
@@ -101,21 +513,144 @@ class ButtonEvent:
     def type(self):
         """Type.
         """
-        if not self._midi_event:
+        return self._type
+
+    def _determine_type(self, midi_event):
+        if not midi_event:
             return ''
         return (ButtonEvent.RELEASE
-                if self._midi_event
-                and len(self._midi_event.message) == 3
-                and self._midi_event.message[2] == 0x0
+                if len(midi_event.message) == 3
+                and midi_event.message[2] == 0x0
                 else ButtonEvent.PRESS)
 
     def _determine_button(self, midi_event, buttons):
-        found_buttons = (list(filter(lambda b: b.midi_value == midi_event.message[1], buttons))  # noqa
-                         if midi_event and midi_event.message and len(midi_event.message) == 3  # noqa
-                         else None)
-        return (found_buttons[0]
-                if found_buttons and len(found_buttons)
-                else None)
+        if (not midi_event
+                or not midi_event.message
+                or len(midi_event.message) != 3):
+            return None
+        midi_value = midi_event.message[1]
+        if isinstance(buttons, dict):
+            return buttons.get(midi_value)
+        for button in buttons:
+            if button.midi_value == midi_value:
+                return button
+        return None
+
+
+class ButtonState:
+    """Buttons currently held down on a Launchpad.
+
+    The state is a bitmap updated with every button event received.
+    Bit `n` is set while note `n` is held and bit `128 + n` is set
+    while control change `n` is held, so the state of any set of
+    buttons is known in constant time.
+
+    Examples
+    --------
+    Check whether "up" and "down" are held together:
+        >>> lp.panel.buttons('up', 'down').is_pressed()
+        False
+    """
+
+    CC_OFFSET = 0x80
+    NOTE_OFF = 0x80
+
+    def __init__(self):
+        self._bits = 0
+
+    def __len__(self):
+        return bin(self._bits).count('1')
+
+    def __repr__(self):
+        return f'ButtonState(pressed={len(self)})'
+
+    @property
+    def bits(self):
+        """Bitmap of the buttons held down.
+        """
+        return self._bits
+
+    @staticmethod
+    def bit(status, midi_value):
+        """Returns the bit of the button that sends messages with
+        status `status` and MIDI value `midi_value`.
+
+        Parameters
+        ----------
+        status : int
+            Status byte of the messages sent by the button.
+        midi_value : int
+            MIDI value of the button.
+
+        Returns
+        -------
+        int
+            Bit of the button.
+        """
+        if status & 0xf0 == Constants.MidiWord.CC_HEADER:
+            return 1 << (ButtonState.CC_OFFSET + midi_value)
+        return 1 << midi_value
+
+    def update(self, event):
+        """Updates the state with event `event`.
+
+        Parameters
+        ----------
+        event : MidiEvent
+            Event received.
+        """
+        message = event.message
+        if len(message) != 3:
+            return
+        status = message[0] & 0xf0
+        if status == Constants.MidiWord.CC_HEADER:
+            bit = 1 << (ButtonState.CC_OFFSET + message[1])
+        elif (status == Constants.MidiWord.NOTE_HEADER
+                or status == ButtonState.NOTE_OFF):
+            bit = 1 << message[1]
+        else:
+            return
+        if message[2] and status != ButtonState.NOTE_OFF:
+            self._bits |= bit
+        else:
+            self._bits &= ~bit
+
+    def is_pressed(self, mask):
+        """Returns `True` if all buttons of bitmap `mask` are
+        held down, otherwise returns `False`.
+
+        Parameters
+        ----------
+        mask : int
+            Bitmap of buttons.
+
+        Returns
+        -------
+        bool
+            `True` if all buttons are held down, otherwise `False`.
+        """
+        return bool(mask) and self._bits & mask == mask
+
+    def any_pressed(self, mask):
+        """Returns `True` if any button of bitmap `mask` is
+        held down, otherwise returns `False`.
+
+        Parameters
+        ----------
+        mask : int
+            Bitmap of buttons.
+
+        Returns
+        -------
+        bool
+            `True` if a button is held down, otherwise `False`.
+        """
+        return bool(self._bits & mask)
+
+    def clear(self):
+        """Forgets all held buttons.
+        """
+        self._bits = 0
 
 
 class MidiPort:
@@ -126,6 +661,8 @@ class MidiPort:
     IN = 'in'
     DEFAULT_CLIENT_NAME = 'lpminimk3'
 
+    _POLL_QUEUE_SIZE = 16
+
     def __init__(self, port_name, port_number, port_index,
                  system_port_name, *, direction,
                  midi_in=None, midi_out=None,
@@ -138,8 +675,20 @@ class MidiPort:
         self._midi_out = midi_out
         self._direction = direction
         self._virtual = virtual
+        self._writer = None
+        self._governor = None
+        self._max_sysex_size = None
+        self._events = MidiEventQueue()
+        self._events_subscribed = False
+        self._dispatcher = EventDispatcher()
+        self._requests = PendingRequests()
+        self._handle = (midi_in
+                        if direction == MidiPort.IN
+                        else midi_out)
         if midi_in:
             midi_in.ignore_types(sysex=False, timing=False)
+            if direction == MidiPort.IN:
+                midi_in.set_callback(self._on_message)
 
     def __eq__(self, other):
         if not isinstance(other, MidiPort):
@@ -227,10 +776,12 @@ class MidiPort:
 
             if platform.system() != 'Windows' and platform.system() != 'Darwin':  # noqa
                 self._midi_in.set_client_name(MidiPort.DEFAULT_CLIENT_NAME)
+            self._midi_in.set_callback(self._on_message)
 
     def close(self):
         """Closes MIDI port.
         """
+        self.stop_writer()
         if self.is_open():
             if self._midi_out and self._direction == MidiPort.OUT:
                 self._midi_out.close_port()
@@ -238,45 +789,266 @@ class MidiPort:
                 self._midi_in.close_port()
 
     def send_message(self, message):
-        """Sends raw MIDI message to Launchpad.
+        """Sends raw MIDI message to Launchpad. If a background
+        writer is running, the message is queued instead.
 
         Parameters
         ----------
         message : list of str
             Message of raw integers to send to Launchpad.
         """
-        if (not message
-                or (not isinstance(message, list)
-                    and not hasattr(message, 'data'))):
+        if (not isinstance(message, MidiMessage)
+                and (not message
+                     or (not isinstance(message, list)
+                         and not hasattr(message, 'data')))):
             raise TypeError('Message must be of type list or MidiMessage.')
-        message = (message.data
-                   if hasattr(message, 'data')
-                   else message)
+        if self._writer:
+            self._writer.put(message)
+        else:
+            self._write(message)
 
-        if self._midi_in and self._direction == MidiPort.IN:
-            self._midi_in.send_message(message)
-            logger.debug(f'MIDI message sent: {message}')
-        elif self._midi_out and self._direction == MidiPort.OUT:
-            self._midi_out.send_message(message)
-            logger.debug(f'MIDI message sent: {message}')
+    def send_raw(self, data):
+        """Sends encoded MIDI message `data` to Launchpad without
+        validating it. This is the fastest way to send a message.
+
+        Parameters
+        ----------
+        data : bytes
+            Encoded message.
+
+        See Also
+        --------
+        MidiMessage.encoded
+        """
+        if self._writer:
+            self._writer.put(data)
+        else:
+            self._write_data(data)
+
+    def start_writer(self, *, queue_size=MidiWriter.DEFAULT_QUEUE_SIZE):
+        """Starts writing messages sent to this port from a
+        background thread.
+
+        Parameters
+        ----------
+        queue_size : int, optional
+            Maximum number of pending messages.
+
+        Returns
+        -------
+        MidiWriter
+            Writer of this port.
+
+        See Also
+        --------
+        MidiWriter
+        """
+        if not self._writer:
+            self._writer = MidiWriter(self._write, queue_size=queue_size)
+            self._writer.start()
+        return self._writer
+
+    def stop_writer(self):
+        """Writes all pending messages and stops the
+        background writer of this port.
+        """
+        writer, self._writer = self._writer, None
+        if writer:
+            writer.stop()
+
+    @property
+    def writer(self):
+        """Background writer, or `None` if messages are
+        written by the sending thread.
+        """
+        return self._writer
+
+    @property
+    def governor(self):
+        """Rate governor, or `None` if output is not limited.
+
+        See Also
+        --------
+        RateGovernor
+        """
+        return self._governor
+
+    @governor.setter
+    def governor(self, governor):
+        if governor is not None and not isinstance(governor, RateGovernor):
+            raise TypeError('Must be of type RateGovernor.')
+        self._governor = governor
+
+    @property
+    def max_sysex_size(self):
+        """Maximum size in bytes of a Colorspec message written to
+        this port, or `None` if not limited. Larger messages are split.
+        """
+        return self._max_sysex_size
+
+    @max_sysex_size.setter
+    def max_sysex_size(self, size):
+        minimum_size = (len(Colorspec.HEADER) + 1
+                        + ColorspecBuilder.MAX_FRAGMENT_SIZE)
+        if size is not None and size < minimum_size:
+            raise ValueError(f'Must be at least {minimum_size}.')
+        self._max_sysex_size = size
+
+    def _write(self, message):
+        if isinstance(message, Colorspec) and self._max_sysex_size:
+            for chunk in message.chunks(self._max_sysex_size):
+                self._write_data(chunk)
+        elif isinstance(message, MidiMessage):
+            self._write_data(message.encoded)
+        elif hasattr(message, 'data'):
+            self._write_data(message.data)
         else:
+            self._write_data(message)
+
+    def _write_data(self, data):
+        handle = self._handle
+        if not handle:
             raise RuntimeError('Failed to send message.')
 
-    def poll_for_event(self, *, timeout=5, match=None, read_delay=.001):
-        """Polls for button event.
+        governor = self._governor
+        if governor:
+            governor.acquire(len(data))
+            start = time.monotonic()
+            handle.send_message(data)
+            governor.record_latency(time.monotonic() - start)
+        else:
+            handle.send_message(data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('MIDI message sent: %s', list(data))
+
+    def add_listener(self, listener, *, match=None):
+        """Calls `listener` with every :class:`MidiEvent` received on
+        this port that may match `match`. Listeners are called from the
+        thread that reads the port, so they should return quickly.
+
+        Parameters
+        ----------
+        listener : callable
+            Function called with each event.
+        match : Match or list or None, optional
+            Match used to skip events the listener is not
+            interested in.
+        """
+        self._dispatcher.add(listener, self._keys(match))
+
+    def remove_listener(self, listener):
+        """Stops calling listener `listener`.
+
+        Parameters
+        ----------
+        listener : callable
+            Function added with :meth:`add_listener`.
+        """
+        self._dispatcher.remove(listener)
+
+    def subscribe(self, *, match=None, size=MidiEventQueue.DEFAULT_SIZE):
+        """Returns a queue that receives every event received on this
+        port from now on that matches `match`. Every subscriber
+        receives its own copy of each event.
 
         Parameters
         ----------
-        timeout : int
-            Timeout in seconds.
+        match : Match or list or None, optional
+            Match criterion.
+        size : int, optional
+            Maximum number of events kept in the queue.
+
+        Returns
+        -------
+        MidiEventQueue
+            Queue of events.
+        """
+        events = MidiEventQueue(size, match=match)
+        self.add_listener(events.put, match=match)
+        return events
+
+    def unsubscribe(self, events):
+        """Stops putting events in queue `events`.
+
+        Parameters
+        ----------
+        events : MidiEventQueue
+            Queue returned by :meth:`subscribe`.
+        """
+        self.remove_listener(events.put)
+
+    @property
+    def event_queue(self):
+        """Queue of received events read by :meth:`poll_for_event`
+        when no match is given. The queue receives events from the
+        first time it is used, or from the first such call.
+
+        See Also
+        --------
+        MidiEventQueue
+        """
+        if not self._events_subscribed:
+            self._dispatcher.add(self._events.put)
+            self._events_subscribed = True
+        return self._events
+
+    @property
+    def dispatcher(self):
+        """Dispatcher of the events received on this port.
+
+        See Also
+        --------
+        EventDispatcher
+        """
+        return self._dispatcher
+
+    @property
+    def pending_requests(self):
+        """Requests waiting for a reply on this port. Replies to
+        these requests are not delivered to listeners.
+
+        See Also
+        --------
+        PendingRequests
+        """
+        return self._requests
+
+    def _keys(self, match):
+        if isinstance(match, Match):
+            return match.keys()
+        elif isinstance(match, list) and len(match) >= 2:
+            return [(match[0], match[1])]
+        return None
+
+    def _on_message(self, raw_event, data=None):
+        event = MidiEvent(*raw_event)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('MIDI event: %s', event)
+        if not self._requests.resolve(event):
+            self._dispatcher.dispatch(event)
+
+    def poll_for_event(self, *, timeout=5, match=None, read_delay=None):
+        """Waits for a button event. Events are received in the
+        background, so waiting does not use the CPU.
+
+        Without `match`, events are read from :attr:`event_queue`, so
+        events received between two calls are not missed. With
+        `match`, only events that match and are received during the
+        call are returned; other events are not kept.
+
+        Parameters
+        ----------
+        timeout : float or None
+            Timeout in seconds. If `None` or zero, waits
+            indefinitely.
         match : Match or None
             Button match.
-        read_delay : float
-            Delay duration between reads.
+        read_delay : float or None
+            Unused. Kept for compatibility.
 
         Returns
         -------
-        ButtonEvent or None
+        MidiEvent or None
             Received event.
 
         See Also
@@ -284,34 +1056,31 @@ class MidiPort:
         Match
         """
         assert self._midi_in
-        event = None
-        polling = True
-        elapsed = 0 if timeout else -1
-        timeout = 0 if not timeout else timeout
-        timeout = 0 if timeout < 0 else timeout
-        while polling and timeout > elapsed:
+        if timeout is not None and timeout < 0:
+            return None
+        timeout = timeout if timeout else None
+        try:
+            if not match:
+                return self.event_queue.get(timeout=timeout)
+            events = self.subscribe(match=match,
+                                    size=MidiPort._POLL_QUEUE_SIZE)
             try:
-                raw_message = self._midi_in.get_message()
-                event = MidiEvent(*raw_message) if raw_message else None
-                if event:
-                    logger.debug(f'MIDI event: {event}')
-
-                if event and not match:
-                    polling = False
-                elif event and isinstance(match, list) and match == event.message:  # noqa
-                    polling = False
-                elif event and isinstance(match, Match) and match.contains(event.message):  # noqa
-                    polling = False
-                time.sleep(read_delay)
-                elapsed += .1 if timeout and timeout > 0 else 0
-            except KeyboardInterrupt:
-                logger.debug('\nPolling terminated.')
-                raise
-        return event
-
-    def clear_event_queue(self, *, read_delay=.001):
-        while self._midi_in and self._midi_in.get_message():
-            time.sleep(read_delay)
+                return events.get(timeout=timeout)
+            finally:
+                self.unsubscribe(events)
+        except KeyboardInterrupt:
+            logger.debug('\nPolling terminated.')
+            raise
+
+    def clear_event_queue(self, *, read_delay=None):
+        """Discards all received events.
+
+        Parameters
+        ----------
+        read_delay : float or None
+            Unused. Kept for compatibility.
+        """
+        self._events.clear()
 
 
 class Interface:
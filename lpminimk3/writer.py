@@ -0,0 +1,264 @@
+"""Background writing of MIDI messages to the Launchpad Mini MK3.
+"""
+
+import queue
+import threading
+from collections import OrderedDict
+from . import _logging
+from .midi_messages import (Colorspec,
+                            ColorspecFragment,
+                            Lighting)
+
+logger = _logging.getLogger(__name__)
+
+
+class MidiWriter:
+    """A writer thread that sends MIDI messages on behalf of
+    the threads producing them.
+
+    Messages are put in a bounded queue that is drained by a
+    dedicated thread. LED updates that are still pending when a newer
+    update of the same kind for the same LED arrives are replaced by
+    the newer update, so only the latest static color and the latest
+    flashing or pulsing color of an LED are ever written. Pending LED
+    updates are written as a single :class:`Colorspec` message
+    whenever possible. All other messages are written in the order
+    they were put, and LED updates are never moved across them.
+    A message is queued either whole or not at all.
+
+    Examples
+    --------
+    Write LED updates from a background thread:
+        >>> writer = lp.start_writer()
+        >>> for led in lp.grid.led_range():
+        ...     led.color = 'red'
+        >>> writer.flush()
+        True
+    """
+
+    DEFAULT_QUEUE_SIZE = 256
+
+    def __init__(self, write, *, queue_size=DEFAULT_QUEUE_SIZE):
+        """Creates a writer that sends messages with `write`.
+
+        Parameters
+        ----------
+        write : callable
+            Function called with each message to send.
+        queue_size : int, optional
+            Maximum number of pending messages.
+        """
+        if queue_size < 1:
+            raise ValueError("'queue_size' must be positive.")
+        self._write = write
+        self._queue_size = queue_size
+        self._condition = threading.Condition()
+        self._pending = OrderedDict()
+        self._barriers = 0
+        self._busy = False
+        self._running = False
+        self._thread = None
+        self._max_depth = 0
+        self._put_count = 0
+        self._coalesced_count = 0
+        self._written_count = 0
+        self._error_count = 0
+
+    def __repr__(self):
+        return ('MidiWriter('
+                f'depth={self.depth}, '
+                f'queue_size={self.queue_size})')
+
+    @property
+    def queue_size(self):
+        """Maximum number of pending messages.
+        """
+        return self._queue_size
+
+    @property
+    def depth(self):
+        """Number of pending messages.
+        """
+        return len(self._pending)
+
+    @property
+    def max_depth(self):
+        """Highest number of pending messages seen.
+        """
+        return self._max_depth
+
+    @property
+    def put_count(self):
+        """Number of messages put.
+        """
+        return self._put_count
+
+    @property
+    def coalesced_count(self):
+        """Number of LED updates replaced by a newer update.
+        """
+        return self._coalesced_count
+
+    @property
+    def written_count(self):
+        """Number of messages written.
+        """
+        return self._written_count
+
+    @property
+    def error_count(self):
+        """Number of messages that failed to be written.
+        """
+        return self._error_count
+
+    def is_running(self):
+        """Returns `True` if the writer thread is running,
+        otherwise returns `False`.
+
+        Returns
+        -------
+        bool
+            `True` if writer is running, otherwise `False`.
+        """
+        return self._running
+
+    def start(self):
+        """Starts the writer thread.
+        """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run,
+                                            name='lpminimk3-writer',
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self, *, timeout=None):
+        """Writes all pending messages and stops the writer thread.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Duration in seconds to wait for the writer to stop.
+        """
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def put(self, message, *, timeout=None):
+        """Puts message `message` in the queue.
+
+        Parameters
+        ----------
+        message : MidiMessage or list
+            Message to write.
+        timeout : float or None, optional
+            Duration in seconds to wait for room in the queue.
+
+        Raises
+        ------
+        queue.Full
+            If the queue is still full after `timeout`.
+        RuntimeError
+            If the writer is not running.
+        """
+        with self._condition:
+            if not self._running:
+                raise RuntimeError('Writer not running.')
+            updates = OrderedDict(self._split(message))
+            if not self._condition.wait_for(lambda: self._has_room(updates),
+                                            timeout):
+                raise queue.Full('Writer queue full.')
+            elif not self._running:
+                raise RuntimeError('Writer not running.')
+            for key, update in updates.items():
+                if key in self._pending:
+                    self._coalesced_count += 1
+                    self._pending.move_to_end(key)
+                self._pending[key] = update
+            self._put_count += 1
+            self._max_depth = max(self._max_depth, len(self._pending))
+            self._condition.notify_all()
+
+    def flush(self, *, timeout=None):
+        """Waits until all pending messages are written.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Duration in seconds to wait.
+
+        Returns
+        -------
+        bool
+            `True` if all messages were written, otherwise `False`.
+        """
+        with self._condition:
+            return self._condition.wait_for(self._is_idle, timeout)
+
+    def _has_room(self, updates):
+        if not self._running or not self._pending:
+            return True
+        needed = sum(key not in self._pending for key in updates)
+        return len(self._pending) + needed <= self._queue_size
+
+    def _is_idle(self):
+        return not self._pending and not self._busy
+
+    def _split(self, message):
+        if isinstance(message, Colorspec):
+            return [((self._barriers, fragment.led_index, None), fragment)
+                    for fragment in message.fragments]
+        elif isinstance(message, Lighting):
+            fragment = ColorspecFragment.from_lighting(message)
+            if fragment:
+                return [((self._barriers, message.midi_value, None),
+                         fragment)]
+            return [((self._barriers,
+                      message.midi_value,
+                      message.lighting_mode), message)]
+        self._barriers += 1
+        return [((self._barriers, None, None), message)]
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: (self._pending
+                                                  or not self._running))
+                if not self._pending:
+                    break
+                updates = list(self._pending.values())
+                self._pending.clear()
+                self._busy = True
+                self._condition.notify_all()
+            for message in self._merge(updates):
+                self._write_message(message)
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+    def _merge(self, updates):
+        fragments = []
+        for update in updates:
+            if isinstance(update, ColorspecFragment):
+                fragments.append(update)
+                continue
+            if fragments:
+                yield Colorspec(*fragments)
+                fragments = []
+            yield update
+        if fragments:
+            yield Colorspec(*fragments)
+
+    def _write_message(self, message):
+        try:
+            self._write(message)
+            self._written_count += 1
+        except Exception:
+            self._error_count += 1
+            logger.exception('Failed to write MIDI message.')
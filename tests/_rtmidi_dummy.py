@@ -12,10 +12,24 @@ class MidiIn:
         self._port_number = -1
         self._port_name = ''
         self._port_open = False
+        self._callback = None
+        self._callback_data = None
 
     def ignore_types(self, *args, **kwargs):
         pass
 
+    def set_callback(self, func, data=None):
+        self._callback = func
+        self._callback_data = data
+
+    def cancel_callback(self):
+        self._callback = None
+        self._callback_data = None
+
+    def receive(self, message, deltatime=0):
+        if self._callback:
+            self._callback((message, deltatime), self._callback_data)
+
     def is_port_open(self):
         return self._port_open
 
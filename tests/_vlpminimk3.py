@@ -14,6 +14,16 @@ CLIENT_ID = 36
 
 DUMMY_MIDI_MESSAGE = [0x90, 0x90, 0x90]
 DUMMY_MIDI_EVENT = MidiEvent(DUMMY_MIDI_MESSAGE, 0)
+DEVICE_INQUIRY_REPLY = [0xf0, 0x7e, 0x00, 0x06, 0x02, 0x00, 0x20, 0x29,
+                        0x13, 0x01, 0x00, 0x00, 0x00, 0x01, 0x02, 0x03, 0xf7]
+SETTINGS = {
+        tuple(message): tuple(messages.READBACK)
+        for messages in (SysExMessages.Interfaces,
+                         SysExMessages.Modes,
+                         SysExMessages.Layouts)
+        for name, message in vars(messages).items()
+        if name.isupper() and name not in ('READBACK', 'REPLY')
+    }
 
 
 class VirtualMidiEvent(MidiEvent):
@@ -57,6 +67,9 @@ class VirtualMidiPort(MidiPort):
     def send_message(self, message, *args, **kwargs):
         self.sent_message = message
 
+    def send_raw(self, data):
+        self.sent_message = data
+
     def poll_for_event(self, *args, **kwargs):
         return DUMMY_MIDI_EVENT
 
@@ -71,6 +84,12 @@ class VirtualLaunchpadMiniMk3(LaunchpadMiniMk3):
         self.sent_message = None
         self._event_from_message = None
         self._event_from_button = None
+        self._replies = {
+                tuple(SysExMessages.Interfaces.READBACK): SysExMessages.Interfaces.MIDI,  # noqa
+                tuple(SysExMessages.Modes.READBACK): SysExMessages.Modes.LIVE,
+                tuple(SysExMessages.Layouts.READBACK): SysExMessages.Layouts.SESSION,  # noqa
+                tuple(SysExMessages.DEVICE_INQUIRY): DEVICE_INQUIRY_REPLY
+            }
 
     @property
     def returned_event(self):
@@ -78,30 +97,15 @@ class VirtualLaunchpadMiniMk3(LaunchpadMiniMk3):
                 if self._event_from_message
                 else self._event_from_button)
 
-    def send_message(self, message, *args, **kwargs):  # noqa
+    def send_message(self, message, *args, **kwargs):
         self.sent_message = message
-        if self.sent_message == SysExMessages.Interfaces.MIDI:
-            self._event_from_message  = MidiEvent(SysExMessages.Interfaces.MIDI, 0)  # noqa
-        elif self.sent_message == SysExMessages.Interfaces.DAW:
-            self._event_from_message = MidiEvent(SysExMessages.Interfaces.DAW, 0)  # noqa
-        elif self.sent_message == SysExMessages.Modes.LIVE:
-            self._event_from_message = MidiEvent(SysExMessages.Modes.LIVE, 0)
-        elif self.sent_message == SysExMessages.Modes.PROG:
-            self._event_from_message = MidiEvent(SysExMessages.Modes.PROG, 0)
-        elif self.sent_message == SysExMessages.Layouts.SESSION:
-            self._event_from_message = MidiEvent(SysExMessages.Layouts.SESSION, 0)  # noqa
-        elif self.sent_message == SysExMessages.Layouts.CUSTOM_1:
-            self._event_from_message = MidiEvent(SysExMessages.Layouts.CUSTOM_1, 0)  # noqa
-        elif self.sent_message == SysExMessages.Layouts.CUSTOM_2:
-            self._event_from_message = MidiEvent(SysExMessages.Layouts.CUSTOM_2, 0)  # noqa
-        elif self.sent_message == SysExMessages.Layouts.CUSTOM_3:
-            self._event_from_message = MidiEvent(SysExMessages.Layouts.CUSTOM_3, 0)  # noqa
-        elif self.sent_message == SysExMessages.Layouts.DAW_FADERS:
-            self._event_from_message = MidiEvent(SysExMessages.Layouts.DAW_FADERS, 0)  # noqa
-        elif self.sent_message == SysExMessages.Layouts.PROG:
-            self._event_from_message = MidiEvent(SysExMessages.Layouts.PROG, 0)
-        elif self.sent_message == SysExMessages.DEVICE_INQUIRY:
-            self._event_from_message = MidiEvent(SysExMessages.Modes.PROG, 0)
+        key = tuple(message) if isinstance(message, list) else None
+        if key in SETTINGS:
+            self._event_from_message = MidiEvent(message, 0)
+            self._replies[SETTINGS[key]] = message
+        elif key in self._replies:
+            super().send_message(message, *args, **kwargs)
+            self.midi_in_port.midi_in_handle.receive(list(self._replies[key]))
         else:
             super().send_message(message, *args, **kwargs)
 
@@ -112,12 +116,7 @@ class VirtualLaunchpadMiniMk3(LaunchpadMiniMk3):
             self._event_from_button = kwargs['midi_event']
 
     def poll_for_event(self, *args, **kwargs):
-        if (self.sent_message == SysExMessages.Interfaces.READBACK
-                or self.sent_message == SysExMessages.Modes.READBACK
-                or self.sent_message == SysExMessages.Layouts.READBACK
-                or self.sent_message == SysExMessages.DEVICE_INQUIRY):
-            return self._event_from_message
-        elif self._event_from_button:
+        if self._event_from_button:
             return self._event_from_button
         return super().poll_for_event(*args, **kwargs)
 
@@ -128,6 +127,7 @@ class VirtualLaunchpadMiniMk3(LaunchpadMiniMk3):
 
 def create_virtual_launchpad(*, client_id=CLIENT_ID):
     midi_out = MidiOut(API_RTMIDI_DUMMY, CLIENT_NAME)
+    daw_midi_in = MidiIn(API_RTMIDI_DUMMY, CLIENT_NAME)
     midi_in = MidiIn(API_RTMIDI_DUMMY, CLIENT_NAME)
     midi_client = VirtualMidiClient(CLIENT_NAME, client_id)
 
@@ -136,7 +136,7 @@ def create_virtual_launchpad(*, client_id=CLIENT_ID):
                                   IN_PORTS['daw']['port_index'],
                                   IN_PORTS['daw']['system_port_name'],
                                   direction=VirtualMidiPort.IN,
-                                  midi_in=midi_in)
+                                  midi_in=daw_midi_in)
     midi_in_port = VirtualMidiPort(IN_PORTS['midi']['port_name'],
                                    IN_PORTS['midi']['port_number'],
                                    IN_PORTS['midi']['port_index'],
@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+from lpminimk3 import AsyncLaunchpadMiniMk3
+from lpminimk3.graphics import Bitmap
+from lpminimk3.graphics.art import Bitmaps
+from lpminimk3.midi_messages import Lighting
+from tests._vlpminimk3 import create_virtual_launchpad
+
+
+class TestAsyncLaunchpadMiniMk3(unittest.TestCase):
+    def setUp(self):
+        self.lp = create_virtual_launchpad()
+        self.alp = AsyncLaunchpadMiniMk3(self.lp)
+
+    def tearDown(self):
+        self.lp.close()
+
+    def receive(self, message):
+        self.lp.midi_in_port.midi_in_handle.receive(message)
+
+    def run_async(self, coroutine):
+        async def run():
+            await self.alp.open()
+            try:
+                return await coroutine()
+            finally:
+                await self.alp.close()
+        return asyncio.run(run())
+
+    def test_open(self):
+        async def check():
+            self.assertTrue(self.alp.is_open(), 'Device not open.')
+        self.run_async(check)
+        self.assertFalse(self.alp.is_open(), 'Device still open.')
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.alp.send(Lighting.static(0x51, 5)))
+
+    def test_send(self):
+        async def send():
+            await self.alp.send(Lighting.static(0x51, 5))
+        self.run_async(send)
+        self.assertEqual(self.lp.sent_message,
+                         Lighting.static(0x51, 5),
+                         'Message mismatch.')
+
+    def test_render(self):
+        async def render():
+            await self.alp.render(Bitmap(Bitmaps.PLUG))
+        self.run_async(render)
+        self.assertIsNotNone(self.lp.midi_out_port.sent_message,
+                             'Bitmap not rendered.')
+
+    def test_next_event(self):
+        async def wait():
+            waiter = asyncio.ensure_future(self.alp.buttons('0x0').next_event(type='press'))  # noqa
+            await asyncio.sleep(.01)
+            self.receive([0x90, 0x52, 0x7f])
+            self.receive([0x90, 0x51, 0x00])
+            self.receive([0x90, 0x51, 0x7f])
+            return await asyncio.wait_for(waiter, 1)
+        event = self.run_async(wait)
+        self.assertEqual(event.button.name, '0x0', 'Button mismatch.')
+        self.assertEqual(event.type, 'press', 'Event type mismatch.')
+
+    def test_next_event_filtered_before_queued(self):
+        self.alp = AsyncLaunchpadMiniMk3(self.lp, queue_size=2)
+
+        async def wait():
+            waiter = asyncio.ensure_future(self.alp.buttons('0x0').next_event(type='press'))  # noqa
+            await asyncio.sleep(.01)
+            self.receive([0x90, 0x51, 0x7f])
+            for _ in range(10):
+                self.receive([0x90, 0x52, 0x7f])
+            return await asyncio.wait_for(waiter, 1)
+        event = self.run_async(wait)
+        self.assertEqual(event.button.name, '0x0',
+                         'Event lost to unrelated events.')
+
+    def test_button_match_cached(self):
+        buttons = self.alp.buttons('0x0')
+        self.assertIs(buttons._match('press'), buttons._match('press'),
+                      'Match not cached.')
+        with self.assertRaises(ValueError):
+            buttons._match('hold')
+
+    def test_next_event_timeout(self):
+        async def wait():
+            event = await self.alp.next_event(timeout=.01)
+            self.assertEqual(self.alp._subscribers['midi'], [],
+                             'Subscription not removed.')
+            with self.assertRaises(ValueError):
+                await self.alp.next_event(interface='foo', timeout=.01)
+            return event
+        self.assertIsNone(self.run_async(wait), 'Event received.')
+
+    def test_events(self):
+        async def collect():
+            events = []
+
+            async def consume():
+                async for event in self.alp.events():
+                    events.append(event.message)
+                    if len(events) == 2:
+                        break
+            consumer = asyncio.ensure_future(consume())
+            await asyncio.sleep(.01)
+            self.receive([0x90, 0x51, 0x7f])
+            self.receive([0x90, 0x51, 0x00])
+            await asyncio.wait_for(consumer, 1)
+            return events
+        self.assertEqual(self.run_async(collect),
+                         [[0x90, 0x51, 0x7f], [0x90, 0x51, 0x00]],
+                         'Event mismatch.')
+
+
+if __name__ == '__main__':
+    unittest.main()
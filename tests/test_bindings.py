@@ -0,0 +1,91 @@
+import unittest
+from lpminimk3.bindings import Bindings
+from lpminimk3.midi_messages import Lighting
+from lpminimk3.region import Labeled
+from tests._vlpminimk3 import create_virtual_launchpad
+
+
+class TestBindings(unittest.TestCase):
+    def setUp(self):
+        self.lp = create_virtual_launchpad()
+        self.lp.open()
+        self.midi_in = self.lp.midi_in_port.midi_in_handle
+        self.midi_out_port = self.lp.midi_out_port
+
+    def tearDown(self):
+        self.lp.bindings.stop()
+        self.lp.close()
+
+    def test_momentary(self):
+        with self.lp.bindings as bindings:
+            bindings.bind(self.lp.grid.buttons('0x0'), 5)
+            self.midi_in.receive([0x90, 0x51, 0x7f])
+            self.assertEqual(self.midi_out_port.sent_message,
+                             Lighting.static(0x51, 5).encoded,
+                             'LED not lit.')
+            self.assertEqual(self.lp.shadow.state(0x51), (0x00, 0x05),
+                             'Shadow not updated.')
+
+            self.midi_in.receive([0x90, 0x51, 0x0])
+            self.assertEqual(self.midi_out_port.sent_message,
+                             Lighting.static(0x51, 0).encoded,
+                             'LED not turned off.')
+
+        self.midi_out_port.sent_message = None
+        self.midi_in.receive([0x90, 0x51, 0x7f])
+        self.assertIsNone(self.midi_out_port.sent_message,
+                          'Stopped bindings responded.')
+
+    def test_toggle(self):
+        self.lp.bindings.bind(Labeled(), 'green', mode=Bindings.TOGGLE)
+        self.lp.bindings.start()
+        self.assertEqual(len(self.lp.bindings), 17, 'Binding count mismatch.')
+
+        self.midi_in.receive([0xb0, 0x63, 0x7f])
+        self.assertEqual(self.midi_out_port.sent_message,
+                         Lighting.static(0x63, 0x0d).encoded,
+                         'LED not lit.')
+        self.midi_out_port.sent_message = None
+        self.midi_in.receive([0xb0, 0x63, 0x0])
+        self.assertIsNone(self.midi_out_port.sent_message,
+                          'Release toggled LED.')
+        self.midi_in.receive([0xb0, 0x63, 0x7f])
+        self.assertEqual(self.midi_out_port.sent_message,
+                         Lighting.static(0x63, 0).encoded,
+                         'LED not toggled off.')
+
+    def test_flash(self):
+        self.lp.bindings.bind(self.lp.grid.buttons('0x0'), 5,
+                              lighting='flash')
+        self.lp.bindings.start()
+        self.midi_in.receive([0x90, 0x51, 0x7f])
+        self.assertEqual(self.midi_out_port.sent_message,
+                         bytes([0x91, 0x51, 0x05]),
+                         'LED not flashing.')
+        self.midi_in.receive([0x90, 0x51, 0x0])
+        self.assertEqual(self.midi_out_port.sent_message,
+                         Lighting.static(0x51, 0).encoded,
+                         'LED not turned off.')
+
+    def test_unbind(self):
+        self.lp.bindings.start()
+        self.lp.bindings.bind(self.lp.grid.buttons(), 'red',
+                              mode=Bindings.LATCH)
+        self.lp.bindings.unbind(self.lp.grid.buttons('0x0'))
+        self.assertEqual(len(self.lp.bindings), 63, 'Binding not removed.')
+
+        self.midi_out_port.sent_message = None
+        self.midi_in.receive([0x90, 0x51, 0x7f])
+        self.assertIsNone(self.midi_out_port.sent_message,
+                          'Unbound button responded.')
+
+        self.lp.bindings.unbind()
+        self.assertEqual(len(self.lp.bindings), 0, 'Bindings not removed.')
+        with self.assertRaises(ValueError):
+            self.lp.bindings.bind(self.lp.grid.buttons(), 'red', mode='hold')
+        with self.assertRaises(ValueError):
+            self.lp.bindings.bind(self.lp.grid.buttons(), 'not a color')
+
+
+if __name__ == '__main__':
+    unittest.main()
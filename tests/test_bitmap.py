@@ -1,6 +1,7 @@
 import unittest
 from lpminimk3.graphics import Bitmap
 from lpminimk3.graphics.art import Bitmaps
+from lpminimk3.graphics._renderer import _RenderPlan
 from lpminimk3.colors import ColorPalette
 from tests._vlpminimk3 import create_virtual_launchpad
 
@@ -178,6 +179,41 @@ class TestBitmap(unittest.TestCase):
     def test_render(self):
         self.lp.grid.render(Bitmap(Bitmaps.PLUG))
 
+    def test_render_unchanged(self):
+        self.lp.grid.render(Bitmap(Bitmaps.PLUG))
+        self.assertEqual(len(self.lp.shadow), 64, 'Shadow not updated.')
+
+        self.lp.midi_out_port.sent_message = None
+        self.lp.grid.render(Bitmap(Bitmaps.PLUG))
+        self.assertIsNone(self.lp.midi_out_port.sent_message,
+                          'Unchanged bitmap sent.')
+
+        self.lp.grid.led('0x0').color = 5
+        self.lp.grid.render(Bitmap(Bitmaps.PLUG))
+        self.assertEqual(len(self.lp.midi_out_port.sent_message.fragments),
+                         1,
+                         'Only changed LED must be sent.')
+
+        self.lp.shadow.invalidate()
+        self.lp.grid.render(Bitmap(Bitmaps.PLUG))
+        self.assertEqual(len(self.lp.midi_out_port.sent_message.fragments),
+                         64,
+                         'Bitmap not sent in full.')
+
+    def test_render_plan(self):
+        plan = _RenderPlan.get(self.lp.grid, 90, 'x')
+        self.assertIs(plan, _RenderPlan.get(self.lp.grid, 90, 'x'),
+                      'Plan not shared.')
+        leds = list(self.lp.grid.led_range(rotation=90, flip_axis='x'))
+        self.assertEqual(plan.midi_values,
+                         tuple(led.midi_value for led in leds),
+                         'MIDI value mismatch.')
+        self.assertEqual(plan.names,
+                         tuple(led.name for led in leds),
+                         'Name mismatch.')
+        self.assertIsNot(plan, _RenderPlan.get(self.lp.panel, 90, 'x'),
+                         'Plan shared across matrices.')
+
     def test_print(self):
         Bitmap(Bitmaps.PLUG).print()
 
@@ -0,0 +1,110 @@
+import unittest
+from lpminimk3 import LaunchpadGroup
+from lpminimk3.midi_messages import (Colorspec,
+                                     ColorspecFragment,
+                                     Constants)
+from tests._vlpminimk3 import create_virtual_launchpad
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'NumPy not installed.')
+class TestFramebuffer(unittest.TestCase):
+    def setUp(self):
+        self.lp = create_virtual_launchpad()
+        self.lp.open()
+
+    def tearDown(self):
+        self.lp.close()
+
+    def test_shape(self):
+        framebuffer = self.lp.grid.framebuffer
+        self.assertEqual(framebuffer.pixels.shape, (8, 8, 3),
+                         'Shape mismatch.')
+        self.assertEqual(framebuffer.lighting_types.shape, (8, 8),
+                         'Shape mismatch.')
+        self.assertEqual(self.lp.panel.framebuffer.pixels.shape, (9, 9, 3),
+                         'Shape mismatch.')
+        self.assertIs(self.lp.grid.framebuffer, framebuffer,
+                      'Framebuffer not cached.')
+
+    def test_flush(self):
+        framebuffer = self.lp.grid.framebuffer
+        self.assertEqual(framebuffer.flush(), 64, 'Count mismatch.')
+        self.assertEqual(self.lp.shadow.state(0x51),
+                         (Constants.LightingType.RGB, 0, 0, 0),
+                         'State mismatch.')
+
+        framebuffer.pixels[0, 0] = (255, 0, 0)
+        framebuffer.pixels[7, 1] = (5, 0, 0)
+        framebuffer.lighting_types[7, 1] = Constants.LightingType.STATIC
+        self.assertEqual(framebuffer.flush(), 2, 'Count mismatch.')
+        self.assertEqual(list(self.lp.midi_out_port.sent_message),
+                         Colorspec(ColorspecFragment(Constants.LightingType.RGB,  # noqa
+                                                     0x51, 0x7f, 0x00, 0x00),
+                                   ColorspecFragment(Constants.LightingType.STATIC,  # noqa
+                                                     0x0c, 5)).data,
+                         'Message mismatch.')
+        self.assertEqual(framebuffer.flush(), 0, 'Count mismatch.')
+
+    def test_flush_after_invalidate(self):
+        framebuffer = self.lp.grid.framebuffer
+        framebuffer.flush()
+        self.lp.shadow.invalidate()
+        self.assertEqual(framebuffer.flush(), 64, 'Count mismatch.')
+
+    def test_flush_changed_leds(self):
+        framebuffer = self.lp.grid.framebuffer
+        framebuffer.flush()
+        self.lp.shadow.invalidate(0x51)
+        self.lp.grid.led('1x0').color = 5
+        self.lp.panel.led('logo').color = 5
+        self.assertEqual(framebuffer.flush(), 2, 'Count mismatch.')
+        self.assertEqual(self.lp.shadow.state(0x52),
+                         (Constants.LightingType.RGB, 0, 0, 0),
+                         'State mismatch.')
+        self.assertEqual(framebuffer.flush(), 0, 'Count mismatch.')
+
+    def test_group_flush(self):
+        lps = [create_virtual_launchpad(client_id=client_id)
+               for client_id in range(2)]
+        for lp in lps:
+            lp.open()
+        with LaunchpadGroup(lps, timeout=1, max_sysex_size=100) as group:
+            self.assertEqual(group.grid.framebuffer.flush(), 64,
+                             'Count mismatch.')
+            for lp in lps:
+                self.assertLessEqual(len(lp.midi_out_port.sent_message), 100,
+                                     'Message too large.')
+            self.assertEqual(group.grid.framebuffer.flush(), 0,
+                             'Count mismatch.')
+        for lp in lps:
+            lp.close()
+
+    def test_encode(self):
+        framebuffer = self.lp.panel.framebuffer
+        framebuffer.pixels[:] = 255
+        messages = framebuffer.encode()
+        self.assertEqual(len(messages), 1, 'Message count mismatch.')
+        self.assertEqual(len(messages[0]), 7 + 81 * 5 + 1,
+                         'Size mismatch.')
+
+        messages = framebuffer.encode(max_size=100)
+        self.assertEqual(sum(len(message) - 8 for message in messages),
+                         81 * 5,
+                         'Size mismatch.')
+        for message in messages:
+            self.assertLessEqual(len(message), 100, 'Message too large.')
+
+    def test_invalid_lighting_type(self):
+        framebuffer = self.lp.grid.framebuffer
+        framebuffer.lighting_types[0, 0] = 9
+        with self.assertRaises(ValueError):
+            framebuffer.flush()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import threading
+import unittest
+from lpminimk3.gestures import (Chord,
+                                DoubleTap,
+                                Gesture,
+                                GestureRecognizer,
+                                LongPress,
+                                Swipe)
+from lpminimk3.utils import (ButtonEvent,
+                             MidiEvent)
+from tests._vlpminimk3 import create_virtual_launchpad
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestGestureRecognizer(unittest.TestCase):
+    def setUp(self):
+        self.lp = create_virtual_launchpad()
+        self.clock = FakeClock()
+        self.recognizer = GestureRecognizer(clock=self.clock)
+
+    def press(self, name, velocity=0x7f):
+        button = next(iter(self.lp.grid.buttons(name)))
+        return self.recognizer.feed(ButtonEvent(MidiEvent([0x90,
+                                                           button.midi_value,
+                                                           velocity]),
+                                                [button]))
+
+    def release(self, name):
+        return self.press(name, 0x0)
+
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            GestureRecognizer(long_press=0)
+        with self.assertRaises(ValueError):
+            GestureRecognizer(swipe_length=1)
+
+    def test_long_press(self):
+        self.press('0x0')
+        self.assertAlmostEqual(self.recognizer.timeout(), .05,
+                               msg='Timeout mismatch.')
+        self.clock.now = .5
+        gestures = self.recognizer.poll()
+        self.assertEqual(gestures, [LongPress(self.lp.grid.buttons('0x0'), 0)],
+                         'Long press not recognized.')
+        self.assertEqual(gestures[0].type, Gesture.LONG_PRESS,
+                         'Type mismatch.')
+        self.assertIsNone(self.recognizer.timeout(),
+                          'Deadline left in heap.')
+
+        self.press('1x0')
+        self.clock.now = .6
+        self.release('1x0')
+        self.clock.now = 2
+        self.assertEqual(self.recognizer.poll(), [],
+                         'Released button held.')
+
+    def test_double_tap(self):
+        self.press('0x0')
+        self.release('0x0')
+        self.clock.now = .2
+        self.assertEqual(self.press('0x0'),
+                         [DoubleTap(self.lp.grid.buttons('0x0'), 0)],
+                         'Double tap not recognized.')
+        self.release('0x0')
+        self.clock.now = .4
+        self.assertEqual(self.press('0x0'), [],
+                         'Triple tap recognized as double tap.')
+
+    def test_chord(self):
+        self.press('0x0')
+        self.clock.now = .01
+        self.press('7x7')
+        self.clock.now = .05
+        self.assertEqual(self.recognizer.poll(),
+                         [Chord(self.lp.grid.buttons('0x0', '7x7'), 0)],
+                         'Chord not recognized.')
+
+        self.release('0x0')
+        self.release('7x7')
+        self.clock.now = 1
+        self.press('0x0')
+        self.clock.now = 1.1
+        self.press('7x7')
+        self.clock.now = 1.2
+        self.assertEqual(self.recognizer.poll(), [],
+                         'Slow presses recognized as chord.')
+
+    def test_swipe(self):
+        self.assertEqual(self.press('0x0'), [], 'Swipe too short.')
+        self.clock.now = .1
+        self.assertEqual(self.press('1x0'), [], 'Swipe too short.')
+        self.clock.now = .2
+        gestures = self.press('2x0')
+        self.assertEqual(gestures,
+                         [Swipe(Swipe.RIGHT,
+                                self.lp.grid.buttons('0x0', '1x0', '2x0'),
+                                0)],
+                         'Swipe not recognized.')
+        self.assertEqual(gestures[0].direction, Swipe.RIGHT,
+                         'Direction mismatch.')
+
+        self.clock.now = 1
+        self.press('5x5')
+        self.clock.now = 1.1
+        self.press('5x4')
+        self.clock.now = 1.2
+        self.assertEqual(self.press('6x4'), [],
+                         'Turn recognized as swipe.')
+
+
+class TestButtonGroupGestures(unittest.TestCase):
+    def setUp(self):
+        self.lp = create_virtual_launchpad()
+        self.lp.open()
+
+    def tearDown(self):
+        self.lp.close()
+
+    def test_gestures(self):
+        midi_in = self.lp.midi_in_port.midi_in_handle
+
+        def receive():
+            midi_in.receive([0x90, 0x51, 0x7f])
+
+        timer = threading.Timer(.05, receive)
+        timer.start()
+        recognizer = GestureRecognizer(long_press=.05)
+        gestures = list(self.lp.grid.buttons().gestures(recognizer,
+                                                        timeout=.3))
+        timer.join()
+        self.assertEqual(gestures,
+                         [LongPress(self.lp.grid.buttons('0x0'), 0)],
+                         'Gesture mismatch.')
+
+
+if __name__ == '__main__':
+    unittest.main()
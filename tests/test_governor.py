@@ -0,0 +1,119 @@
+import threading
+import unittest
+from lpminimk3.governor import RateGovernor
+from tests._vlpminimk3 import create_virtual_launchpad
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestRateGovernor(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def create_governor(self, **kwargs):
+        return RateGovernor(clock=self.clock,
+                            sleep=self.clock.sleep,
+                            **kwargs)
+
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            RateGovernor()
+        with self.assertRaises(ValueError):
+            RateGovernor(bytes_per_second=-1)
+        with self.assertRaises(ValueError):
+            RateGovernor(bytes_per_second=100, mode='fast')
+
+    def test_bytes_per_second(self):
+        governor = self.create_governor(bytes_per_second=1000, burst=.01)
+        governor.acquire(10)
+        self.assertEqual(self.clock.slept, [], 'Burst not allowed.')
+
+        governor.acquire(100)
+        self.assertEqual(self.clock.slept, [], 'Burst not allowed.')
+        self.assertAlmostEqual(governor.delay(100), .1,
+                               msg='Delay mismatch.')
+
+        governor.acquire(100)
+        self.assertAlmostEqual(sum(self.clock.slept), .1,
+                               msg='Rate not limited.')
+
+    def test_messages_per_second(self):
+        governor = self.create_governor(messages_per_second=10, burst=.1)
+        governor.acquire(3)
+        governor.acquire(3)
+        self.assertEqual(self.clock.slept, [], 'Burst not allowed.')
+        governor.acquire(3)
+        self.assertAlmostEqual(sum(self.clock.slept), .1,
+                               msg='Rate not limited.')
+
+    def test_sleep_unlocked(self):
+        blocked = []
+
+        def sleep(seconds):
+            thread = threading.Thread(target=governor.delay, args=(1,))
+            thread.start()
+            thread.join(1)
+            blocked.append(thread.is_alive())
+            self.clock.sleep(seconds)
+
+        governor = RateGovernor(bytes_per_second=1000,
+                                burst=.01,
+                                clock=self.clock,
+                                sleep=sleep)
+        governor.acquire(100)
+        governor.acquire(100)
+        self.assertEqual(blocked, [False], 'Lock held while sleeping.')
+        self.assertAlmostEqual(sum(self.clock.slept), .09,
+                               msg='Rate not limited.')
+
+    def test_adaptive(self):
+        governor = self.create_governor(bytes_per_second=1000,
+                                        mode=RateGovernor.ADAPTIVE,
+                                        latency_target=.002)
+        governor.record_latency(.001)
+        self.assertEqual(governor.bytes_per_second, 1000,
+                         'Rate mismatch.')
+
+        governor.record_latency(.01)
+        self.assertEqual(governor.bytes_per_second, 500,
+                         'Governor did not back off.')
+
+        governor.record_latency(.001)
+        self.assertAlmostEqual(governor.bytes_per_second, 550,
+                               msg='Governor did not recover.')
+
+    def test_token_bucket_ignores_latency(self):
+        governor = self.create_governor(bytes_per_second=1000)
+        governor.record_latency(1)
+        self.assertEqual(governor.bytes_per_second, 1000,
+                         'Rate mismatch.')
+
+    def test_launchpad_governor(self):
+        lp = create_virtual_launchpad()
+        lp.open()
+        self.assertIsNone(lp.governor(), 'Governor already set.')
+
+        governor = self.create_governor(bytes_per_second=1000)
+        lp.set_governor(governor)
+        self.assertEqual(lp.governor(), governor, 'Governor mismatch.')
+
+        lp.set_governor(None)
+        self.assertIsNone(lp.governor(), 'Governor not removed.')
+        with self.assertRaises(TypeError):
+            lp.set_governor(1000)
+        lp.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
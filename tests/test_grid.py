@@ -94,6 +94,30 @@ class TestLed(unittest.TestCase):
         self.assertTrue(self.lp.grid.led(0, 0) != another_lp.panel.led(0, 1, layout=Grid.CUSTOM),  # noqa
                         'LED mismatch.')
 
+    def test_shared_led(self):
+        self.lp.open()
+        led = self.lp.grid.led(0, 0)
+
+        self.assertIs(led, self.lp.grid.led('0x0'), 'LED not shared.')
+        self.assertIs(led, self.lp.grid.led(0), 'LED not shared.')
+        self.assertIsNot(led, self.lp.grid.led(0, 0, layout=Grid.CUSTOM),
+                         'LED shared across layouts.')
+        self.assertEqual(hash(led), hash(self.lp.panel.led(0, 1)),
+                         'Hash mismatch.')
+        custom_led = self.lp.grid.led(0, 0, layout=Grid.CUSTOM)
+        self.assertNotEqual(custom_led.midi_value, led.midi_value,
+                            'MIDI value mismatch.')
+        self.assertEqual(custom_led, led, 'LED mismatch.')
+        self.assertEqual(hash(custom_led), hash(led), 'Hash mismatch.')
+        self.assertIs(next(iter(self.lp.grid.buttons('0x0'))).led, led,
+                      'Button LED not shared.')
+        self.assertIs(next(iter(self.lp.panel.buttons('0x0'))).led,
+                      self.lp.panel.led('0x0'),
+                      'Button LED not shared.')
+        self.assertFalse(hasattr(led, '__dict__'), 'LED not slotted.')
+        with self.assertRaises(AttributeError):
+            led.foo = 0
+
     def test_set_by_index(self):
         self.lp.open()
         for color_index in range(128):
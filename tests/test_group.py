@@ -0,0 +1,127 @@
+import threading
+import unittest
+from lpminimk3 import LaunchpadGroup
+from lpminimk3.graphics import Bitmap
+from lpminimk3.graphics.art import Bitmaps
+from lpminimk3.midi_messages import Lighting
+from tests._vlpminimk3 import create_virtual_launchpad
+
+
+class TestLaunchpadGroup(unittest.TestCase):
+    def setUp(self):
+        self.lps = [create_virtual_launchpad(client_id=client_id)
+                    for client_id in range(3)]
+        for lp in self.lps:
+            lp.open()
+        self.group = LaunchpadGroup(self.lps, timeout=1)
+
+    def tearDown(self):
+        self.group.close()
+        for lp in self.lps:
+            lp.close()
+
+    def test_init(self):
+        self.assertEqual(len(self.group), 3, 'Size mismatch.')
+        self.assertEqual(self.group.launchpads, self.lps,
+                         'Launchpad mismatch.')
+
+    def test_empty(self):
+        with LaunchpadGroup([]) as group:
+            self.assertEqual(len(group), 0, 'Size mismatch.')
+            self.assertTrue(group.send_message(Lighting.static(0x51, 5)),
+                            'Message not accepted.')
+            group.grid.render(Bitmap(Bitmaps.PLUG))
+
+    def test_send_message(self):
+        self.assertTrue(self.group.send_message(Lighting.static(0x51, 5)),
+                        'Message not sent.')
+        for lp in self.lps:
+            self.assertEqual(lp.midi_out_port.sent_message,
+                             bytes([0x90, 0x51, 5]),
+                             'Message mismatch.')
+        for member in self.group.members:
+            self.assertEqual(member.write_count, 1, 'Write count mismatch.')
+            self.assertGreaterEqual(member.latency, 0, 'Invalid latency.')
+        with self.assertRaises(TypeError):
+            self.group.send_message(1)
+
+    def test_render(self):
+        self.group.grid.render(Bitmap(Bitmaps.PLUG))
+        messages = [lp.midi_out_port.sent_message for lp in self.lps]
+        self.assertIsNotNone(messages[0], 'Bitmap not rendered.')
+        self.assertEqual(messages, [messages[0]] * 3, 'Message mismatch.')
+        self.assertEqual(self.lps[2].shadow.state(0x51),
+                         self.group.shadow.state(0x51),
+                         'State mismatch.')
+
+    def test_failed_member(self):
+        self.lps[1].close()
+        self.group.send_message(Lighting.static(0x51, 5))
+        self.assertFalse(self.group.send_message(Lighting.static(0x51, 6)),
+                         'Failure not reported.')
+        self.assertEqual(self.lps[2].midi_out_port.sent_message,
+                         bytes([0x90, 0x51, 6]),
+                         'Message mismatch.')
+        self.assertEqual(self.group.members[1].error_count, 2,
+                         'Error count mismatch.')
+        self.assertIsInstance(self.group.members[1].last_error,
+                              RuntimeError,
+                              'Error mismatch.')
+        self.assertIsNone(self.group.shadow.state(0x51),
+                          'Shadow not invalidated.')
+
+    def test_slow_member(self):
+        released = threading.Event()
+        port = self.lps[0].midi_out_port
+        send_raw = port.send_raw
+
+        def blocking_send_raw(data):
+            released.wait()
+            send_raw(data)
+
+        port.send_raw = blocking_send_raw
+        group = LaunchpadGroup(self.lps, timeout=.01)
+        try:
+            self.assertFalse(group.send_message(Lighting.static(0x51, 5)),
+                             'Slow member not reported.')
+            self.assertFalse(group.send_message(Lighting.static(0x51, 6)),
+                             'Slow member not reported.')
+            self.assertEqual(group.members[0].skipped_count, 1,
+                             'Skipped count mismatch.')
+            self.assertEqual(self.lps[1].midi_out_port.sent_message,
+                             bytes([0x90, 0x51, 6]),
+                             'Message mismatch.')
+        finally:
+            released.set()
+            group.close()
+
+    def test_hung_member(self):
+        released = threading.Event()
+        port = self.lps[0].midi_out_port
+        send_raw = port.send_raw
+
+        def blocking_send_raw(data):
+            released.wait()
+            send_raw(data)
+
+        port.send_raw = blocking_send_raw
+        group = LaunchpadGroup(self.lps, timeout=None)
+        try:
+            thread = threading.Thread(target=group.send_message,
+                                      args=(Lighting.static(0x51, 5),))
+            thread.start()
+            while not group.members[0].is_busy():
+                released.wait(.001)
+            self.assertFalse(group.send_message(Lighting.static(0x51, 6)),
+                             'Hung member not reported.')
+            self.assertEqual(self.lps[1].midi_out_port.sent_message,
+                             bytes([0x90, 0x51, 6]),
+                             'Other members blocked.')
+        finally:
+            released.set()
+            thread.join()
+            group.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -62,3 +62,13 @@ class TestButtonMatch(unittest.TestCase):
 
         self.assertFalse(match.contains([0x90, 0x53, 0x7f]), 'Button matched, though it shouldn\'t.')  # noqa
         self.assertFalse(match.contains([0x90, 0x54, 0x0]), 'Button matched, though it shouldn\'t.')  # noqa
+
+    def test_contains_match_press_release(self):
+        self.lp.open()
+        match = ButtonMatch(self.lp.panel.buttons('up', '0x0'), 'press|release')  # noqa
+        self.assertTrue(match.contains([0xb0, 0x5b, 0x7f]), 'No button matched.')  # noqa
+        self.assertTrue(match.contains([0xb0, 0x5b, 0x0]), 'No button matched.')  # noqa
+        self.assertTrue(match.contains(bytes([0x90, 0x51, 0x0])), 'No button matched.')  # noqa
+
+        self.assertFalse(match.contains([0x90, 0x5b, 0x7f]), 'Button matched, though it shouldn\'t.')  # noqa
+        self.assertFalse(match.contains([0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x00, 0x7f, 0xf7]), 'Button matched, though it shouldn\'t.')  # noqa
@@ -0,0 +1,142 @@
+import unittest
+from lpminimk3.midi_messages import (Colorspec,
+                                     ColorspecBuilder,
+                                     ColorspecFragment,
+                                     Constants,
+                                     Lighting)
+from lpminimk3.utils import MidiPort
+from tests._rtmidi_dummy import MidiOut
+
+
+class RecordingMidiOut(MidiOut):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent_messages = []
+
+    def send_message(self, message):
+        self.sent_messages.append(bytes(message))
+
+
+class TestLighting(unittest.TestCase):
+    def test_encoded(self):
+        lighting = Lighting(Constants.LightingMode.FLASH, 0x51, 5)
+        self.assertEqual(lighting.encoded, bytes([0x91, 0x51, 0x05]),
+                         'Encoding mismatch.')
+        self.assertEqual(lighting.data, [0x91, 0x51, 0x05],
+                         'Data mismatch.')
+        with self.assertRaises(AttributeError):
+            lighting.color = 5
+
+    def test_static(self):
+        lighting = Lighting.static(0x51, 5)
+        self.assertEqual(lighting.data, [0x90, 0x51, 0x05],
+                         'Data mismatch.')
+        self.assertIs(lighting, Lighting.static(0x51, 5),
+                      'Static message not reused.')
+        self.assertEqual(Lighting.static(0x7f, 0x7f).data,
+                         [0x90, 0x7f, 0x7f],
+                         'Data mismatch.')
+        with self.assertRaises(ValueError):
+            Lighting.static(0x80, 5)
+        with self.assertRaises(ValueError):
+            Lighting.static(0x51, -1)
+
+
+class TestColorspec(unittest.TestCase):
+    def test_encoded(self):
+        colorspec = Colorspec(ColorspecFragment(0x00, 0x51, 5))
+        self.assertEqual(colorspec.encoded, bytes(colorspec.data),
+                         'Encoding mismatch.')
+        self.assertIs(colorspec.encoded, colorspec.encoded,
+                      'Encoding not cached.')
+
+        colorspec.append(ColorspecFragment(0x03, 0x52, 0x7f, 0x00, 0x00))
+        self.assertEqual(colorspec.encoded,
+                         bytes([0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x03,
+                                0x00, 0x51, 0x05,
+                                0x03, 0x52, 0x7f, 0x00, 0x00,
+                                0xf7]),
+                         'Encoding not updated.')
+
+    def test_encoded_changed_fragment(self):
+        fragment = ColorspecFragment(0x01, 0x51, 5)
+        colorspec = Colorspec(fragment)
+        other = Colorspec(ColorspecFragment(0x00, 0x52, 5))
+        encoded = other.encoded
+        self.assertEqual(colorspec.encoded[-4:], bytes([0x01, 0x51, 5, 0xf7]),
+                         'Encoding mismatch.')
+        fragment.append([7])
+        self.assertEqual(colorspec.encoded[-5:],
+                         bytes([0x01, 0x51, 5, 7, 0xf7]),
+                         'Encoding not updated.')
+        self.assertIs(other.encoded, encoded,
+                      'Unrelated encoding invalidated.')
+
+    def test_chunks(self):
+        colorspec = Colorspec(*[ColorspecFragment(0x03, led_index,
+                                                  0x7f, 0x00, 0x00)
+                                for led_index in range(81)])
+        self.assertEqual(len(colorspec.encoded), 413, 'Size mismatch.')
+        self.assertEqual(colorspec.chunks(), [colorspec.encoded],
+                         'Colorspec split without limit.')
+
+        chunks = colorspec.chunks(100)
+        self.assertEqual([len(chunk) for chunk in chunks],
+                         [98, 98, 98, 98, 53],
+                         'Chunk size mismatch.')
+        for chunk in chunks:
+            self.assertEqual(list(chunk[:7]), Colorspec.HEADER,
+                             'Chunk header mismatch.')
+            self.assertEqual(chunk[-1], 0xf7, 'Chunk end mismatch.')
+        self.assertEqual(b''.join(chunk[7:-1] for chunk in chunks),
+                         colorspec.encoded[7:-1],
+                         'Payload mismatch.')
+        with self.assertRaises(ValueError):
+            colorspec.chunks(12)
+        with self.assertRaises(ValueError):
+            Colorspec(ColorspecFragment(0x00, 0x51, 5)).chunks(12)
+
+    def test_port_chunks(self):
+        midi_out = RecordingMidiOut()
+        port = MidiPort('Launchpad Mini MK3 MIDI 2', 1, 5,
+                        'lpminimk3 midiout',
+                        direction=MidiPort.OUT,
+                        midi_out=midi_out)
+        colorspec = Colorspec(*[ColorspecFragment(0x00, led_index, 5)
+                                for led_index in range(81)])
+        port.send_message(colorspec)
+        self.assertEqual(midi_out.sent_messages, [colorspec.encoded],
+                         'Colorspec split without limit.')
+
+        midi_out.sent_messages.clear()
+        port.max_sysex_size = 128
+        port.send_message(colorspec)
+        self.assertEqual(len(midi_out.sent_messages), 3,
+                         'Chunk count mismatch.')
+        with self.assertRaises(ValueError):
+            port.max_sysex_size = 8
+
+
+class TestColorspecBuilder(unittest.TestCase):
+    def test_build(self):
+        builder = ColorspecBuilder(1)
+        builder.add(Constants.LightingType.STATIC, 0x51, 5)
+        builder.add(Constants.LightingType.RGB, 0x52, 0x7f, 0x00, 0x00)
+        builder.add(Constants.LightingType.FLASH, 0x53, 5, 6)
+        self.assertEqual(len(builder), 3, 'Fragment count mismatch.')
+        self.assertEqual(builder.build(),
+                         [bytes([0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x03,
+                                 0x00, 0x51, 0x05,
+                                 0x03, 0x52, 0x7f, 0x00, 0x00,
+                                 0x01, 0x53, 0x05, 0x06,
+                                 0xf7])],
+                         'Message mismatch.')
+
+    def test_build_empty(self):
+        self.assertEqual(ColorspecBuilder().build(),
+                         [bytes(Colorspec.HEADER + [0xf7])],
+                         'Message mismatch.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+import threading
+import time
+import unittest
+from lpminimk3.utils import (ButtonEvent,
+                             MidiEvent,
+                             MidiEventQueue,
+                             MidiPort,
+                             PendingRequests)
+from tests._rtmidi_dummy import MidiIn
+from tests._vlpminimk3 import create_virtual_launchpad
+
+
+class TestMidiEventQueue(unittest.TestCase):
+    def test_get(self):
+        queue = MidiEventQueue()
+        queue.put(MidiEvent([0x90, 0x51, 0x7f], 0))
+        queue.put(MidiEvent([0x90, 0x52, 0x7f], 0))
+        self.assertEqual(queue.get(match=[0x90, 0x52, 0x7f]),
+                         [0x90, 0x52, 0x7f],
+                         'Event mismatch.')
+        self.assertEqual(len(queue), 1, 'Unmatched event discarded.')
+        self.assertEqual(queue.get(timeout=0),
+                         [0x90, 0x51, 0x7f],
+                         'Event mismatch.')
+
+    def test_timeout(self):
+        queue = MidiEventQueue()
+        start = time.monotonic()
+        self.assertIsNone(queue.get(timeout=.05), 'Event received.')
+        self.assertGreaterEqual(time.monotonic() - start, .05,
+                                'Timeout not honored.')
+
+    def test_wake_up(self):
+        queue = MidiEventQueue()
+        timer = threading.Timer(.01, queue.put,
+                                [MidiEvent([0x90, 0x51, 0x7f], 0)])
+        timer.start()
+        self.assertEqual(queue.get(timeout=1),
+                         [0x90, 0x51, 0x7f],
+                         'Event mismatch.')
+        timer.join()
+
+    def test_bounded(self):
+        queue = MidiEventQueue(2)
+        for value in range(3):
+            queue.put(MidiEvent([0x90, value, 0x7f], 0))
+        self.assertEqual(len(queue), 2, 'Queue not bounded.')
+        self.assertEqual(queue.dropped_count, 1, 'Dropped count mismatch.')
+        self.assertEqual(queue.get(timeout=0),
+                         [0x90, 1, 0x7f],
+                         'Oldest event not dropped.')
+        with self.assertRaises(ValueError):
+            MidiEventQueue(0)
+
+
+class TestPendingRequests(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.requests = PendingRequests(clock=lambda: self.now)
+
+    def test_resolve(self):
+        mode = self.requests.add([0xf0, 0x00, 0x0e], timeout=1)
+        layout = self.requests.add([0xf0, 0x00, 0x00], timeout=1)
+        self.assertFalse(self.requests.resolve(MidiEvent([0x90, 0x51, 0x7f])),
+                         'Button event taken as reply.')
+        self.assertTrue(self.requests.resolve(MidiEvent([0xf0, 0x00, 0x00,
+                                                         0x7f, 0xf7])),
+                        'Reply not matched.')
+        self.assertTrue(layout.done(), 'Request not answered.')
+        self.assertFalse(mode.done(), 'Wrong request answered.')
+        self.assertEqual(layout.wait(), [0xf0, 0x00, 0x00, 0x7f, 0xf7],
+                         'Reply mismatch.')
+        self.assertEqual(len(self.requests), 1, 'Request not removed.')
+
+    def test_order(self):
+        first = self.requests.add([0xf0, 0x7e])
+        second = self.requests.add([0xf0, 0x7e])
+        self.requests.resolve(MidiEvent([0xf0, 0x7e, 0x01, 0xf7]))
+        self.requests.resolve(MidiEvent([0xf0, 0x7e, 0x02, 0xf7]))
+        self.assertEqual(first.wait(), [0xf0, 0x7e, 0x01, 0xf7],
+                         'Replies out of order.')
+        self.assertEqual(second.wait(), [0xf0, 0x7e, 0x02, 0xf7],
+                         'Replies out of order.')
+
+    def test_deadline(self):
+        expired = self.requests.add([0xf0, 0x7e], timeout=1)
+        waiting = self.requests.add([0xf0, 0x7e], timeout=3)
+        self.now = 2
+        self.requests.resolve(MidiEvent([0xf0, 0x7e, 0xf7]))
+        self.assertIsNone(expired.wait(), 'Expired request answered.')
+        self.assertTrue(waiting.done(), 'Request not answered.')
+        self.assertEqual(len(self.requests), 0, 'Request not removed.')
+        with self.assertRaises(ValueError):
+            self.requests.add([])
+
+
+class TestButtonEvent(unittest.TestCase):
+    def setUp(self):
+        self.lp = create_virtual_launchpad()
+        self.lp.open()
+
+    def tearDown(self):
+        self.lp.close()
+
+    def test_button(self):
+        buttons = list(self.lp.panel.buttons('up', '0x0'))
+        by_midi_value = {button.midi_value: button for button in buttons}
+        for candidates in (buttons, by_midi_value):
+            event = ButtonEvent(MidiEvent([0x90, 0x51, 0x7f], 0), candidates)
+            self.assertEqual(event.button.name, '0x0', 'Button mismatch.')
+            self.assertEqual(event.type, ButtonEvent.PRESS,
+                             'Event type mismatch.')
+
+            event = ButtonEvent(MidiEvent([0xb0, 0x5b, 0x00], 0), candidates)
+            self.assertEqual(event.button.name, 'up', 'Button mismatch.')
+            self.assertEqual(event.type, ButtonEvent.RELEASE,
+                             'Event type mismatch.')
+
+            event = ButtonEvent(MidiEvent([0x90, 0x52, 0x7f], 0), candidates)
+            self.assertIsNone(event.button, 'Button matched.')
+
+    def test_slots(self):
+        event = ButtonEvent(MidiEvent([0x90, 0x51, 0x7f], 0), {})
+        with self.assertRaises(AttributeError):
+            event.extra = None
+        with self.assertRaises(AttributeError):
+            event.midi_event.extra = None
+
+
+class TestMidiPort(unittest.TestCase):
+    def setUp(self):
+        self.midi_in = MidiIn()
+        self.port = MidiPort('Launchpad Mini MK3 MIDI 2', 1, 5,
+                             'lpminimk3 midiin',
+                             direction=MidiPort.IN,
+                             midi_in=self.midi_in)
+        self.port.open()
+
+    def tearDown(self):
+        self.port.close()
+
+    def test_poll_for_event(self):
+        self.assertEqual(len(self.port.event_queue), 0, 'Queue not empty.')
+        self.midi_in.receive([0x90, 0x51, 0x7f], .5)
+        event = self.port.poll_for_event(timeout=1)
+        self.assertEqual(event, [0x90, 0x51, 0x7f], 'Event mismatch.')
+        self.assertEqual(event.deltatime, .5, 'Deltatime mismatch.')
+        self.assertIsNone(self.port.poll_for_event(timeout=.01),
+                          'Event received.')
+        self.assertIsNone(self.port.poll_for_event(timeout=-1),
+                          'Event received.')
+
+    def test_event_queue(self):
+        routes = []
+        add = self.port.dispatcher.add
+
+        def add_route(*args):
+            routes.append(args)
+            add(*args)
+
+        self.port.dispatcher.add = add_route
+        self.assertIs(self.port.event_queue, self.port.event_queue,
+                      'Queue mismatch.')
+        self.assertEqual(len(routes), 1, 'Queue subscribed more than once.')
+        self.assertEqual(len(self.port.dispatcher), 1,
+                         'Queue not subscribed.')
+
+    def test_clear_event_queue(self):
+        self.assertEqual(len(self.port.event_queue), 0, 'Queue not empty.')
+        self.midi_in.receive([0x90, 0x51, 0x7f])
+        self.port.clear_event_queue()
+        self.assertIsNone(self.port.poll_for_event(timeout=.01),
+                          'Event not cleared.')
+
+    def test_subscribers(self):
+        up = self.port.subscribe(match=[0xb0, 0x5b, 0x7f])
+        everything = self.port.subscribe()
+        self.midi_in.receive([0x90, 0x51, 0x7f])
+        self.midi_in.receive([0xb0, 0x5b, 0x7f])
+        self.assertEqual(up.get(timeout=0), [0xb0, 0x5b, 0x7f],
+                         'Event mismatch.')
+        self.assertEqual(len(up), 0, 'Unmatched event delivered.')
+        self.assertEqual(len(everything), 2, 'Event not delivered.')
+        self.port.unsubscribe(up)
+        self.port.unsubscribe(everything)
+        self.assertEqual(len(self.port.dispatcher), 0,
+                         'Subscription not removed.')
+
+    def test_poll_for_event_with_match(self):
+        def receive():
+            self.midi_in.receive([0x90, 0x51, 0x0])
+            self.midi_in.receive([0xb0, 0x5b, 0x7f])
+
+        timer = threading.Timer(.05, receive)
+        timer.start()
+        self.assertEqual(self.port.poll_for_event(timeout=1,
+                                                  match=[0xb0, 0x5b, 0x7f]),
+                         [0xb0, 0x5b, 0x7f],
+                         'Event mismatch.')
+        timer.join()
+        self.assertEqual(len(self.port.dispatcher), 0,
+                         'Subscription not removed.')
+        self.assertIsNone(self.port.poll_for_event(timeout=.01),
+                          'Unmatched event kept.')
+
+    def test_listener(self):
+        self.assertEqual(len(self.port.event_queue), 0, 'Queue not empty.')
+        events = []
+        self.port.add_listener(events.append)
+        self.midi_in.receive([0x90, 0x51, 0x7f])
+        self.port.remove_listener(events.append)
+        self.midi_in.receive([0x90, 0x51, 0x00])
+        self.assertEqual(events, [[0x90, 0x51, 0x7f]], 'Event mismatch.')
+        self.assertEqual(len(self.port.event_queue), 2,
+                         'Events not queued.')
+
+    def test_pending_requests(self):
+        self.assertEqual(len(self.port.event_queue), 0, 'Queue not empty.')
+        request = self.port.pending_requests.add([0xf0, 0x7e], timeout=1)
+        self.midi_in.receive([0x90, 0x51, 0x7f])
+        self.midi_in.receive([0xf0, 0x7e, 0x00, 0xf7])
+        self.assertEqual(request.wait(), [0xf0, 0x7e, 0x00, 0xf7],
+                         'Reply mismatch.')
+        self.assertEqual(self.port.poll_for_event(timeout=0),
+                         [0x90, 0x51, 0x7f],
+                         'Button event lost.')
+        self.assertIsNone(self.port.poll_for_event(timeout=.01),
+                          'Reply left in queue.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
-from lpminimk3.utils import Interface, Mode, Layout
-from lpminimk3.midi_messages import SysExMessages
-from tests._vlpminimk3 import (DUMMY_MIDI_MESSAGE,
+from lpminimk3.utils import Interface, Mode, Layout, MidiEvent
+from lpminimk3.midi_messages import SysExMessages, Colorspec
+from lpminimk3.state import DeviceState
+from tests._vlpminimk3 import (DEVICE_INQUIRY_REPLY,
+                               DUMMY_MIDI_MESSAGE,
                                DUMMY_MIDI_EVENT,
                                CLIENT_ID,
                                create_virtual_launchpad)
@@ -68,6 +70,22 @@ class TestMk3(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.lp.send_message(DUMMY_MIDI_MESSAGE, interface='')
 
+    def test_send_raw(self):
+        self.lp.open()
+        self.lp.send_raw(bytes([0x90, 0x51, 0x05]))
+        self.assertEqual(self.lp.midi_out_port.sent_message,
+                         bytes([0x90, 0x51, 0x05]),
+                         'MIDI message mismatch.')
+        self.assertEqual(self.lp.shadow.state(0x51), (0x00, 0x05),
+                         'State mismatch.')
+
+        self.lp.send_raw(bytes([0x90, 0x51, 0x05]), interface='daw')
+        self.assertEqual(self.lp.daw_out_port.sent_message,
+                         bytes([0x90, 0x51, 0x05]),
+                         'MIDI message mismatch.')
+        with self.assertRaises(ValueError):
+            self.lp.send_raw(bytes([0x90, 0x51, 0x05]), interface='')
+
     def test_poll_for_event(self):
         self.lp.open()
         self.assertEqual(self.lp.poll_for_event(interface=Interface.MIDI),
@@ -117,22 +135,22 @@ class TestMk3(unittest.TestCase):
         self.lp.open()
 
         self.lp.mode = Mode.LIVE
-        self.assertEqual(self.lp.interface.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Modes.LIVE,
                          'Mode mismatch.')
 
         self.lp.mode = Mode.PROG
-        self.assertEqual(self.lp.interface.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Modes.PROG,
                          'Mode mismatch.')
 
         self.lp.mode = 'live'
-        self.assertEqual(self.lp.interface.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Modes.LIVE,
                          'Mode mismatch.')
 
         self.lp.mode = 'prog'
-        self.assertEqual(self.lp.interface.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Modes.PROG,
                          'Mode mismatch.')
 
@@ -145,62 +163,62 @@ class TestMk3(unittest.TestCase):
         self.lp.open()
 
         self.lp.layout = Layout.SESSION
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.SESSION,
                          'Layout mismatch.')
 
         self.lp.layout = Layout.CUSTOM_1
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.CUSTOM_1,
                          'Layout mismatch.')
 
         self.lp.layout = Layout.CUSTOM_2
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.CUSTOM_2,
                          'Layout mismatch.')
 
         self.lp.layout = Layout.CUSTOM_3
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.CUSTOM_3,
                          'Layout mismatch.')
 
         self.lp.layout = Layout.DAW_FADERS
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.DAW_FADERS,
                          'Layout mismatch.')
 
         self.lp.layout = Layout.PROG
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.PROG,
                          'Layout mismatch.')
 
         self.lp.layout = 'session'
-        self.assertEqual(self.lp.interface.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.SESSION,
                          'Layout mismatch.')
 
         self.lp.layout = 'custom_1'
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.CUSTOM_1,
                          'Layout mismatch.')
 
         self.lp.layout = 'custom_2'
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.CUSTOM_2,
                          'Layout mismatch.')
 
         self.lp.layout = 'custom_3'
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.CUSTOM_3,
                          'Layout mismatch.')
 
         self.lp.layout = 'daw_faders'
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.DAW_FADERS,
                          'Layout mismatch.')
 
         self.lp.layout = 'prog'
-        self.assertEqual(self.lp.layout.midi_event.message,
+        self.assertEqual(self.lp.returned_event.message,
                          SysExMessages.Layouts.PROG,
                          'Layout mismatch.')
 
@@ -209,12 +227,194 @@ class TestMk3(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.lp.layout = 's'
 
+    def test_mode_readback(self):
+        self.lp.open()
+        for mode, message in ((Mode.LIVE, SysExMessages.Modes.LIVE),
+                              (Mode.PROG, SysExMessages.Modes.PROG)):
+            self.lp.mode = mode
+            self.lp.state.invalidate()
+            self.assertEqual(self.lp.mode.midi_event.message, message,
+                             'Mode mismatch.')
+            self.assertEqual(self.lp.sent_message,
+                             SysExMessages.Modes.READBACK,
+                             'Mode not read back.')
+
+    def test_layout_readback(self):
+        self.lp.open()
+        for layout, message in ((Layout.SESSION,
+                                 SysExMessages.Layouts.SESSION),
+                                (Layout.CUSTOM_1,
+                                 SysExMessages.Layouts.CUSTOM_1),
+                                (Layout.PROG, SysExMessages.Layouts.PROG)):
+            self.lp.layout = layout
+            self.lp.state.invalidate()
+            self.assertEqual(self.lp.layout.midi_event.message, message,
+                             'Layout mismatch.')
+            self.assertEqual(self.lp.sent_message,
+                             SysExMessages.Layouts.READBACK,
+                             'Layout not read back.')
+
+    def test_unsolicited_settings(self):
+        self.lp.open()
+        self.lp.mode = Mode.PROG
+        self.lp.midi_in_port.midi_in_handle.receive(SysExMessages.Modes.LIVE)
+        self.assertEqual(self.lp.state.get(DeviceState.MODE),
+                         SysExMessages.Modes.LIVE,
+                         'Mode report not observed.')
+        self.lp.midi_in_port.midi_in_handle.receive(SysExMessages.Layouts.PROG)  # noqa
+        self.assertEqual(self.lp.state.get(DeviceState.LAYOUT),
+                         SysExMessages.Layouts.PROG,
+                         'Layout report not observed.')
+
+        self.lp.close()
+        self.lp.midi_in_port.midi_in_handle.receive(SysExMessages.Modes.PROG)
+        self.assertIsNone(self.lp.state.get(DeviceState.MODE),
+                          'Closed device observed report.')
+
+    def test_readback_during_input(self):
+        self.lp.open()
+        self.lp.mode = Mode.PROG
+        events = self.lp.midi_in_port.event_queue
+        self.lp.midi_in_port.midi_in_handle.receive([0x90, 0x51, 0x7f])
+        self.assertEqual(self.lp.mode.midi_event.message,
+                         SysExMessages.Modes.PROG,
+                         'Mode mismatch.')
+        self.assertEqual(events.get(timeout=0),
+                         [0x90, 0x51, 0x7f],
+                         'Button event lost.')
+
     def test_device_inquiry(self):
         self.lp.open()
         self.assertEqual(self.lp.device_inquiry().message,
-                         SysExMessages.Modes.PROG,
+                         DEVICE_INQUIRY_REPLY,
                          'Device inquiry mismatch.')
 
+    def test_batch(self):
+        self.lp.open()
+        self.lp.midi_out_port.sent_message = None
+
+        with self.lp.batch():
+            self.lp.grid.led('0x0').color = 5
+            self.lp.grid.led('1x0').color = (255, 0, 0)
+            self.lp.grid.led('0x0').color = 21
+            self.lp.panel.led('logo').reset()
+            self.assertIsNone(self.lp.midi_out_port.sent_message,
+                              'Message sent during batch.')
+
+        sent_message = self.lp.midi_out_port.sent_message
+        self.assertIsInstance(sent_message, Colorspec,
+                              'Batch not sent as Colorspec.')
+        self.assertEqual(sent_message.data,
+                         [0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x03,
+                          0x03, 0x52, 0x7f, 0x00, 0x00,
+                          0x00, 0x51, 0x15,
+                          0x00, 0x63, 0x00,
+                          0xf7],
+                         'Batch mismatch.')
+        self.assertEqual(len(self.lp.batch()), 0, 'Batch not flushed.')
+
+    def test_shadow(self):
+        self.lp.open()
+        self.lp.grid.led('0x0').color = 5
+        self.lp.grid.led('1x0').color = (255, 0, 0)
+        self.lp.send_message([0x90, 0x53, 0x09])
+        self.assertEqual(self.lp.shadow.state(0x51), (0x00, 0x05),
+                         'State mismatch.')
+        self.assertEqual(self.lp.shadow.state(0x52), (0x03, 0x7f, 0x00, 0x00),  # noqa
+                         'State mismatch.')
+        self.assertEqual(self.lp.shadow.state(0x53), (0x00, 0x09),
+                         'State mismatch.')
+
+        self.lp.grid.led('0x0').reset()
+        self.assertEqual(self.lp.shadow.state(0x51), (0x00, 0x00),
+                         'State mismatch.')
+
+        self.lp.mode = Mode.PROG
+        self.assertIsNone(self.lp.shadow.state(0x52),
+                          'Shadow not invalidated.')
+
+    def test_state(self):
+        self.lp.open()
+        self.lp.mode = Mode.PROG
+        self.lp.midi_out_port.sent_message = None
+        self.assertEqual(self.lp.mode.midi_event.message,
+                         SysExMessages.Modes.PROG,
+                         'Mode mismatch.')
+        self.assertIsNone(self.lp.midi_out_port.sent_message,
+                          'Known mode read back.')
+        self.assertIsNone(self.lp.state.get(DeviceState.LAYOUT),
+                          'Layout not invalidated.')
+
+        self.lp.refresh()
+        self.assertEqual(len(self.lp.state), 3, 'State not refreshed.')
+        self.assertEqual(self.lp.state.get(DeviceState.LAYOUT),
+                         SysExMessages.Layouts.SESSION,
+                         'Layout mismatch.')
+
+        self.lp.close()
+        self.assertEqual(len(self.lp.state), 0, 'State not invalidated.')
+
+    def test_state_ttl(self):
+        now = [0.0]
+        state = DeviceState(ttl=1, clock=lambda: now[0])
+        self.assertTrue(state.observe(MidiEvent(SysExMessages.Modes.LIVE)),
+                        'Reply not observed.')
+        self.assertFalse(state.observe(MidiEvent(DUMMY_MIDI_MESSAGE)),
+                         'Button event observed.')
+        self.assertEqual(state.get(DeviceState.MODE),
+                         SysExMessages.Modes.LIVE,
+                         'Mode mismatch.')
+        now[0] = 1
+        self.assertIsNone(state.get(DeviceState.MODE), 'Mode not expired.')
+        with self.assertRaises(ValueError):
+            state.ttl = -1
+
+    def test_batch_unchanged(self):
+        self.lp.open()
+        self.lp.grid.led('0x0').color = 5
+        self.lp.midi_out_port.sent_message = None
+
+        with self.lp.batch():
+            self.lp.grid.led('0x0').color = 5
+        self.assertIsNone(self.lp.midi_out_port.sent_message,
+                          'Unchanged LED sent.')
+
+    def test_batch_flash(self):
+        self.lp.open()
+        sent_messages = []
+        self.lp.midi_out_port.send_message = sent_messages.append
+
+        with self.lp.batch():
+            self.lp.grid.led('0x0').color = 5
+            self.lp.grid.led('0x0', mode='flash').color = 21
+        self.assertEqual([message.data for message in sent_messages],
+                         [[0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x03,
+                           0x00, 0x51, 0x05, 0xf7],
+                          [0x91, 0x51, 0x15]],
+                         'Static update dropped.')
+
+        sent_messages.clear()
+        with self.lp.batch():
+            self.lp.grid.led('0x0', mode='flash').color = 21
+            self.lp.grid.led('0x0').color = 9
+        self.assertEqual([message.data for message in sent_messages],
+                         [[0xf0, 0x00, 0x20, 0x29, 0x02, 0x0d, 0x03,
+                           0x00, 0x51, 0x09, 0xf7]],
+                         'Flash update not stopped.')
+
+    def test_nested_batch(self):
+        self.lp.open()
+        self.lp.midi_out_port.sent_message = None
+
+        with self.lp.grid.batch():
+            with self.lp.panel.batch():
+                self.lp.grid.led('0x0').color = 5
+            self.assertIsNone(self.lp.midi_out_port.sent_message,
+                              'Inner batch flushed early.')
+        self.assertIsInstance(self.lp.midi_out_port.sent_message,
+                              Colorspec,
+                              'Batch not sent as Colorspec.')
+
     def test_eq(self):
         self.lp.open()
 
@@ -1,5 +1,9 @@
 import unittest
+from unittest import mock
 from lpminimk3.graphics import Movie
+from lpminimk3.graphics._renderer import (MovieRenderer,
+                                          RawBitmapRenderer,
+                                          _FrameClock)
 from lpminimk3.graphics.art import Movies
 from lpminimk3.colors import ColorPalette
 from tests._vlpminimk3 import create_virtual_launchpad
@@ -178,6 +182,27 @@ class TestMovie(unittest.TestCase):
     def test_render(self):
         self.lp.grid.render(Movie(Movies.PING_PONG))
 
+    def test_render_late(self):
+        rendered = []
+
+        def render(renderer):
+            rendered.append(renderer._raw_bitmap)
+
+        with mock.patch.object(_FrameClock, 'is_late', return_value=True), \
+                mock.patch.object(_FrameClock, 'wait'), \
+                mock.patch.object(RawBitmapRenderer, 'render', render):
+            self.lp.grid.render(Movie(Movies.PING_PONG))
+        self.assertEqual(len(rendered), 1, 'Last frame dropped.')
+
+        raw_bitmaps = [[1] * 64, [0] * 64]
+        rendered.clear()
+        with mock.patch.object(_FrameClock, 'is_late', return_value=True), \
+                mock.patch.object(_FrameClock, 'wait'), \
+                mock.patch.object(RawBitmapRenderer, 'render', render):
+            MovieRenderer(raw_bitmaps, 60, self.lp.grid, count=2).render()
+        self.assertEqual(rendered, [raw_bitmaps[-1]] * 2,
+                         'Last frame dropped.')
+
     def test_print(self):
         Movie(Movies.PING_PONG).print()
 
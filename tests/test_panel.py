@@ -1,10 +1,14 @@
+import gc
+import threading
 import unittest
 from lpminimk3.__init__ import (ButtonFace,
                                 Panel,
                                 ButtonEvent)
+from lpminimk3.components import _MatrixTable
 from lpminimk3.colors._colors import (ColorPalette,
                                       ColorShadeStore)
 from lpminimk3.colors.web_color import WebColor
+from lpminimk3.midi_messages import Colorspec
 from lpminimk3.region import Labeled
 from tests._vlpminimk3 import (VirtualMidiEvent,
                                create_virtual_launchpad)
@@ -82,6 +86,26 @@ class TestLed(unittest.TestCase):
         self.assertTrue(self.lp.panel.led(0, 0) != another_lp.panel.led(0, 0, layout=Panel.CUSTOM),  # noqa
                         'LED mismatch.')
 
+    def test_lookup_tables(self):
+        table = _MatrixTable.get(Panel._BUTTON_NAMES,
+                                 Panel._PROG_MODE_MIDI_LAYOUT)
+        self.assertIs(table,
+                      _MatrixTable.get(Panel._BUTTON_NAMES,
+                                       Panel._PROG_MODE_MIDI_LAYOUT),
+                      'Table not shared.')
+        self.assertEqual(table.coordinate_from_name('Mute'), (8, 8),
+                         'Coordinate mismatch.')
+        self.assertEqual(table.coordinate_from_id(80), (8, 8),
+                         'Coordinate mismatch.')
+        self.assertEqual(table.lookup(8, 0), ('logo', 0x63),
+                         'Lookup mismatch.')
+        self.assertEqual(table.names_by_midi_value[0x0b], '0x7',
+                         'Name mismatch.')
+        with self.assertRaises(ValueError):
+            table.coordinate_from_name('stop_solo')
+        with self.assertRaises(ValueError):
+            table.lookup(9, 0)
+
     def test_panel_grid_led(self):
         self.lp.open()
 
@@ -196,6 +220,49 @@ class TestLed(unittest.TestCase):
             for color_index in range(128):
                 led.color = color_index
 
+    def test_led_range_bulk(self):
+        self.lp.open()
+        led_range = self.lp.panel.led_range()
+        self.assertEqual(len(led_range), 81, 'Size mismatch.')
+
+        self.lp.panel.reset()
+        message = self.lp.midi_out_port.sent_message
+        self.assertIsInstance(message, Colorspec, 'Reset not combined.')
+        self.assertEqual(len(message.fragments), 81, 'Fragment mismatch.')
+
+        self.lp.midi_out_port.sent_message = None
+        self.lp.panel.reset()
+        self.assertEqual(len(self.lp.midi_out_port.sent_message.fragments),
+                         81,
+                         'Repeated reset not sent in full.')
+
+        led_range.color = 'red'
+        self.assertEqual(len(self.lp.midi_out_port.sent_message.fragments),
+                         81,
+                         'Fragment mismatch.')
+
+        self.lp.midi_out_port.sent_message = None
+        led_range.color = 'red'
+        self.assertIsNone(self.lp.midi_out_port.sent_message,
+                          'Unchanged LEDs sent.')
+
+        led_range[:2].fill([0, (0, 0, 255)])
+        fragments = self.lp.midi_out_port.sent_message.fragments
+        self.assertEqual([fragment.led_index for fragment in fragments],
+                         [led_range[0].midi_value, led_range[1].midi_value],
+                         'LED mismatch.')
+        with self.assertRaises(ValueError):
+            led_range.fill(['red'])
+
+        led_range.set_many({self.lp.panel.led('logo'): 'green',
+                            self.lp.panel.led('up'): 'blue'})
+        self.assertEqual(len(self.lp.midi_out_port.sent_message.fragments),
+                         2,
+                         'Fragment mismatch.')
+        with self.assertRaises(ValueError):
+            self.lp.panel.led_range(region=Labeled()).set_many(
+                    {self.lp.panel.led('0x0'): 'green'})
+
     def test_led_range_labeled_region(self):
         self.lp.open()
         for led in self.lp.panel.led_range(region=Labeled()):
@@ -1772,6 +1839,94 @@ class TestButtonGroup(unittest.TestCase):
                               self.lp.panel.buttons((0, 0), (0, 0), (0, 0)).names,  # noqa
                               'Button name mismatch.')
 
+    def test_buttons_cached(self):
+        self.lp.open()
+        self.assertIs(self.lp.panel.buttons('up', 'down'),
+                      self.lp.panel.buttons('up', 'down'),
+                      'Button group not cached.')
+        self.assertIs(self.lp.panel.buttons(),
+                      self.lp.panel.buttons(),
+                      'Button group not cached.')
+        self.assertIsNot(self.lp.panel.buttons('up'),
+                         self.lp.panel.buttons('up', layout='custom'),
+                         'Layouts share button groups.')
+        self.assertIs(next(iter(self.lp.panel.buttons('up'))),
+                      next(iter(self.lp.panel.buttons('up', 'invalid'))),
+                      'Button not reused.')
+        self.assertEqual(len(list(self.lp.panel.buttons())), 81,
+                         'Button count mismatch.')
+        with self.assertRaises(ValueError):
+            self.lp.panel.buttons(1.5)
+        with self.assertRaises(ValueError):
+            self.lp.panel.buttons([0, 0])
+
+    def test_events(self):
+        self.lp.open()
+        midi_in = self.lp.midi_in_port.midi_in_handle
+        handler_count = len(self.lp.midi_in_port.dispatcher)
+
+        def receive():
+            for message in ([0xb0, 0x5b, 0x7f],
+                            [0x90, 0x52, 0x7f],
+                            [0x90, 0x51, 0x7f],
+                            [0x90, 0x51, 0x0]):
+                midi_in.receive(message)
+
+        timer = threading.Timer(.05, receive)
+        timer.start()
+        events = self.lp.panel.buttons('up', '0x0').events(timeout=.5)
+        self.assertEqual([(event.button.name, event.type)
+                          for event in events],
+                         [('up', ButtonEvent.PRESS),
+                          ('0x0', ButtonEvent.PRESS),
+                          ('0x0', ButtonEvent.RELEASE)],
+                         'Event mismatch.')
+        timer.join()
+        self.assertEqual(len(self.lp.midi_in_port.dispatcher), handler_count,
+                         'Subscription not removed.')
+
+        with self.assertRaises(ValueError):
+            self.lp.panel.buttons('up').events(type='hold')
+
+        events = self.lp.panel.buttons('up').events(timeout=.01)
+        midi_in.receive([0xb0, 0x5b, 0x7f])
+        self.assertEqual(next(events).button.name, 'up',
+                         'Event before iteration missed.')
+        del events
+        gc.collect()
+        self.assertEqual(len(self.lp.midi_in_port.dispatcher), handler_count,
+                         'Subscription not removed.')
+
+        self.lp.panel.buttons('up').events()
+        gc.collect()
+        self.assertEqual(len(self.lp.midi_in_port.dispatcher), handler_count,
+                         'Subscription not removed.')
+
+    def test_pressed(self):
+        self.lp.open()
+        midi_in = self.lp.midi_in_port.midi_in_handle
+        midi_in.receive([0xb0, 0x5b, 0x7f])
+        midi_in.receive([0x90, 0x51, 0x7f])
+        self.assertTrue(self.lp.panel.is_pressed('up'), 'Button not pressed.')
+        self.assertTrue(self.lp.panel.buttons('up', '0x0').is_pressed(),
+                        'Chord not pressed.')
+        self.assertFalse(self.lp.panel.is_pressed('up', 'down'),
+                         'Chord pressed.')
+        self.assertTrue(self.lp.panel.buttons('up', 'down').any_pressed(),
+                        'No button pressed.')
+        self.assertEqual(sorted(button.name
+                                for button in self.lp.panel.pressed_buttons()),
+                         ['0x0', 'up'],
+                         'Pressed buttons mismatch.')
+
+        midi_in.receive([0x90, 0x51, 0x0])
+        self.assertFalse(self.lp.panel.is_pressed('0x0'),
+                         'Release not tracked.')
+        self.assertFalse(self.lp.panel.is_pressed(), 'All buttons pressed.')
+
+        self.lp.close()
+        self.assertEqual(len(self.lp.pressed), 0, 'State not cleared.')
+
     def test_prog_layout_poll_event(self):
         self.lp.open()
         self.lp.will_return(midi_event=VirtualMidiEvent([0xb0, 0x5b, 0x7f]))  # noqa
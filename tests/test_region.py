@@ -0,0 +1,102 @@
+import unittest
+from lpminimk3.region import (Custom,
+                              Labeled,
+                              Mask)
+from tests._vlpminimk3 import create_virtual_launchpad
+
+
+class TestMask(unittest.TestCase):
+    def test_init(self):
+        self.assertEqual(len(Mask()), 0, 'Mask not empty.')
+        self.assertEqual(len(Mask.full()), 81, 'Size mismatch.')
+        with self.assertRaises(ValueError):
+            Mask(1 << 81)
+        with self.assertRaises(ValueError):
+            Mask.from_names(['foo'])
+
+    def test_names(self):
+        mask = Mask.from_names(['logo', '0x0', 'stop'])
+        self.assertListEqual(mask.button_names,
+                             ['logo', '0x0', 'stop_solo_mute'],
+                             'Name mismatch.')
+        self.assertEqual(mask.coordinates, ((8, 0), (0, 1), (8, 8)),
+                         'Coordinate mismatch.')
+        self.assertEqual(mask.midi_values, (0x63, 0x51, 0x13),
+                         'MIDI value mismatch.')
+
+    def test_rect(self):
+        grid = Mask.rect(0, 1, 8, 8)
+        self.assertEqual(len(grid), 64, 'Size mismatch.')
+        self.assertEqual(grid.button_names[0], '0x0', 'Name mismatch.')
+        self.assertEqual(grid.button_names[-1], '7x7', 'Name mismatch.')
+        self.assertEqual(Mask.rect(-1, -1, 2, 2).coordinates, ((0, 0),),
+                         'Rectangle not clipped.')
+        self.assertListEqual(Mask.row(0).button_names,
+                             Labeled().button_names[:9],
+                             'Row mismatch.')
+        self.assertEqual(len(Mask.column(8)), 9, 'Size mismatch.')
+
+    def test_algebra(self):
+        row = Mask.row(1)
+        column = Mask.column(0)
+        self.assertEqual((row & column).button_names, ['0x0'],
+                         'Intersection mismatch.')
+        self.assertEqual(len(row | column), 17, 'Union mismatch.')
+        self.assertEqual(len(row - column), 8, 'Difference mismatch.')
+        self.assertEqual(len(row ^ column), 16,
+                         'Symmetric difference mismatch.')
+        self.assertEqual(~Mask(), Mask.full(), 'Complement mismatch.')
+        self.assertEqual(Labeled() | Mask(), Mask.from_region(Labeled()),
+                         'Union with region mismatch.')
+        self.assertEqual((row & Custom(['0x0', '1x0'])).button_names,
+                         ['0x0', '1x0'],
+                         'Intersection with region mismatch.')
+
+    def test_contains(self):
+        lp = create_virtual_launchpad()
+        mask = Mask.row(1)
+        self.assertIn('0x0', mask, 'Name not in mask.')
+        self.assertIn((0, 1), mask, 'Position not in mask.')
+        self.assertIn(lp.panel.led('1x0'), mask, 'LED not in mask.')
+        self.assertNotIn('up', mask, 'Name in mask.')
+        self.assertNotIn((9, 1), mask, 'Position in mask.')
+        self.assertNotIn('foo', mask, 'Name in mask.')
+        self.assertNotIn((0, 1, 2), mask, 'Position in mask.')
+        self.assertNotIn((), mask, 'Position in mask.')
+
+    def test_slots(self):
+        for region in (Mask.row(1), Labeled(), Custom(['0x0'])):
+            self.assertFalse(hasattr(region, '__dict__'),
+                             'Region not slotted.')
+
+    def test_rotated(self):
+        up = Mask.from_names(['up'])
+        self.assertEqual(up.rotated(90).button_names, ['logo'],
+                         'Rotation mismatch.')
+        self.assertEqual(up.rotated(-90).button_names, ['0x7'],
+                         'Rotation mismatch.')
+        self.assertEqual(up.rotated(180).button_names, ['stop_solo_mute'],
+                         'Rotation mismatch.')
+        self.assertEqual(Mask.row(0).rotated(90), Mask.column(8),
+                         'Rotation mismatch.')
+        with self.assertRaises(ValueError):
+            up.rotated(45)
+
+    def test_led_range(self):
+        lp = create_virtual_launchpad()
+        lp.open()
+        mask = Mask.rect(0, 1, 8, 8) - Mask.rect(1, 2, 6, 6)
+        leds = lp.panel.led_range(region=mask)
+        self.assertEqual([led.name for led in leds], mask.button_names,
+                         'LED mismatch.')
+        self.assertEqual([led.midi_value for led in leds],
+                         list(mask.midi_values),
+                         'MIDI value mismatch.')
+        leds.color = 'red'
+        self.assertEqual(len(lp.midi_out_port.sent_message.fragments), 28,
+                         'Fragment mismatch.')
+        lp.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
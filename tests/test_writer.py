@@ -0,0 +1,162 @@
+import queue
+import threading
+import unittest
+from lpminimk3.midi_messages import (Colorspec,
+                                     ColorspecFragment,
+                                     Constants,
+                                     Lighting,
+                                     SysExMessages)
+from lpminimk3.writer import MidiWriter
+from tests._vlpminimk3 import create_virtual_launchpad
+
+
+class BlockingSink:
+    def __init__(self):
+        self.messages = []
+        self.writing = threading.Event()
+        self.released = threading.Event()
+
+    def __call__(self, message):
+        self.writing.set()
+        self.released.wait()
+        self.messages.append(message.data
+                             if hasattr(message, 'data')
+                             else message)
+
+
+class TestMidiWriter(unittest.TestCase):
+    def setUp(self):
+        self.sink = BlockingSink()
+
+    def tearDown(self):
+        self.sink.released.set()
+
+    def test_write(self):
+        self.sink.released.set()
+        writer = MidiWriter(self.sink)
+        writer.start()
+        writer.put(SysExMessages.Modes.PROG)
+        self.assertTrue(writer.flush(timeout=1), 'Writer not flushed.')
+        writer.stop()
+        self.assertEqual(self.sink.messages,
+                         [SysExMessages.Modes.PROG],
+                         'Message mismatch.')
+        self.assertFalse(writer.is_running(), 'Writer still running.')
+        with self.assertRaises(RuntimeError):
+            writer.put(SysExMessages.Modes.PROG)
+
+    def test_coalesce(self):
+        writer = MidiWriter(self.sink)
+        writer.start()
+        writer.put(SysExMessages.Modes.PROG)
+        self.assertTrue(self.sink.writing.wait(1), 'Writer not writing.')
+
+        writer.put(Lighting(Constants.LightingMode.STATIC, 0x51, 5))
+        writer.put(Lighting(Constants.LightingMode.STATIC, 0x51, 6))
+        writer.put(Colorspec(ColorspecFragment(Constants.LightingType.RGB,
+                                               0x52, 0x7f, 0x00, 0x00)))
+        self.assertEqual(writer.depth, 2, 'Depth mismatch.')
+        self.assertEqual(writer.coalesced_count, 1, 'Coalesced mismatch.')
+
+        self.sink.released.set()
+        writer.stop()
+        self.assertEqual(self.sink.messages,
+                         [SysExMessages.Modes.PROG,
+                          Colorspec(ColorspecFragment(0x00, 0x51, 6),
+                                    ColorspecFragment(0x03, 0x52,
+                                                      0x7f, 0x00, 0x00)).data],  # noqa
+                         'Message mismatch.')
+        self.assertEqual(writer.written_count, 2, 'Written mismatch.')
+        self.assertEqual(writer.max_depth, 2, 'Max depth mismatch.')
+
+    def test_order(self):
+        writer = MidiWriter(self.sink)
+        writer.start()
+        writer.put(SysExMessages.Modes.PROG)
+        self.assertTrue(self.sink.writing.wait(1), 'Writer not writing.')
+
+        writer.put(Lighting(Constants.LightingMode.STATIC, 0x51, 5))
+        writer.put(SysExMessages.Layouts.PROG)
+        writer.put(Lighting(Constants.LightingMode.STATIC, 0x51, 6))
+        self.assertEqual(writer.coalesced_count, 0, 'Coalesced mismatch.')
+
+        self.sink.released.set()
+        writer.stop()
+        self.assertEqual(self.sink.messages,
+                         [SysExMessages.Modes.PROG,
+                          Colorspec(ColorspecFragment(0x00, 0x51, 5)).data,
+                          SysExMessages.Layouts.PROG,
+                          Colorspec(ColorspecFragment(0x00, 0x51, 6)).data],
+                         'Message mismatch.')
+
+    def test_queue_full(self):
+        writer = MidiWriter(self.sink, queue_size=1)
+        writer.start()
+        writer.put(SysExMessages.Modes.PROG)
+        self.assertTrue(self.sink.writing.wait(1), 'Writer not writing.')
+
+        writer.put(Lighting(Constants.LightingMode.STATIC, 0x51, 5))
+        writer.put(Lighting(Constants.LightingMode.STATIC, 0x51, 6))
+        with self.assertRaises(queue.Full):
+            writer.put(Lighting(Constants.LightingMode.STATIC, 0x52, 5),
+                       timeout=.01)
+        self.sink.released.set()
+        writer.stop()
+
+    def test_flash(self):
+        writer = MidiWriter(self.sink)
+        writer.start()
+        writer.put(SysExMessages.Modes.PROG)
+        self.assertTrue(self.sink.writing.wait(1), 'Writer not writing.')
+
+        writer.put(Lighting(Constants.LightingMode.STATIC, 0x51, 5))
+        writer.put(Lighting(Constants.LightingMode.FLASH, 0x51, 21))
+        self.assertEqual(writer.depth, 2, 'Static update replaced.')
+
+        self.sink.released.set()
+        writer.stop()
+        self.assertEqual(self.sink.messages,
+                         [SysExMessages.Modes.PROG,
+                          Colorspec(ColorspecFragment(0x00, 0x51, 5)).data,
+                          [0x91, 0x51, 0x15]],
+                         'Message mismatch.')
+
+    def test_queue_full_colorspec(self):
+        writer = MidiWriter(self.sink, queue_size=2)
+        writer.start()
+        writer.put(SysExMessages.Modes.PROG)
+        self.assertTrue(self.sink.writing.wait(1), 'Writer not writing.')
+
+        writer.put(Lighting(Constants.LightingMode.STATIC, 0x51, 5))
+        with self.assertRaises(queue.Full):
+            writer.put(Colorspec(ColorspecFragment(0x00, 0x52, 5),
+                                 ColorspecFragment(0x00, 0x53, 5)),
+                       timeout=.01)
+        self.assertEqual(writer.depth, 1, 'Message partially queued.')
+
+        writer.put(Colorspec(ColorspecFragment(0x00, 0x51, 6),
+                             ColorspecFragment(0x00, 0x52, 6)),
+                   timeout=.01)
+        self.assertEqual(writer.depth, 2, 'Depth mismatch.')
+        self.sink.released.set()
+        writer.stop()
+
+    def test_launchpad_writer(self):
+        lp = create_virtual_launchpad()
+        lp.open()
+        self.assertIsNone(lp.writer(), 'Writer already running.')
+
+        writer = lp.start_writer(queue_size=8)
+        self.assertTrue(writer.is_running(), 'Writer not running.')
+        self.assertEqual(lp.writer(), writer, 'Writer mismatch.')
+        self.assertEqual(writer.queue_size, 8, 'Queue size mismatch.')
+
+        lp.close()
+        self.assertFalse(writer.is_running(), 'Writer still running.')
+        self.assertIsNone(lp.writer(), 'Writer not removed.')
+        with self.assertRaises(ValueError):
+            lp.start_writer(interface='')
+
+
+if __name__ == '__main__':
+    unittest.main()